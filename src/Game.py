@@ -4,10 +4,19 @@ import os
 
 from src.logic.ProgressTracker import ProgressTracker
 from src.config import *
-from src.Nonogram import Nonogram
-from src.utils.image_converter import image_to_nonogram
+from src.Nonogram import Nonogram, PUZZLE_SOLVED
+from src.utils.image_converter import image_to_nonogram, BLACK_THRESHOLD, SEARCH_THRESHOLDS
+from src.utils.conversion import ConversionJob, ConversionCancelled
+from src.utils.conversion_cache import ConversionCache, conversion_key, image_content_hash, is_custom_level
 from src.utils.timer import Timer
+from src.utils.save_format import encode_save, read_save, write_save, get_save_path, list_slots
+from src.utils.level_pack import LevelPack
+from src.utils.level_index import load_level_index
+from src.utils.font_cache import NEWSWEEKLY_FONT, render_text
+from src.utils.frame_profiler import FrameProfiler
+from src.utils.render_scheduler import RenderScheduler
 from src.logic.SoundManager import SoundManager
+from src.logic.LevelLoader import LevelLoader
 from src.ui.GameScreen import GameScreen
 from src.ui.LevelSelectScreen import LevelSelectScreen
 
@@ -25,22 +34,43 @@ class Game:
         progress_tracker (ProgressTracker): Rastreador de progreso del juego.
         gamepad_handler (GamepadHandler): Manejador del gamepad.
         sound_manager (SoundManager): Manejador de sonidos del juego.
-        levels (dict): Diccionario con los niveles del juego.
+        levels (dict): Metadatos de cada nivel del juego, por clave (vacíos si no hay índice).
+        level_pack (LevelPack): Paquete de niveles compilado, o None si se usan los archivos JSON.
+        level_loader (LevelLoader): Preparador de niveles en segundo plano, o None si está desactivado.
         game_screen (GameScreen): Pantalla del juego.
         level_select_screen (LevelSelectScreen): Pantalla de selección de nivel.
         nonogram (Nonogram): Instancia del Nonogram actual.
         victory_music_played (bool): Indica si la música de victoria ha sido reproducida.
+        needs_full_redraw (bool): Indica si el próximo fotograma debe dibujarse completo.
+        conversion (ConversionJob): Conversión de una imagen personalizada en curso, o None.
+        conversion_level_key (str): Clave del Nonogram personalizado que se está convirtiendo.
+        conversion_cache (ConversionCache): Caché en disco de las imágenes ya convertidas.
+        profiler (FrameProfiler): Perfilador de las fases de cada fotograma.
+        render_scheduler (RenderScheduler): Decide cuánto esperar a los eventos entre fotogramas.
     """
 
-    def __init__(self, screen, joystick):
+    def __init__(self, screen, joystick, progress_tracker=None, conversion_cache=None):
+        """
+        Inicializa una instancia de la clase Game.
+
+        Args:
+            screen (pygame.Surface): Superficie de la pantalla del juego.
+            joystick (pygame.joystick.Joystick): Joystick conectado, o None.
+            progress_tracker (ProgressTracker, optional): Progreso del jugador. Por defecto se usa el de PROGRESS_PATH.
+            conversion_cache (ConversionCache, optional): Caché de imágenes convertidas. Por defecto se usa el de CUSTOM_NONOGRAMS_PATH.
+        """
         self.screen = screen
         self.clock = pygame.time.Clock()
         self.timer = Timer()
         self.current_level = None
         self.current_screen = 'menu'
-        self.progress_tracker = ProgressTracker()
+        self.progress_tracker = progress_tracker if progress_tracker is not None else ProgressTracker()
         self.sound_manager = SoundManager()
+        self.level_pack = None
         self.levels = self.load_levels()
+        self.level_loader = None
+        if LEVEL_PREFETCH:
+            self.level_loader = LevelLoader(self.load_level_data, screen.get_size(), LEVEL_CACHE_SIZE)
         self.game_screen = None
         self.joystick = joystick
         self.joystick_connected = False
@@ -48,22 +78,77 @@ class Game:
             self.joystick_connected = True
         self.level_select_screen = None
         self.initialize_screens()
+        if self.level_loader is not None:
+            self.level_loader.view_area = self.game_screen.play_area
         try:
             _ = self.nonogram
         except AttributeError:
             self.nonogram = None
         self.victory_music_played = False
+        self.needs_full_redraw = True
+        self.conversion = None
+        self.conversion_level_key = None
+        self.conversion_cache = conversion_cache
+        if self.conversion_cache is None:
+            self.conversion_cache = ConversionCache(CUSTOM_NONOGRAMS_PATH, CUSTOM_CACHE_MAX_BYTES)
+        self.profiler = FrameProfiler(PROFILER_ENABLED, dump_dir=PROFILE_DUMP_PATH)
+        self.render_scheduler = RenderScheduler()
+        if os.environ.get(PROFILE_ENV_VAR):
+            self.profiler.start_capture()
 
     def load_levels(self):
         """
-        Carga los niveles del juego desde un archivo JSON.
+        Carga la lista de niveles del juego sin leer el contenido de los niveles.
+
+        Las claves y los metadatos se leen del índice de niveles. Si no existe, las claves se
+        toman del paquete compilado o de nonogram_levels.json y los metadatos quedan vacíos.
 
         Returns:
-            dict: Diccionario con los niveles del juego.
-        """
+            dict: Metadatos de cada nivel, por clave.
+        """
+        if os.path.exists(LEVEL_PACK_PATH):
+            try:
+                self.level_pack = LevelPack(LEVEL_PACK_PATH)
+            except (OSError, ValueError) as e:
+                print(f"Error: No se pudo abrir el paquete de niveles: {str(e)}")
+                self.level_pack = None
+
+        if os.path.exists(LEVEL_INDEX_PATH):
+            try:
+                return load_level_index(LEVEL_INDEX_PATH)
+            except (OSError, ValueError) as e:
+                print(f"Error: No se pudo leer el índice de niveles: {str(e)}")
+
+        if self.level_pack is not None:
+            return {level_key: {} for level_key in self.level_pack.keys()}
         levels_path = os.path.join("data/levels/nonogram_levels.json")
         with open(levels_path, "r") as f:
-            return json.load(f)
+            return {level_key: {} for level_key in json.load(f)}
+
+    def get_level_difficulty(self, level_key):
+        """
+        Obtiene la dificultad de un nivel según el índice de niveles.
+
+        Si el nivel no está en el índice, la dificultad se deduce del número del nivel.
+
+        Args:
+            level_key (str): Clave del nivel.
+
+        Returns:
+            str: Dificultad del nivel ("easy", "medium" o "hard"), o "custom" para los Nonogramas personalizados.
+        """
+        if is_custom_level(level_key):
+            return "custom"
+        metadata = self.levels.get(level_key) or {}
+        if "difficulty" in metadata:
+            return metadata["difficulty"]
+        s = int(''.join(x for x in level_key if x.isdigit()) or 0)
+        if s <= 20:
+            return "easy"
+        elif s <= 40:
+            return "medium"
+        else:
+            return "hard"
 
     def initialize_screens(self):
         """
@@ -74,7 +159,7 @@ class Game:
 
     def load_level_data(self, level_key):
         """
-        Carga los datos de un nivel específico desde un archivo JSON.
+        Carga los datos de un nivel específico desde el paquete compilado o desde un archivo JSON.
 
         Args:
             level_key (str): Clave del nivel a cargar.
@@ -82,6 +167,9 @@ class Game:
         Returns:
             dict: Diccionario con los datos del nivel, o None si ocurre un error.
         """
+        if self.level_pack is not None and level_key in self.level_pack:
+            return self.level_pack.load(level_key)
+
         file_path = os.path.join("data", "levels", f"{level_key}.json")
         abs_file_path = os.path.abspath(file_path)
 
@@ -112,10 +200,27 @@ class Game:
             custom (str): Ruta a una imagen personalizada para crear un Nonogram.
         """
         if custom is not None:
-            a = image_to_nonogram(custom)
+            params = self.get_conversion_params(search=False)
+            custom_key = conversion_key(image_content_hash(custom), params)
+            cached = self.conversion_cache.get(custom_key)
+            if cached is not None:
+                a = [cached["grid"], cached["row_clues"], cached["col_clues"]]
+            else:
+                a = image_to_nonogram(custom)
+                try:
+                    self.conversion_cache.put(custom_key, {"grid": a[0], "row_clues": a[1], "col_clues": a[2], "params": params})
+                except OSError as e:
+                    print(f"Error: No se pudo guardar la imagen convertida en el caché: {str(e)}")
             self.nonogram = Nonogram(a[0], a[1], a[2])
-            self.current_level = "custom"
+            self.nonogram.subscribe(PUZZLE_SOLVED, self.on_puzzle_solved)
+            self.current_level = custom_key
         else:
+            nonogram = self.level_loader.take(level_key) if self.level_loader is not None else None
+            if nonogram is not None:
+                self.nonogram = nonogram
+                self.nonogram.subscribe(PUZZLE_SOLVED, self.on_puzzle_solved)
+                self.current_level = level_key
+                return
             level_data = self.load_level_data(level_key)
             if level_data and all(key in level_data for key in ["grid", "row_clues", "col_clues"]):
                 print(f"Inicializando Nonograma del nivel {level_key}")
@@ -123,6 +228,7 @@ class Game:
                 print(f"Pistas por columna: {level_data['col_clues']}")
                 try:
                     self.nonogram = Nonogram(level_data['grid'],level_data['row_clues'],level_data['col_clues'])
+                    self.nonogram.subscribe(PUZZLE_SOLVED, self.on_puzzle_solved)
                     print(f"Nonograma de nivel {level_key} inicializado con éxito.")
                     self.current_level = level_key
                 except Exception as e:
@@ -148,6 +254,41 @@ class Game:
         else:
             self.timer.stop()
             self.sound_manager.stop_music()
+        if screen_name == 'level_select':
+            self.prefetch_levels()
+
+    def get_next_levels(self, after=None, count=2):
+        """
+        Obtiene los próximos niveles sin completar.
+
+        Args:
+            after (str, optional): Clave del nivel desde el que se busca. Por defecto se busca desde el primero.
+            count (int, optional): Cantidad máxima de niveles. Por defecto es 2.
+
+        Returns:
+            list: Claves de los niveles, en orden.
+        """
+        keys = list(self.levels.keys())
+        start = keys.index(after) + 1 if after in self.levels else 0
+        next_levels = []
+        for level_key in keys[start:]:
+            if len(next_levels) >= count:
+                break
+            if not self.progress_tracker.is_level_complete(None, level_key):
+                next_levels.append(level_key)
+        return next_levels
+
+    def prefetch_levels(self, hovered=None):
+        """
+        Pide preparar en segundo plano el nivel bajo el cursor y los próximos niveles sin completar.
+
+        Args:
+            hovered (str, optional): Clave del nivel bajo el cursor en la selección de nivel.
+        """
+        if self.level_loader is None:
+            return
+        after = hovered or (self.current_level if self.current_level in self.levels else None)
+        self.level_loader.prefetch([hovered] + self.get_next_levels(after))
 
     def start_new_game(self):
         """
@@ -166,9 +307,107 @@ class Game:
         print(f"Game: Starting level {level_key}")
         self.def_nono(level_key, custom)
         self.set_screen('game')
+        if custom is None:
+            self.prefetch_levels()
         self.victory_music_played = False
         print(f"Game: Current screen set to 'game'")
 
+    def start_custom_level(self, nonogram_data, level_key="custom"):
+        """
+        Inicia un Nonogram personalizado a partir de una imagen ya convertida.
+
+        Args:
+            nonogram_data (list): Cuadrícula, pistas de las filas y pistas de las columnas.
+            level_key (str, optional): Clave estable del Nonogram personalizado. Por defecto es "custom".
+        """
+        self.nonogram = Nonogram(nonogram_data[0], nonogram_data[1], nonogram_data[2])
+        self.nonogram.subscribe(PUZZLE_SOLVED, self.on_puzzle_solved)
+        self.current_level = level_key
+        self.set_screen('game')
+        self.victory_music_played = False
+
+    def get_conversion_params(self, search=True):
+        """
+        Obtiene los parámetros de conversión de imágenes, que forman parte de la clave del caché.
+
+        Args:
+            search (bool, optional): Indica si la conversión busca la versión con solución única. Por defecto es True.
+
+        Returns:
+            dict: Parámetros de la conversión.
+        """
+        if search and CONVERSION_SIZES:
+            return {"mode": "search", "sizes": list(CONVERSION_SIZES), "num_colors": 2,
+                    "thresholds": list(SEARCH_THRESHOLDS), "draft": True}
+        return {"mode": "direct", "size": 20, "num_colors": 2, "threshold": BLACK_THRESHOLD, "draft": True}
+
+    def start_custom_conversion(self, image_path):
+        """
+        Empieza a convertir una imagen personalizada en un proceso aparte.
+
+        Si la imagen ya se convirtió antes con los mismos parámetros, el nivel empieza de inmediato
+        con el resultado guardado en el caché.
+
+        Args:
+            image_path (str): Ruta a la imagen.
+        """
+        if self.conversion is not None:
+            self.conversion.cancel()
+            self.conversion = None
+        params = self.get_conversion_params()
+        level_key = conversion_key(image_content_hash(image_path), params)
+        cached = self.conversion_cache.get(level_key)
+        if cached is not None:
+            self.start_custom_level([cached["grid"], cached["row_clues"], cached["col_clues"]], level_key)
+            return
+        self.conversion_level_key = level_key
+        self.conversion = ConversionJob(image_path, sizes=CONVERSION_SIZES)
+
+    def poll_conversion(self):
+        """
+        Revisa la conversión en curso sin bloquearse e inicia el nivel cuando termina.
+
+        Returns:
+            bool: True si hay una conversión en curso.
+        """
+        if self.conversion is None:
+            return False
+        if not self.conversion.poll():
+            return True
+        conversion = self.conversion
+        self.conversion = None
+        self.invalidate()
+        try:
+            nonogram_data = conversion.result()
+            entry = {"grid": nonogram_data[0], "row_clues": nonogram_data[1], "col_clues": nonogram_data[2],
+                     "params": self.get_conversion_params()}
+            if conversion.report is not None:
+                best = conversion.report["best"]
+                entry["chosen"] = {"size": best["size"], "method": best["method"], "status": best["status"]}
+                print(f"Conversión elegida: {best['size']}x{best['size']} {best['method']} ({best['status']})")
+                for rejected in conversion.report["rejected"]:
+                    print(f"  Descartado {rejected['size']}x{rejected['size']} {rejected['method']}: {rejected['reason']}")
+            try:
+                self.conversion_cache.put(self.conversion_level_key, entry)
+            except OSError as e:
+                print(f"Error: No se pudo guardar la imagen convertida en el caché: {str(e)}")
+            self.start_custom_level(nonogram_data, self.conversion_level_key)
+        except ConversionCancelled:
+            pass
+        except Exception as e:
+            print(f"Error convirtiendo la imagen {conversion.image_path}: {str(e)}")
+            self.show_message("No se pudo convertir la imagen")
+        return False
+
+    def cancel_conversion(self):
+        """
+        Cancela la conversión en curso, si hay una.
+        """
+        if self.conversion is not None:
+            self.conversion.cancel()
+            self.conversion = None
+            self.invalidate()
+
     def get_hint(self):
         """
         Proporciona una pista al jugador.
@@ -192,38 +431,86 @@ class Game:
         if self.nonogram:
             self.nonogram.redo()
 
-    def save_game(self):
+    def get_save_path(self, slot=DEFAULT_SAVE_SLOT):
         """
-        Guarda el estado actual del juego en un archivo JSON.
+        Obtiene la ruta del archivo de una ranura de guardado del nivel actual.
+
+        Args:
+            slot (str, optional): Nombre de la ranura. Por defecto es DEFAULT_SAVE_SLOT.
+
+        Returns:
+            str: Ruta del archivo.
         """
-        level_key = f"level{self.current_level}"
-        filename=f"data/saved_games/{level_key}.json"
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        save_data = {
-            "player_grid": self.nonogram.player_grid,
-            "timer": self.timer.get_time()
-        }
-        with open(filename, 'w') as f:
-            json.dump(save_data, f, indent=2)
+        return get_save_path(SAVE_GAME_PATH, self.current_level, slot)
 
-    def load_game(self):
+    def get_save_slots(self):
         """
-        Carga el estado guardado del juego desde un archivo JSON.
+        Obtiene los nombres de las ranuras guardadas del nivel actual.
+
+        Returns:
+            list: Nombres de las ranuras, ordenados.
+        """
+        return list_slots(SAVE_GAME_PATH, self.current_level)
+
+    def save_game(self, slot=DEFAULT_SAVE_SLOT):
+        """
+        Guarda el estado actual del juego (celdas, tiempo e historial) en una ranura del nivel actual.
+
+        Args:
+            slot (str, optional): Nombre de la ranura. Por defecto es DEFAULT_SAVE_SLOT.
         """
-        level_key = f"level{self.current_level}"
-        filename = f"data/saved_games/{level_key}.json"
+        if not self.nonogram:
+            return
+        data = encode_save(self.nonogram.get_player_grid(), self.timer.get_time(), self.nonogram.undo_log.get_state())
+        write_save(self.get_save_path(slot), data)
+
+    def load_game(self, slot=DEFAULT_SAVE_SLOT):
+        """
+        Carga el estado guardado del juego desde una ranura del nivel actual.
+
+        Si la ranura no existe se intenta leer la partida en el formato JSON anterior.
+
+        Args:
+            slot (str, optional): Nombre de la ranura. Por defecto es DEFAULT_SAVE_SLOT.
+        """
+        if not self.nonogram:
+            return
         try:
-            if os.path.exists(filename):
-                with open(filename, 'r') as f:
-                    save_data = json.load(f)
-                    self.nonogram.player_grid = save_data["player_grid"]
-                    self.timer.set_time(save_data.get("timer", 0))
-                    self.draw()
-                    self.update()
-            else:
-                self.show_message("No hay juego guardado para este nivel.")
+            save_data = read_save(self.get_save_path(slot))
         except FileNotFoundError:
+            save_data = self.load_legacy_save() if slot == DEFAULT_SAVE_SLOT else None
+        except ValueError as e:
+            print(f"Error cargando la partida guardada: {str(e)}")
+            save_data = None
+        player_grid = save_data["player_grid"] if save_data is not None else None
+        if (player_grid is None or len(player_grid) != self.nonogram.rows
+                or any(len(row) != self.nonogram.cols for row in player_grid)):
             self.show_message("No hay juego guardado para este nivel.")
+            return
+
+        # El tiempo se restaura antes que la cuadrícula: si la partida ya estaba resuelta, PUZZLE_SOLVED registra ese tiempo
+        self.timer.set_time(save_data.get("timer", 0))
+        self.nonogram.set_player_grid(save_data["player_grid"])
+        if "undo_state" in save_data:
+            self.nonogram.undo_log.set_state(save_data["undo_state"])
+        else:
+            self.nonogram.undo_log.clear()
+        self.draw()
+        self.update()
+
+    def load_legacy_save(self):
+        """
+        Lee una partida guardada en el formato JSON anterior, que no incluía el historial.
+
+        Returns:
+            dict: Diccionario con player_grid y timer, o None si no existe.
+        """
+        filename = os.path.join(SAVE_GAME_PATH, f"level{self.current_level}.json")
+        try:
+            with open(filename, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
 
     def show_message(self, message):
         """
@@ -232,11 +519,9 @@ class Game:
         Args:
             message (str): Mensaje a mostrar.
         """
-        font_path = os.path.join("assets", "fonts", "newsweekly", "newsweekly-Regular.ttf")
-        font = pygame.font.Font(font_path, 36)
         dark_color = (63, 48, 43)
         light_color = (251, 226, 204)
-        text_surface = font.render(message, True, dark_color)
+        text_surface = render_text(NEWSWEEKLY_FONT, 36, message, dark_color)
         text_rect = text_surface.get_rect(center=self.screen.get_rect().center)
         border_width = 3
 
@@ -249,7 +534,27 @@ class Game:
         self.screen.blit(text_surface, text_rect)
         pygame.display.flip()
         pygame.time.wait(1500)
+        self.invalidate()
+
 
+    def invalidate(self):
+        """
+        Pide que el próximo fotograma se dibuje completo, por ejemplo después de mostrar un mensaje.
+        """
+        self.needs_full_redraw = True
+
+    def on_puzzle_solved(self):
+        """
+        Reacciona al evento PUZZLE_SOLVED del Nonogram actual: reproduce el sonido de victoria,
+        detiene el temporizador y marca el nivel como completado, con su tiempo.
+        """
+        if not self.victory_music_played:
+            self.sound_manager.play_sound("complete")
+            self.victory_music_played = True
+        self.timer.stop()
+        if self.current_level != "custom":
+            self.progress_tracker.mark_level_complete(self.get_level_difficulty(self.current_level), self.current_level,
+                                                      self.timer.get_time())
 
     def update(self):
         """
@@ -257,12 +562,6 @@ class Game:
         """
         if self.current_screen == 'game':
             self.game_screen.update()
-            if self.nonogram and self.nonogram.is_solved():
-                if not self.victory_music_played:
-                    self.sound_manager.play_sound("complete")
-                    self.victory_music_played = True
-                self.timer.stop()
-                self.progress_tracker.mark_level_complete(2, self.current_level)
         elif self.current_screen == 'level_select':
             self.level_select_screen.update()
 
@@ -292,11 +591,28 @@ class Game:
         """
         Ejecuta el bucle principal del juego.
         """
+        last_screen = None
         while True:
             self.clock.tick(FPS)
-            for event in pygame.event.get():
+            screens = {'game': self.game_screen, 'level_select': self.level_select_screen}
+            current_screen = screens.get(self.current_screen)
+            timeout = 0
+            if current_screen is not None:
+                timeout = self.render_scheduler.get_timeout(self, current_screen, last_screen)
+            events = self.render_scheduler.get_events(timeout)
+            self.profiler.begin_frame()
+            for event in events:
                 if event.type == pygame.QUIT:
+                    self.profiler.stop_capture(os.environ.get(PROFILE_ENV_VAR))
                     return
+                if self.profiler.handle_event(event):
+                    continue
                 self.handle_event(event)
+            self.profiler.mark("handle_event")
             self.update()
-            self.draw()
\ No newline at end of file
+            self.profiler.mark("update")
+            self.draw()
+            self.needs_full_redraw = False
+            last_screen = current_screen
+            self.profiler.mark("draw")
+            self.profiler.end_frame()
\ No newline at end of file
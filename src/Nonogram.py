@@ -1,7 +1,21 @@
-import pygame
-import copy
+import threading
 
-from src.config import WHITE
+import pygame
+import numpy as np
+
+from src.config import WHITE, BOARD_BACKEND, UNDO_CAPACITY, CELL_SIZE, MIN_CELL_SIZE, MAX_CELL_SIZE, CELL_SIZE_STEP
+from src.logic import hint_system
+from src.logic.BitBoard import BitBoard
+from src.logic.UndoLog import UndoLog
+from src.logic.line_solver import normalize_clue
+from src.utils.clues import grid_clues
+from src.utils.font_cache import font_cache, get_font, render_text
+
+# Eventos que emite el Nonogram a sus suscriptores
+LINE_COMPLETED = "line_completed"
+PUZZLE_SOLVED = "puzzle_solved"
+CELL_CHANGED = "cell_changed"
+BOARD_RESET = "board_reset"
 
 class Nonogram:
     """
@@ -13,15 +27,32 @@ class Nonogram:
         grid (list): La cuadrícula de solución del Nonogram.
         rows (int): Número de filas en la cuadrícula.
         cols (int): Número de columnas en la cuadrícula.
-        player_grid (list): La cuadrícula del jugador.
-        cell_size (int): Tamaño de cada celda en píxeles.
-        grid_offset (tuple): Desplazamiento de la cuadrícula en la pantalla.
+        player_grid (list): La cuadrícula del jugador (lista de listas, BitBoard o numpy.ndarray según el backend).
+        backend (str): Representación del tablero del jugador, "list", "bitset" o "numpy".
+        solution_board (BitBoard): La solución en máscaras de bits, solo con el backend "bitset".
+        solution_array (numpy.ndarray): Máscara booleana de la solución, solo con el backend "numpy".
+        cell_size (int): Tamaño de cada celda en píxeles; cambia con el zoom.
+        grid_offset (tuple): Posición en la pantalla de la esquina superior izquierda de la primera celda.
+        board_rect (pygame.Rect): Área blanca del tablero, pistas incluidas, calculada en update_layout.
+        view_area (pygame.Rect): Área de la pantalla disponible para el tablero, o None para usar toda la pantalla.
+        view_rect (pygame.Rect): Área visible de las celdas cuando el tablero no entra en view_area y se desplaza, o None.
+        scroll (list): Desplazamiento de la vista, en píxeles, desde la esquina superior izquierda de las celdas.
+        layout_key (tuple): Datos con los que se calculó la disposición del tablero por última vez.
+        layout_screen_size (tuple): Tamaño de pantalla con el que se calculó la disposición por última vez.
+        clue_dimensions (dict): Ancho de las pistas de las filas y alto de las de las columnas, por tamaño de celda.
+        cross_surface (pygame.Surface): X pre-dibujada para las celdas marcadas.
+        theme (str): Tema de color con el que se compone la capa estática.
+        static_layer (pygame.Surface): Capa con el fondo, las líneas y las pistas del tablero.
+        static_layer_key (tuple): Tamaño de celda, tamaño de pantalla y tema con los que se compuso la capa.
         font (pygame.font.Font): Fuente utilizada para dibujar texto.
-        history (list): Historial de movimientos para deshacer.
-        redo_stack (list): Pila de movimientos para rehacer.
+        undo_log (UndoLog): Historial para deshacer y rehacer, agrupado en trazos.
+        mismatches (int): Celdas cuyo estado lleno/vacío no coincide con la solución.
+        row_matches (list): Indica por fila si las celdas llenas cumplen la pista.
+        col_matches (list): Indica por columna si las celdas llenas cumplen la pista.
+        listeners (dict): Funciones suscritas a cada evento (LINE_COMPLETED, PUZZLE_SOLVED, CELL_CHANGED, BOARD_RESET).
     """
 
-    def __init__(self, grid, row_clues, col_clues):
+    def __init__(self, grid, row_clues, col_clues, backend=None):
         """
         Inicializa una instancia de la clase Nonogram.
 
@@ -29,18 +60,41 @@ class Nonogram:
             grid (list): La cuadrícula de solución del Nonogram.
             row_clues (list): Pistas para las filas.
             col_clues (list): Pistas para las columnas.
+            backend (str, optional): Representación del tablero del jugador. Por defecto es config.BOARD_BACKEND.
         """
         self.row_clues = row_clues
         self.col_clues = col_clues
         self.grid = grid
         self.rows = len(grid)
         self.cols = len(grid[0])
-        self.player_grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
-        self.cell_size = 30
+        self.backend = backend or BOARD_BACKEND
+        self.solution_board = None
+        self.solution_array = None
+        if self.backend == "bitset":
+            self.solution_board = BitBoard.from_list(grid)
+            self.player_grid = BitBoard(self.rows, self.cols)
+        elif self.backend == "numpy":
+            self.solution_array = np.asarray(grid) == 1
+            self.player_grid = np.zeros((self.rows, self.cols), dtype=np.uint8)
+        else:
+            self.player_grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+        self.cell_size = CELL_SIZE
         self.grid_offset = (100, 100)
-        self.font = pygame.font.Font(None, 24)
-        self.history = []
-        self.redo_stack = []
+        self.board_rect = pygame.Rect(0, 0, 0, 0)
+        self.view_area = None
+        self.view_rect = None
+        self.scroll = [0, 0]
+        self.layout_key = None
+        self.layout_screen_size = None
+        self.clue_dimensions = {}
+        self.cross_surface = None
+        self.theme = "default"
+        self.static_layer = None
+        self.static_layer_key = None
+        self.font = get_font(None, 24)
+        self.undo_log = UndoLog(UNDO_CAPACITY)
+        self.listeners = {LINE_COMPLETED: [], PUZZLE_SOLVED: [], CELL_CHANGED: [], BOARD_RESET: []}
+        self.refresh_tracking()
 
     @classmethod
     def from_level_data(cls, level_data):
@@ -63,171 +117,755 @@ class Nonogram:
             screen (pygame.Surface): La superficie de la pantalla donde se dibuja el Nonogram.
         """
         self.draw_grid(screen)
-        self.draw_clues(screen)
         self.draw_cells(screen)
 
+    def get_clue_font_size(self):
+        """
+        Obtiene el tamaño de la fuente de las pistas, proporcional al tamaño de celda.
+
+        Returns:
+            int: Tamaño de la fuente; 24 con el tamaño de celda por defecto.
+        """
+        return max(8, self.cell_size * 4 // 5)
+
     def get_max_clue_dimensions(self):
         """
-        Obtiene las dimensiones máximas de las pistas.
+        Obtiene las dimensiones máximas de las pistas. Se calculan una sola vez por tamaño de celda.
 
         Returns:
             tuple: Ancho máximo de las pistas de las filas y alto máximo de las pistas de las columnas.
         """
-        font = pygame.font.Font(None, 24)
-        max_row_clue_width = max(font.size(" ".join(map(str, row_clue)))[0] for row_clue in self.row_clues) + 25
-        max_col_clue_height = max(sum(font.size(str(num))[1] for num in col_clue) for col_clue in self.col_clues) + 25
-        return max_row_clue_width, max_col_clue_height
-
-    def draw_grid(self, screen):
+        dimensions = self.clue_dimensions.get(self.cell_size)
+        if dimensions is None:
+            # Las fuentes son compartidas con el hilo que prepara niveles y SDL_ttf no es seguro entre hilos
+            with font_cache.lock:
+                font = get_font(None, self.get_clue_font_size())
+                max_row_clue_width = max(font.size(" ".join(map(str, row_clue)))[0] for row_clue in self.row_clues) + 25
+                max_col_clue_height = max(sum(font.size(str(num))[1] for num in col_clue) for col_clue in self.col_clues) + 25
+            dimensions = (max_row_clue_width, max_col_clue_height)
+            self.clue_dimensions[self.cell_size] = dimensions
+        return dimensions
+
+    def get_centered_layout(self, screen_size):
         """
-        Dibuja la cuadrícula del Nonogram en la pantalla.
+        Calcula la disposición del tablero completo centrado en la pantalla.
 
         Args:
-            screen (pygame.Surface): La superficie de la pantalla donde se dibuja la cuadrícula.
+            screen_size (tuple): Tamaño de la pantalla.
+
+        Returns:
+            tuple: grid_offset y board_rect del tablero centrado.
         """
-        screen_width, screen_height = screen.get_size()
+        screen_width, screen_height = screen_size
         grid_width = self.cols * self.cell_size
         grid_height = self.rows * self.cell_size
         clue_width, clue_height = self.get_max_clue_dimensions()
-        self.grid_offset = (
+        grid_offset = (
             (screen_width - grid_width) // 2,
             (screen_height - grid_height) // 2
         )
+        board_rect = pygame.Rect(grid_offset[0] - clue_width, grid_offset[1] - clue_height, grid_width + clue_width, grid_height + clue_height)
+        return grid_offset, board_rect
+
+    def update_layout(self, screen_size):
+        """
+        Calcula grid_offset, board_rect y view_rect para el tamaño de pantalla, el zoom y el desplazamiento actuales.
+
+        Si el tablero centrado entra en view_area (o no hay view_area) se dibuja completo con la capa
+        estática. Si no, se muestra la parte que entra: las pistas quedan fijas arriba y a la izquierda
+        del área y las celdas se desplazan según scroll, que se limita a los bordes del tablero.
+
+        Args:
+            screen_size (tuple): Tamaño de la pantalla.
+        """
+        key = (self.cell_size, tuple(screen_size), tuple(self.view_area) if self.view_area else None, tuple(self.scroll))
+        if key == self.layout_key:
+            return
+        self.layout_screen_size = tuple(screen_size)
+        self.grid_offset, self.board_rect = self.get_centered_layout(screen_size)
+        self.view_rect = None
+        area = self.view_area
+        if area is not None and not area.contains(self.board_rect):
+            grid_width = self.cols * self.cell_size
+            grid_height = self.rows * self.cell_size
+            # Las pistas ocupan como mucho la mitad del área; las de las filas están alineadas a la derecha
+            # y las de las columnas abajo, así que se recortan las más alejadas de las celdas
+            clue_width, clue_height = self.get_max_clue_dimensions()
+            clue_width = min(clue_width, area.width // 2)
+            clue_height = min(clue_height, area.height // 2)
+            width = min(grid_width, area.width - clue_width)
+            height = min(grid_height, area.height - clue_height)
+            x = area.x + (area.width - clue_width - width) // 2
+            y = area.y + (area.height - clue_height - height) // 2
+            self.scroll = [max(0, min(int(self.scroll[0]), grid_width - width)),
+                           max(0, min(int(self.scroll[1]), grid_height - height))]
+            self.grid_offset = (x + clue_width - self.scroll[0], y + clue_height - self.scroll[1])
+            self.board_rect = pygame.Rect(x, y, clue_width + width, clue_height + height)
+            # La línea que separa las pistas de las celdas ocupa los 2 primeros píxeles
+            self.view_rect = pygame.Rect(x + clue_width + 2, y + clue_height + 2, width - 2, height - 2)
+        self.layout_key = (self.cell_size, tuple(screen_size), key[2], tuple(self.scroll))
+
+    def get_visible_range(self):
+        """
+        Obtiene las filas y columnas con alguna parte visible, incluido el margen de las X vecinas.
+
+        Returns:
+            tuple: Primera fila, fila siguiente a la última, primera columna y columna siguiente a la última.
+        """
+        if self.view_rect is None:
+            return 0, self.rows, 0, self.cols
+        view = self.view_rect.inflate(4, 4)
+        first_row = max(0, (view.top - self.grid_offset[1]) // self.cell_size)
+        last_row = min(self.rows, (view.bottom - self.grid_offset[1]) // self.cell_size + 1)
+        first_col = max(0, (view.left - self.grid_offset[0]) // self.cell_size)
+        last_col = min(self.cols, (view.right - self.grid_offset[0]) // self.cell_size + 1)
+        return first_row, last_row, first_col, last_col
+
+    def cell_at(self, pos):
+        """
+        Obtiene la celda visible en una posición de la pantalla.
+
+        Args:
+            pos (tuple): Posición en la pantalla.
+
+        Returns:
+            tuple: (fila, columna) de la celda, o None si en esa posición no hay una celda visible.
+        """
+        if self.view_rect is not None and not self.view_rect.collidepoint(pos):
+            return None
+        col = (pos[0] - self.grid_offset[0]) // self.cell_size
+        row = (pos[1] - self.grid_offset[1]) // self.cell_size
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return row, col
+        return None
+
+    def pan(self, dx, dy):
+        """
+        Desplaza la vista del tablero.
+
+        Args:
+            dx (int): Píxeles hacia la derecha.
+            dy (int): Píxeles hacia abajo.
+
+        Returns:
+            bool: True si la vista se movió.
+        """
+        if self.view_rect is None:
+            return False
+        previous = tuple(self.scroll)
+        self.scroll = [previous[0] + int(dx), previous[1] + int(dy)]
+        self.update_layout(self.layout_screen_size)
+        return tuple(self.scroll) != previous
+
+    def center_view(self, row, col):
+        """
+        Desplaza la vista para que un punto del tablero quede en su centro.
+
+        Args:
+            row (float): Fila del punto; puede tener parte decimal.
+            col (float): Columna del punto; puede tener parte decimal.
+
+        Returns:
+            bool: True si la vista se movió.
+        """
+        if self.view_rect is None:
+            return False
+        # Posición en la pantalla de la primera celda sin desplazamiento
+        origin_x = self.grid_offset[0] + self.scroll[0]
+        origin_y = self.grid_offset[1] + self.scroll[1]
+        view_x, view_y = self.view_rect.center
+        return self.pan(origin_x + col * self.cell_size - view_x - self.scroll[0],
+                        origin_y + row * self.cell_size - view_y - self.scroll[1])
+
+    def zoom(self, steps, anchor=None):
+        """
+        Cambia el tamaño de celda en CELL_SIZE_STEP píxeles por paso, entre MIN_CELL_SIZE y MAX_CELL_SIZE.
+
+        El punto del tablero que está debajo de anchor queda en el mismo lugar de la pantalla.
+
+        Args:
+            steps (int): Pasos de zoom; positivos para acercar y negativos para alejar.
+            anchor (tuple, optional): Posición de la pantalla que se mantiene fija. Por defecto es el centro de la vista.
+
+        Returns:
+            bool: True si cambió el tamaño de celda.
+        """
+        cell_size = max(MIN_CELL_SIZE, min(MAX_CELL_SIZE, self.cell_size + steps * CELL_SIZE_STEP))
+        if cell_size == self.cell_size:
+            return False
+        screen_size = self.layout_screen_size or pygame.display.get_surface().get_size()
+        self.update_layout(screen_size)
+        if anchor is None or (self.view_rect is not None and not self.view_rect.collidepoint(anchor)):
+            anchor = self.view_rect.center if self.view_rect is not None else self.board_rect.center
+        col = (anchor[0] - self.grid_offset[0]) / self.cell_size
+        row = (anchor[1] - self.grid_offset[1]) / self.cell_size
+        self.cell_size = cell_size
+        self.update_layout(screen_size)
+        if self.view_rect is not None:
+            # scroll tal que el punto (fila, columna) quede otra vez en anchor
+            self.scroll = [round(col * cell_size - (anchor[0] - self.grid_offset[0] - self.scroll[0])),
+                           round(row * cell_size - (anchor[1] - self.grid_offset[1] - self.scroll[1]))]
+            self.update_layout(screen_size)
+        return True
+
+    def get_static_layer(self, screen_size):
+        """
+        Obtiene la capa estática del tablero: fondo blanco, líneas, borde y pistas.
 
-        grid_rect = pygame.Rect(self.grid_offset[0] - clue_width, self.grid_offset[1] - clue_height, grid_width + clue_width, grid_height + clue_height)
-        pygame.draw.rect(screen, WHITE, grid_rect)
+        La capa se compone una sola vez y se vuelve a crear solo si cambia el tamaño de
+        celda, el tamaño de la ventana o el tema. Contiene el tablero completo, así que solo se
+        usa cuando el tablero entra en el área disponible (ver update_layout).
 
+        Args:
+            screen_size (tuple): Tamaño de la pantalla.
+
+        Returns:
+            pygame.Surface: La capa, con un margen transparente de 2 píxeles alrededor de board_rect.
+        """
+        self.update_layout(screen_size)
+        key = (self.cell_size, tuple(screen_size), self.theme)
+        if self.static_layer is None or self.static_layer_key != key:
+            self.build_static_layer(screen_size)
+            self.static_layer_key = key
+        return self.static_layer
+
+    def build_static_layer(self, screen_size):
+        """
+        Compone la capa estática del tablero completo, centrado en una pantalla del tamaño dado.
+
+        Args:
+            screen_size (tuple): Tamaño de la pantalla.
+        """
+        clue_width, clue_height = self.get_max_clue_dimensions()
+        grid_offset, board_rect = self.get_centered_layout(screen_size)
+
+        # Las líneas de los bordes sobresalen del área blanca, por eso la capa tiene un margen transparente
+        layer = pygame.Surface((board_rect.width + 4, board_rect.height + 4), pygame.SRCALPHA)
+        # convert_alpha usa la ventana, así que en el hilo que prepara niveles la capa se convierte después (ver LevelLoader.take)
+        if pygame.display.get_surface() is not None and threading.current_thread() is threading.main_thread():
+            layer = layer.convert_alpha()
+        layer.fill((0, 0, 0, 0))
+        pygame.draw.rect(layer, WHITE, pygame.Rect(2, 2, board_rect.width, board_rect.height))
+        offset = (grid_offset[0] - board_rect.x + 2, grid_offset[1] - board_rect.y + 2)
+        self.draw_grid_lines(layer, offset, clue_width, clue_height)
+        self.draw_clues(layer, offset)
+        self.static_layer = layer
+
+    def draw_grid(self, screen):
+        """
+        Dibuja la cuadrícula del Nonogram y sus pistas en la pantalla copiando la capa estática,
+        o solo la parte visible si el tablero no entra en view_area.
+
+        Args:
+            screen (pygame.Surface): La superficie de la pantalla donde se dibuja la cuadrícula.
+        """
+        self.update_layout(screen.get_size())
+        if self.view_rect is not None:
+            self.draw_visible_grid(screen)
+            return
+        layer = self.get_static_layer(screen.get_size())
+        screen.blit(layer, (self.board_rect.x - 2, self.board_rect.y - 2))
+
+    def draw_visible_grid(self, screen):
+        """
+        Dibuja la parte visible del tablero desplazable: fondo, líneas, pistas de las filas y
+        columnas visibles y el marco. El costo depende de las celdas visibles, no del tamaño del tablero.
+
+        Args:
+            screen (pygame.Surface): La superficie de la pantalla.
+        """
+        view = self.view_rect
+        board = self.board_rect
+        # Líneas que separan las pistas de las celdas
+        separator_x, separator_y = view.x - 2, view.y - 2
+        first_row, last_row, first_col, last_col = self.get_visible_range()
+        font_size = self.get_clue_font_size()
+        previous_clip = screen.get_clip()
+        pygame.draw.rect(screen, WHITE, board)
+
+        screen.set_clip(pygame.Rect(board.x, view.y, separator_x - board.x, view.height))
+        for i in range(first_row, last_row + 1):
+            y = self.grid_offset[1] + i * self.cell_size
+            pygame.draw.line(screen, (0, 0, 0), (board.x, y), (separator_x, y), 2)
+        for i in range(first_row, last_row):
+            text_surface = render_text(None, font_size, " ".join(map(str, self.row_clues[i])), (0, 0, 0))
+            screen.blit(text_surface, (
+                separator_x - 10 - text_surface.get_width(),
+                self.grid_offset[1] + i * self.cell_size + self.cell_size // 2 - text_surface.get_height() // 2
+            ))
+
+        screen.set_clip(pygame.Rect(view.x, board.y, view.width, separator_y - board.y))
+        for j in range(first_col, last_col + 1):
+            x = self.grid_offset[0] + j * self.cell_size
+            pygame.draw.line(screen, (0, 0, 0), (x, board.y), (x, separator_y), 2)
+        for j in range(first_col, last_col):
+            text_surfaces = [render_text(None, font_size, str(num), (0, 0, 0)) for num in self.col_clues[j]]
+            current_y = separator_y - 10 - sum(surface.get_height() for surface in text_surfaces)
+            for surface in text_surfaces:
+                screen.blit(surface, (
+                    self.grid_offset[0] + j * self.cell_size + self.cell_size // 2 - surface.get_width() // 2,
+                    current_y
+                ))
+                current_y += surface.get_height()
+
+        screen.set_clip(view)
+        for i in range(first_row, last_row + 1):
+            y = self.grid_offset[1] + i * self.cell_size
+            pygame.draw.line(screen, (0, 0, 0), (view.left, y), (view.right, y), 2)
+        for j in range(first_col, last_col + 1):
+            x = self.grid_offset[0] + j * self.cell_size
+            pygame.draw.line(screen, (0, 0, 0), (x, view.top), (x, view.bottom), 2)
+        screen.set_clip(previous_clip)
+
+        # Marco: borde exterior y separación entre las pistas y las celdas, fuera de view_rect
+        for x in (board.left, separator_x, board.right):
+            pygame.draw.line(screen, (0, 0, 0), (x, board.top), (x, board.bottom + 1), 2)
+        for y in (board.top, separator_y, board.bottom):
+            pygame.draw.line(screen, (0, 0, 0), (board.left, y), (board.right + 1, y), 2)
+
+    def draw_grid_lines(self, surface, offset, clue_width, clue_height):
+        """
+        Dibuja las líneas de la cuadrícula y el borde del área de pistas.
+
+        Args:
+            surface (pygame.Surface): La superficie donde se dibujan las líneas.
+            offset (tuple): Posición de la esquina superior izquierda de las celdas en la superficie.
+            clue_width (int): Ancho del área de pistas de las filas.
+            clue_height (int): Alto del área de pistas de las columnas.
+        """
         for i in range(self.rows + 1):
-            start_pos = (self.grid_offset[0] - clue_width, self.grid_offset[1] + i * self.cell_size)
-            end_pos = (self.grid_offset[0] + self.cols * self.cell_size, self.grid_offset[1] + i * self.cell_size)
-            pygame.draw.line(screen, (0, 0, 0), start_pos, end_pos, 2)
+            start_pos = (offset[0] - clue_width, offset[1] + i * self.cell_size)
+            end_pos = (offset[0] + self.cols * self.cell_size, offset[1] + i * self.cell_size)
+            pygame.draw.line(surface, (0, 0, 0), start_pos, end_pos, 2)
 
         for j in range(self.cols + 1):
-            start_pos = (self.grid_offset[0] + j * self.cell_size, self.grid_offset[1] - clue_height)
-            end_pos = (self.grid_offset[0] + j * self.cell_size, self.grid_offset[1] + self.rows * self.cell_size)
-            pygame.draw.line(screen, (0, 0, 0), start_pos, end_pos, 2)
+            start_pos = (offset[0] + j * self.cell_size, offset[1] - clue_height)
+            end_pos = (offset[0] + j * self.cell_size, offset[1] + self.rows * self.cell_size)
+            pygame.draw.line(surface, (0, 0, 0), start_pos, end_pos, 2)
 
-        start_pos_x = (self.grid_offset[0] - clue_width, self.grid_offset[1] - clue_height)
-        end_pos_x = (self.grid_offset[0] - clue_width, self.grid_offset[1] + self.rows * self.cell_size)
-        pygame.draw.line(screen, (0, 0, 0), start_pos_x, end_pos_x, 2)
+        start_pos_x = (offset[0] - clue_width, offset[1] - clue_height)
+        end_pos_x = (offset[0] - clue_width, offset[1] + self.rows * self.cell_size)
+        pygame.draw.line(surface, (0, 0, 0), start_pos_x, end_pos_x, 2)
 
-        start_pos_y = (self.grid_offset[0] - clue_width, self.grid_offset[1] - clue_height)
-        end_pos_y = (self.grid_offset[0] + self.cols * self.cell_size, self.grid_offset[1] - clue_height)
-        pygame.draw.line(screen, (0, 0, 0), start_pos_y, end_pos_y, 2)
+        start_pos_y = (offset[0] - clue_width, offset[1] - clue_height)
+        end_pos_y = (offset[0] + self.cols * self.cell_size, offset[1] - clue_height)
+        pygame.draw.line(surface, (0, 0, 0), start_pos_y, end_pos_y, 2)
 
-    def draw_clues(self, screen):
+    def draw_clues(self, screen, offset=None):
         """
         Dibuja las pistas del Nonogram en la pantalla.
 
         Args:
             screen (pygame.Surface): La superficie de la pantalla donde se dibujan las pistas.
+            offset (tuple, optional): Posición de la esquina superior izquierda de las celdas. Por defecto es grid_offset.
         """
+        if offset is None:
+            offset = self.grid_offset
+        font_size = self.get_clue_font_size()
         row_clue_surfaces = [
-            (self.font.render(" ".join(map(str, row_clue)), True, (0, 0, 0)), i)
+            (render_text(None, font_size, " ".join(map(str, row_clue)), (0, 0, 0)), i)
             for i, row_clue in enumerate(self.row_clues)
         ]
 
         for text_surface, i in row_clue_surfaces:
             screen.blit(text_surface, (
-                self.grid_offset[0] - 10 - text_surface.get_width(),
-                self.grid_offset[1] + i * self.cell_size + self.cell_size // 2 - text_surface.get_height() // 2
+                offset[0] - 10 - text_surface.get_width(),
+                offset[1] + i * self.cell_size + self.cell_size // 2 - text_surface.get_height() // 2
             ))
 
         col_clue_surfaces = [
             ([
-                 self.font.render(str(num), True, (0, 0, 0)) for num in col_clue
+                 render_text(None, font_size, str(num), (0, 0, 0)) for num in col_clue
              ], j) for j, col_clue in enumerate(self.col_clues)
         ]
         for text_surfaces, j in col_clue_surfaces:
             total_height = sum(surface.get_height() for surface in text_surfaces)
-            current_y = self.grid_offset[1] - 10 - total_height
+            current_y = offset[1] - 10 - total_height
             for surface in text_surfaces:
                 screen.blit(surface, (
-                    self.grid_offset[0] + j * self.cell_size + self.cell_size // 2 - surface.get_width() // 2,
+                    offset[0] + j * self.cell_size + self.cell_size // 2 - surface.get_width() // 2,
                     current_y
                 ))
                 current_y += surface.get_height()
 
     def draw_cells(self, screen):
         """
-        Dibuja las celdas del Nonogram en la pantalla.
+        Dibuja las celdas del Nonogram en la pantalla; si el tablero se desplaza, solo las visibles.
 
         Args:
             screen (pygame.Surface): La superficie de la pantalla donde se dibujan las celdas.
         """
-        for i in range(self.rows):
-            for j in range(self.cols):
-                cell_rect = pygame.Rect(
-                    self.grid_offset[0] + j * self.cell_size,
-                    self.grid_offset[1] + i * self.cell_size,
-                    self.cell_size,
-                    self.cell_size
-                )
-                if self.player_grid[i][j] == 1:
-                    pygame.draw.rect(screen, (0, 0, 0), cell_rect)
-                elif self.player_grid[i][j] == 2:
-                    pygame.draw.line(screen, (255, 0, 0), cell_rect.topleft, cell_rect.bottomright, 2)
-                    pygame.draw.line(screen, (255, 0, 0), cell_rect.topright, cell_rect.bottomleft, 2)
+        if self.view_rect is None:
+            player_grid = self.player_grid.tolist() if self.backend == "numpy" else self.player_grid
+            for i, row in enumerate(player_grid):
+                for j, value in enumerate(row):
+                    if value:
+                        self.draw_cell_content(screen, self.get_cell_rect(i, j), value)
+            return
+
+        first_row, last_row, first_col, last_col = self.get_visible_range()
+        if self.backend == "numpy":
+            block = self.player_grid[first_row:last_row, first_col:last_col].tolist()
+        else:
+            block = [[self.player_grid[i][j] for j in range(first_col, last_col)] for i in range(first_row, last_row)]
+        previous_clip = screen.get_clip()
+        screen.set_clip(self.view_rect)
+        for i, row in enumerate(block, first_row):
+            for j, value in enumerate(row, first_col):
+                if value:
+                    self.draw_cell_content(screen, self.get_cell_rect(i, j), value)
+        screen.set_clip(previous_clip)
+
+    def get_cell_rect(self, row, col):
+        """
+        Obtiene el rectángulo en pantalla de una celda.
+
+        Args:
+            row (int): Índice de la fila.
+            col (int): Índice de la columna.
+
+        Returns:
+            pygame.Rect: Rectángulo de la celda.
+        """
+        return pygame.Rect(
+            self.grid_offset[0] + col * self.cell_size,
+            self.grid_offset[1] + row * self.cell_size,
+            self.cell_size,
+            self.cell_size
+        )
+
+    def get_cross_surface(self):
+        """
+        Obtiene la X roja de una celda pre-dibujada en una superficie transparente.
+
+        Se vuelve a crear solo si cambia el tamaño de celda. Copiarla con blit produce los
+        mismos píxeles aunque la pantalla tenga un área de recorte, a diferencia de dibujar
+        las líneas recortadas.
+
+        Returns:
+            pygame.Surface: Superficie con la X, desplazada 2 píxeles desde su esquina.
+        """
+        if self.cross_surface is None or self.cross_surface.get_width() != self.cell_size + 5:
+            size = self.cell_size
+            self.cross_surface = pygame.Surface((size + 5, size + 5), pygame.SRCALPHA)
+            pygame.draw.line(self.cross_surface, (255, 0, 0), (2, 2), (size + 2, size + 2), 2)
+            pygame.draw.line(self.cross_surface, (255, 0, 0), (size + 2, 2), (2, size + 2), 2)
+        return self.cross_surface
+
+    def draw_cell_content(self, screen, cell_rect, value):
+        """
+        Dibuja el contenido de una celda: relleno negro si está llena o una X roja si está marcada.
+
+        Args:
+            screen (pygame.Surface): La superficie donde se dibuja.
+            cell_rect (pygame.Rect): Rectángulo de la celda.
+            value (int): Valor de la celda.
+        """
+        if value == 1:
+            pygame.draw.rect(screen, (0, 0, 0), cell_rect)
+        elif value == 2:
+            screen.blit(self.get_cross_surface(), (cell_rect.x - 2, cell_rect.y - 2))
+
+    def draw_cell(self, screen, row, col, background=None):
+        """
+        Vuelve a dibujar solo el área de una celda, con el mismo resultado que un dibujado completo.
+
+        El área incluye un margen de 2 píxeles, donde pueden caer los trazos de las X vecinas.
+        Dentro de ella se repinta el fondo, el tablero blanco, las líneas de la cuadrícula que
+        bordean la celda y el contenido de la celda y sus ocho vecinas.
+
+        Si el tablero se desplaza, el área se recorta a view_rect y puede quedar vacía.
+
+        Args:
+            screen (pygame.Surface): La superficie donde se dibuja.
+            row (int): Índice de la fila.
+            col (int): Índice de la columna.
+            background (pygame.Surface, optional): Imagen de fondo para el margen que queda fuera del tablero.
+
+        Returns:
+            pygame.Rect: El rectángulo que se modificó.
+        """
+        area = self.get_cell_rect(row, col).inflate(4, 4)
+        if self.view_rect is not None:
+            area = area.clip(self.view_rect)
+            if not area:
+                return area
+        previous_clip = screen.get_clip()
+        screen.set_clip(area)
+        if background is not None:
+            screen.blit(background, area, area)
+        pygame.draw.rect(screen, WHITE, area.clip(self.board_rect))
+        for i in (row, row + 1):
+            y = self.grid_offset[1] + i * self.cell_size
+            pygame.draw.line(screen, (0, 0, 0), (area.left, y), (min(area.right, self.board_rect.right), y), 2)
+        for j in (col, col + 1):
+            x = self.grid_offset[0] + j * self.cell_size
+            pygame.draw.line(screen, (0, 0, 0), (x, area.top), (x, min(area.bottom, self.board_rect.bottom)), 2)
+        for i in range(max(row - 1, 0), min(row + 2, self.rows)):
+            for j in range(max(col - 1, 0), min(col + 2, self.cols)):
+                value = self.player_grid[i][j]
+                if value:
+                    self.draw_cell_content(screen, self.get_cell_rect(i, j), value)
+        screen.set_clip(previous_clip)
+        return area
+
+    def subscribe(self, event, callback):
+        """
+        Suscribe una función a un evento del Nonogram.
+
+        LINE_COMPLETED llama a callback(tipo, índice) con tipo "row" o "col" cuando una línea
+        pasa a cumplir su pista; PUZZLE_SOLVED llama a callback() cuando el puzzle queda resuelto;
+        CELL_CHANGED llama a callback(fila, columna) cada vez que cambia una celda, y BOARD_RESET
+        llama a callback() cuando se reemplaza la cuadrícula completa.
+
+        Args:
+            event (str): LINE_COMPLETED, PUZZLE_SOLVED, CELL_CHANGED o BOARD_RESET.
+            callback (function): Función a llamar.
+        """
+        if callback not in self.listeners[event]:
+            self.listeners[event].append(callback)
+
+    def unsubscribe(self, event, callback):
+        """
+        Cancela la suscripción de una función a un evento.
+
+        Args:
+            event (str): Evento al que se suscribió la función.
+            callback (function): Función suscrita.
+        """
+        if callback in self.listeners[event]:
+            self.listeners[event].remove(callback)
+
+    def emit(self, event, *args):
+        """
+        Notifica un evento a todas las funciones suscritas.
+
+        Args:
+            event (str): Evento a notificar.
+            *args: Datos del evento.
+        """
+        for callback in list(self.listeners[event]):
+            callback(*args)
+
+    def refresh_tracking(self):
+        """
+        Recalcula desde cero el contador de errores y el estado de cada fila y columna.
+
+        Se usa al crear el Nonogram o al reemplazar la cuadrícula completa; las ediciones
+        de celdas actualizan este estado de forma incremental.
+        """
+        self.mismatches = self.count_mismatches()
+        self.row_matches = [self.line_matches_clue("row", i) for i in range(self.rows)]
+        self.col_matches = [self.line_matches_clue("col", j) for j in range(self.cols)]
+
+    def line_matches_clue(self, kind, index):
+        """
+        Verifica si las celdas llenas de una fila o columna del jugador cumplen su pista.
+
+        Args:
+            kind (str): "row" para una fila o "col" para una columna.
+            index (int): Índice de la línea.
+
+        Returns:
+            bool: True si los bloques de la línea coinciden con la pista.
+        """
+        clue = self.row_clues[index] if kind == "row" else self.col_clues[index]
+        if isinstance(self.player_grid, BitBoard):
+            if kind == "row":
+                segments = self.player_grid.row_clue(index)
+            else:
+                segments = self.player_grid.col_clue(index)
+        elif kind == "row":
+            segments = hint_system.get_segments(self.player_grid[index])
+        else:
+            segments = hint_system.get_segments([row[index] for row in self.player_grid])
+        return tuple(segments) == normalize_clue(clue)
+
+    def write_cell(self, row, col, value):
+        """
+        Escribe una celda del jugador y actualiza el estado de su fila, su columna y el contador de errores.
+
+        Solo se revisan la fila y la columna tocadas, por lo que el costo es O(filas + columnas).
+
+        Args:
+            row (int): Índice de la fila.
+            col (int): Índice de la columna.
+            value (int): Valor a escribir (0, 1 o 2).
+        """
+        previous = self.player_grid[row][col]
+        if previous == value:
+            return
+        self.player_grid[row][col] = value
+        self.emit(CELL_CHANGED, row, col)
+        if (previous == 1) == (value == 1):
+            return
+
+        was_solved = self.mismatches == 0
+        if (value == 1) != (self.grid[row][col] == 1):
+            self.mismatches += 1
+        else:
+            self.mismatches -= 1
+
+        row_match = self.line_matches_clue("row", row)
+        if row_match != self.row_matches[row]:
+            self.row_matches[row] = row_match
+            if row_match:
+                self.emit(LINE_COMPLETED, "row", row)
+        col_match = self.line_matches_clue("col", col)
+        if col_match != self.col_matches[col]:
+            self.col_matches[col] = col_match
+            if col_match:
+                self.emit(LINE_COMPLETED, "col", col)
+
+        if self.mismatches == 0 and not was_solved:
+            self.emit(PUZZLE_SOLVED)
 
     def set_cell(self, row, col, value):
         """
         Establece el valor de una celda en la cuadrícula del jugador.
 
+        Una celda llena o marcada con X se vacía; una celda vacía toma el valor indicado.
+
         Args:
             row (int): Índice de la fila.
             col (int): Índice de la columna.
             value (int): Valor a establecer en la celda.
         """
-        self.history.append((row, col, self.player_grid[row][col]))
-        if self.player_grid[row][col] in {1, 2}:
-            self.player_grid[row][col] = 0
-        else:
-            self.player_grid[row][col] = value
-            self.redo_stack.clear()
+        previous = int(self.player_grid[row][col])
+        if previous in {1, 2}:
+            value = 0
+        self.change_cell(row, col, previous, value)
+
+    def apply_hint(self, row, col, value):
+        """
+        Coloca en la cuadrícula del jugador el valor indicado por una pista, registrándolo en el historial.
+
+        Args:
+            row (int): Índice de la fila.
+            col (int): Índice de la columna.
+            value (int): Valor a establecer en la celda.
+        """
+        self.change_cell(row, col, int(self.player_grid[row][col]), value)
+
+    def change_cell(self, row, col, previous, value):
+        """
+        Escribe una celda y registra el cambio en el historial.
+
+        Args:
+            row (int): Índice de la fila.
+            col (int): Índice de la columna.
+            previous (int): Valor actual de la celda.
+            value (int): Valor nuevo de la celda.
+        """
+        if previous == value:
+            return
+        self.undo_log.record(row, col, previous, value)
+        self.write_cell(row, col, value)
+
+    def begin_stroke(self):
+        """
+        Empieza un trazo: los cambios hasta end_stroke se deshacen y rehacen juntos.
+        """
+        self.undo_log.begin_stroke()
+
+    def end_stroke(self):
+        """
+        Termina el trazo actual.
+        """
+        self.undo_log.end_stroke()
 
     def undo(self):
         """
-        Deshace el último movimiento realizado por el jugador.
+        Deshace el último trazo realizado por el jugador.
         """
-        if self.history:
-            row, col, previous_state = self.history.pop()
-            self.redo_stack.append((row, col, self.player_grid[row][col]))
-            self.player_grid[row][col] = previous_state
+        for row, col, value in self.undo_log.undo():
+            self.write_cell(row, col, value)
 
     def redo(self):
         """
-        Rehace el último movimiento deshecho por el jugador.
+        Rehace el último trazo deshecho por el jugador.
         """
-        if self.redo_stack:
-            row, col, next_state = self.redo_stack.pop()
-            self.history.append((row, col, self.player_grid[row][col]))
-            self.player_grid[row][col] = next_state
+        for row, col, value in self.undo_log.redo():
+            self.write_cell(row, col, value)
 
     def is_solved(self):
         """
         Verifica si el Nonogram ha sido resuelto correctamente.
 
+        Las celdas marcadas con X cuentan como vacías. El contador de errores se mantiene
+        al editar celdas, así que la consulta es O(1).
+
         Returns:
             bool: True si el Nonogram está resuelto, False en caso contrario.
         """
-        playergrid_copy = copy.deepcopy(self.player_grid)
+        return self.mismatches == 0
 
-        for l in range(self.rows):
-            for i in range(self.cols):
-                if playergrid_copy[l][i] == 2:
-                    playergrid_copy[l][i] = 0
-        return playergrid_copy == self.grid
+    def count_mismatches(self):
+        """
+        Cuenta las celdas cuyo estado lleno/vacío no coincide con la solución.
+
+        Returns:
+            int: Número de celdas incorrectas; las X cuentan como vacías.
+        """
+        if self.solution_board is not None:
+            return sum(bin(player ^ solution).count("1") for player, solution in
+                       zip(self.player_grid.filled_rows, self.solution_board.filled_rows))
+        if self.solution_array is not None:
+            return int(np.count_nonzero((self.player_grid == 1) != self.solution_array))
+        return sum((player_cell == 1) != (cell == 1)
+                   for player_row, row in zip(self.player_grid, self.grid)
+                   for player_cell, cell in zip(player_row, row))
+
+    def get_player_grid(self):
+        """
+        Obtiene una copia de la cuadrícula del jugador como lista de listas.
+
+        Returns:
+            list: La cuadrícula del jugador.
+        """
+        if isinstance(self.player_grid, (BitBoard, np.ndarray)):
+            return self.player_grid.tolist()
+        return [row[:] for row in self.player_grid]
+
+    def set_player_grid(self, player_grid):
+        """
+        Reemplaza la cuadrícula del jugador, respetando el backend del tablero.
+
+        Emite BOARD_RESET y, si la nueva cuadrícula ya resuelve el puzzle (por ejemplo, al
+        cargar una partida terminada), también PUZZLE_SOLVED.
+
+        Args:
+            player_grid (list): Nueva cuadrícula del jugador como lista de listas.
+        """
+        if self.backend == "bitset":
+            self.player_grid = BitBoard.from_list(player_grid)
+        elif self.backend == "numpy":
+            self.player_grid = np.array(player_grid, dtype=np.uint8)
+        else:
+            self.player_grid = [list(row) for row in player_grid]
+        self.refresh_tracking()
+        self.emit(BOARD_RESET)
+        if self.is_solved():
+            self.emit(PUZZLE_SOLVED)
 
     def get_hint(self):
         """
-        Proporciona una pista al jugador, indicando una celda que no coincide con la solución.
+        Proporciona una pista al jugador.
+
+        Primero busca una celda que se pueda deducir lógicamente de las pistas; si no hay
+        ninguna (o el jugador cometió errores), indica una celda que no coincide con la solución.
 
         Returns:
             tuple: Una tupla (fila, columna, valor) indicando la celda y el valor correcto, o None si no hay discrepancias.
         """
+        hint = hint_system.get_hint(self.player_grid, self.row_clues, self.col_clues)
+        if hint is not None:
+            row, col, value = hint
+            if (value == 1) == (self.grid[row][col] == 1):
+                return hint
         for row in range(self.rows):
             for col in range(self.cols):
-                if self.player_grid[row][col] != self.grid[row][col]:
+                if (self.player_grid[row][col] == 1) != (self.grid[row][col] == 1):
                     return row, col, self.grid[row][col]
         return None
 
@@ -252,4 +890,17 @@ class Nonogram:
                 count = 0
         if count > 0:
             clue.append(count)
-        return clue if clue else None
\ No newline at end of file
+        return clue if clue else None
+
+    @staticmethod
+    def get_clues(grid):
+        """
+        Genera las pistas de todas las filas y columnas de una cuadrícula en una sola pasada vectorizada.
+
+        Args:
+            grid (list | numpy.ndarray): Cuadrícula donde el valor 1 indica una celda llena.
+
+        Returns:
+            tuple: Una tupla (pistas de filas, pistas de columnas).
+        """
+        return grid_clues(grid)
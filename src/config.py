@@ -3,6 +3,25 @@ WINDOW_WIDTH = 900
 WINDOW_HEIGHT = 750
 FPS = 60
 
+# Si es True, los fotogramas sin cambios de pantalla solo actualizan las áreas modificadas
+DIRTY_RECT_RENDERING = True
+# Si es True, el bucle principal se bloquea esperando eventos mientras no haya nada que volver a dibujar,
+# en lugar de dibujar a FPS fijos
+IDLE_RENDERING = True
+# Espera máxima sin eventos y tiempo entre dos revisiones de los eventos durante la espera, en milisegundos;
+# IDLE_POLL_MS no supera la duración de un fotograma a FPS para no agregar latencia
+IDLE_MAX_WAIT_MS = 1000
+IDLE_POLL_MS = 16
+# Intervalos de actualización, en milisegundos, del temporizador del juego y del progreso de una conversión
+TIMER_REFRESH_MS = 100
+CONVERSION_REFRESH_MS = 50
+# Perfilador de fotogramas: F3 muestra los tiempos de cada fase y F12 empieza o termina una captura de cProfile.
+# Con False solo se mide mientras la superposición está visible.
+PROFILER_ENABLED = False
+PROFILE_DUMP_PATH = "data/profiles/"
+# Si esta variable de entorno tiene una ruta, toda la sesión se graba con cProfile y se escribe ahí al salir
+PROFILE_ENV_VAR = "ATOMICGRAM_PROFILE"
+
 # Colores
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -21,15 +40,51 @@ MIN_GRID_SIZE = 5
 MAX_GRID_SIZE = 100
 DEFAULT_GRID_SIZE = 15
 
+# Representación del tablero del jugador: "list" (listas de listas), "bitset" (máscaras de bits) o "numpy" (ndarray uint8)
+BOARD_BACKEND = "list"
+# Cantidad máxima de cambios de celdas guardados para deshacer (6 bytes cada uno); al llenarse se descartan los trazos más antiguos
+UNDO_CAPACITY = 65536
+
+# Paquete de niveles compilado (generado con python -m src.utils.level_pack desde la carpeta src)
+LEVEL_PACK_PATH = "data/levels/levels.pack"
+# Índice de metadatos de los niveles (generado con python -m src.utils.level_index desde la carpeta src)
+LEVEL_INDEX_PATH = "data/levels/levels_index.json"
+# Preparación de niveles en segundo plano y cantidad de niveles preparados que se guardan
+LEVEL_PREFETCH = True
+LEVEL_CACHE_SIZE = 3
+# Procesos usados para convertir imágenes personalizadas sin bloquear el juego
+CONVERSION_WORKERS = 2
+# Tamaños probados, en orden de preferencia, al buscar la versión de una imagen con solución única.
+# Con None se convierte directamente a 20x20 sin verificar la solución.
+CONVERSION_SIZES = (20, 15, 25)
+
 # Rutas de guardado
-SAVE_GAME_PATH = "saved_games/"
+# Base de datos SQLite con el progreso del jugador; el archivo JSON de versiones anteriores se importa una sola vez
+PROGRESS_PATH = "data/player_progress.sqlite3"
+LEGACY_PROGRESS_PATH = "data/player_progress.json"
+SAVE_GAME_PATH = "data/saved_games/"
+# Ranura que usan los botones Save y Load; cada nivel puede tener varias ranuras con nombre
+DEFAULT_SAVE_SLOT = "quicksave"
 CUSTOM_NONOGRAMS_PATH = "user_created/"
+# Tamaño máximo del caché de imágenes convertidas, guardado en CUSTOM_NONOGRAMS_PATH
+CUSTOM_CACHE_MAX_BYTES = 16 * 1024 * 1024
 
 # Configuración de la interfaz de usuario
 CELL_SIZE = 30
 GRID_OFFSET = (100, 100)
 BUTTON_WIDTH = 100
 BUTTON_HEIGHT = 50
+# Vista del tablero: los tableros que no entran en el área de juego se desplazan y se ven con un minimapa.
+# Tamaños de celda del zoom (la rueda del mouse cambia CELL_SIZE_STEP píxeles), píxeles que se desplaza
+# la vista con las flechas o el joystick, distancia al borde que desplaza la vista con el joystick,
+# lado del minimapa y margen del área de juego
+MIN_CELL_SIZE = 10
+MAX_CELL_SIZE = 60
+CELL_SIZE_STEP = 4
+PAN_STEP = 60
+EDGE_PAN_MARGIN = 40
+MINIMAP_SIZE = 120
+PLAY_AREA_MARGIN = 20
 
 class Settings:
     """
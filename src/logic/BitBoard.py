@@ -0,0 +1,281 @@
+EMPTY = 0
+FILLED = 1
+CROSSED = 2
+
+
+def mask_to_clue(mask):
+    """
+    Obtiene los largos de los bloques de bits encendidos de una máscara.
+
+    El bit 0 corresponde a la primera celda de la línea.
+
+    Args:
+        mask (int): Máscara de celdas llenas de una fila o columna.
+
+    Returns:
+        list: Lista con el largo de cada bloque, en orden.
+    """
+    clue = []
+    while mask:
+        mask >>= (mask & -mask).bit_length() - 1
+        run = (~mask & (mask + 1)).bit_length() - 1
+        clue.append(run)
+        mask >>= run
+    return clue
+
+
+class BitBoardRow:
+    """
+    Vista de una fila de un BitBoard que se comporta como una lista de enteros.
+
+    Permite que el código que usa player_grid[fila][columna] siga funcionando.
+
+    Atributos:
+        board (BitBoard): Tablero al que pertenece la fila.
+        row (int): Índice de la fila.
+    """
+
+    __slots__ = ("board", "row")
+
+    def __init__(self, board, row):
+        """
+        Inicializa una instancia de la clase BitBoardRow.
+
+        Args:
+            board (BitBoard): Tablero al que pertenece la fila.
+            row (int): Índice de la fila.
+        """
+        self.board = board
+        self.row = row
+
+    def __len__(self):
+        return self.board.cols
+
+    def __getitem__(self, col):
+        if isinstance(col, slice):
+            return self.board.get_row(self.row)[col]
+        if col < 0:
+            col += self.board.cols
+        # Igual que una lista: fuera del tablero no se lee EMPTY ni se encienden bits de más
+        if not 0 <= col < self.board.cols:
+            raise IndexError("índice de columna fuera de rango")
+        return self.board.get(self.row, col)
+
+    def __setitem__(self, col, value):
+        if col < 0:
+            col += self.board.cols
+        if not 0 <= col < self.board.cols:
+            raise IndexError("índice de columna fuera de rango")
+        self.board.set(self.row, col, value)
+
+    def __iter__(self):
+        return iter(self.board.get_row(self.row))
+
+    def __eq__(self, other):
+        return self.board.get_row(self.row) == list(other)
+
+    def __repr__(self):
+        return repr(self.board.get_row(self.row))
+
+
+class BitBoard:
+    """
+    Clase que representa un tablero de Nonogram compacto usando máscaras de bits.
+
+    Cada fila y cada columna se guarda como un entero, con un plano para las celdas
+    llenas y otro para las marcadas con X. Leer o escribir una celda es O(1) y comparar
+    dos tableros es O(filas).
+
+    Atributos:
+        rows (int): Número de filas.
+        cols (int): Número de columnas.
+        filled_rows (list): Máscara de celdas llenas por fila (bit j = columna j).
+        crossed_rows (list): Máscara de celdas marcadas con X por fila.
+        filled_cols (list): Máscara de celdas llenas por columna (bit i = fila i).
+        crossed_cols (list): Máscara de celdas marcadas con X por columna.
+    """
+
+    def __init__(self, rows, cols):
+        """
+        Inicializa un tablero vacío.
+
+        Args:
+            rows (int): Número de filas.
+            cols (int): Número de columnas.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.filled_rows = [0] * rows
+        self.crossed_rows = [0] * rows
+        self.filled_cols = [0] * cols
+        self.crossed_cols = [0] * cols
+
+    @classmethod
+    def from_list(cls, grid):
+        """
+        Crea un tablero a partir de una lista de listas con valores 0, 1 y 2.
+
+        Args:
+            grid (list): Cuadrícula a convertir.
+
+        Returns:
+            BitBoard: Un tablero con el mismo contenido.
+        """
+        board = cls(len(grid), len(grid[0]) if grid else 0)
+        for i, row in enumerate(grid):
+            for j, value in enumerate(row):
+                if value:
+                    board.set(i, j, value)
+        return board
+
+    def get(self, row, col):
+        """
+        Obtiene el valor de una celda.
+
+        Args:
+            row (int): Índice de la fila.
+            col (int): Índice de la columna.
+
+        Returns:
+            int: 0 si está vacía, 1 si está llena y 2 si está marcada con X.
+        """
+        bit = 1 << col
+        if self.filled_rows[row] & bit:
+            return FILLED
+        if self.crossed_rows[row] & bit:
+            return CROSSED
+        return EMPTY
+
+    def set(self, row, col, value):
+        """
+        Establece el valor de una celda en ambos planos y en ambas orientaciones.
+
+        Args:
+            row (int): Índice de la fila.
+            col (int): Índice de la columna.
+            value (int): 0, 1 o 2.
+        """
+        row_bit = 1 << col
+        col_bit = 1 << row
+        if value == FILLED:
+            self.filled_rows[row] |= row_bit
+            self.filled_cols[col] |= col_bit
+        else:
+            self.filled_rows[row] &= ~row_bit
+            self.filled_cols[col] &= ~col_bit
+        if value == CROSSED:
+            self.crossed_rows[row] |= row_bit
+            self.crossed_cols[col] |= col_bit
+        else:
+            self.crossed_rows[row] &= ~row_bit
+            self.crossed_cols[col] &= ~col_bit
+
+    def get_row(self, row):
+        """
+        Obtiene una fila como lista de valores.
+
+        Args:
+            row (int): Índice de la fila.
+
+        Returns:
+            list: Valores de la fila.
+        """
+        filled = self.filled_rows[row]
+        crossed = self.crossed_rows[row]
+        return [FILLED if filled >> j & 1 else CROSSED if crossed >> j & 1 else EMPTY for j in range(self.cols)]
+
+    def get_column(self, col):
+        """
+        Obtiene una columna como lista de valores.
+
+        Args:
+            col (int): Índice de la columna.
+
+        Returns:
+            list: Valores de la columna.
+        """
+        filled = self.filled_cols[col]
+        crossed = self.crossed_cols[col]
+        return [FILLED if filled >> i & 1 else CROSSED if crossed >> i & 1 else EMPTY for i in range(self.rows)]
+
+    def row_clue(self, row):
+        """
+        Obtiene la pista que corresponde a las celdas llenas de una fila.
+
+        Args:
+            row (int): Índice de la fila.
+
+        Returns:
+            list: Largos de los bloques de la fila.
+        """
+        return mask_to_clue(self.filled_rows[row])
+
+    def col_clue(self, col):
+        """
+        Obtiene la pista que corresponde a las celdas llenas de una columna.
+
+        Args:
+            col (int): Índice de la columna.
+
+        Returns:
+            list: Largos de los bloques de la columna.
+        """
+        return mask_to_clue(self.filled_cols[col])
+
+    def same_filled(self, other):
+        """
+        Compara solo el plano de celdas llenas con otro tablero, ignorando las X.
+
+        Args:
+            other (BitBoard): Tablero a comparar.
+
+        Returns:
+            bool: True si ambos tableros tienen las mismas celdas llenas.
+        """
+        return self.filled_rows == other.filled_rows
+
+    def copy(self):
+        """
+        Crea una copia independiente del tablero.
+
+        Returns:
+            BitBoard: La copia.
+        """
+        board = BitBoard(self.rows, self.cols)
+        board.filled_rows = self.filled_rows[:]
+        board.crossed_rows = self.crossed_rows[:]
+        board.filled_cols = self.filled_cols[:]
+        board.crossed_cols = self.crossed_cols[:]
+        return board
+
+    def tolist(self):
+        """
+        Convierte el tablero en una lista de listas.
+
+        Returns:
+            list: Cuadrícula con valores 0, 1 y 2.
+        """
+        return [self.get_row(i) for i in range(self.rows)]
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [BitBoardRow(self, i) for i in range(self.rows)[row]]
+        if row < 0:
+            row += self.rows
+        if not 0 <= row < self.rows:
+            raise IndexError("BitBoard row index out of range")
+        return BitBoardRow(self, row)
+
+    def __iter__(self):
+        return (BitBoardRow(self, i) for i in range(self.rows))
+
+    def __eq__(self, other):
+        if isinstance(other, BitBoard):
+            return self.filled_rows == other.filled_rows and self.crossed_rows == other.crossed_rows
+        return self.tolist() == other
+
+    def __repr__(self):
+        return f"BitBoard({self.tolist()!r})"
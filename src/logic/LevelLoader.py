@@ -0,0 +1,170 @@
+import threading
+from collections import OrderedDict
+
+import pygame
+
+from src.Nonogram import Nonogram
+
+
+class LevelLoader:
+    """
+    Clase que prepara niveles en un hilo de fondo para que iniciarlos no detenga el dibujado.
+
+    Preparar un nivel significa leer sus datos, construir el Nonogram y componer su capa
+    estática (líneas y pistas). Si el tablero no entra en view_area se mostrará desplazable y
+    la capa estática no se usa, así que no se compone. Los niveles listos se guardan en un caché acotado; al
+    iniciarse, un nivel se retira del caché para que cada partida use un tablero nuevo.
+
+    Atributos:
+        load_data (callable): Función que recibe la clave de un nivel y devuelve sus datos, o None.
+        screen_size (tuple): Tamaño de pantalla con el que se compone la capa estática.
+        view_area (pygame.Rect): Área de la pantalla disponible para el tablero, o None si es la pantalla completa.
+        max_cached (int): Cantidad máxima de niveles preparados guardados.
+        cache (OrderedDict): Nonogramas preparados, por clave, del más antiguo al más reciente.
+        wanted (list): Claves que se deben preparar, en orden de prioridad.
+        loading (str): Clave del nivel que se está preparando, o None.
+        hits (int): Niveles iniciados que ya estaban preparados.
+        misses (int): Niveles iniciados que hubo que preparar en el momento.
+    """
+
+    def __init__(self, load_data, screen_size, max_cached=3, view_area=None):
+        """
+        Inicializa una instancia de la clase LevelLoader.
+
+        Args:
+            load_data (callable): Función que recibe la clave de un nivel y devuelve sus datos, o None.
+            screen_size (tuple): Tamaño de pantalla con el que se compone la capa estática.
+            max_cached (int, optional): Cantidad máxima de niveles preparados guardados. Por defecto es 3.
+            view_area (pygame.Rect, optional): Área de la pantalla disponible para el tablero. Por defecto es la pantalla completa.
+        """
+        self.load_data = load_data
+        self.screen_size = tuple(screen_size)
+        self.view_area = view_area
+        self.max_cached = max_cached
+        self.cache = OrderedDict()
+        self.wanted = []
+        self.loading = None
+        self.hits = 0
+        self.misses = 0
+        self.condition = threading.Condition()
+        self.running = True
+        self.thread = None
+
+    def prefetch(self, level_keys):
+        """
+        Pide preparar niveles en segundo plano. Reemplaza los pedidos anteriores que aún no empezaron.
+
+        Args:
+            level_keys (list): Claves de los niveles, de mayor a menor prioridad.
+        """
+        level_keys = list(dict.fromkeys(key for key in level_keys if key is not None))[:self.max_cached]
+        with self.condition:
+            self.wanted = [key for key in level_keys if key not in self.cache]
+            # Los niveles pedidos pasan a ser los más recientes del caché, para no descartarlos primero
+            for key in level_keys:
+                if key in self.cache:
+                    self.cache.move_to_end(key)
+            if self.wanted:
+                self.ensure_thread()
+                self.condition.notify()
+
+    def take(self, level_key):
+        """
+        Retira del caché un nivel preparado.
+
+        Si el nivel está pedido pero todavía no está listo, pasa al frente de la cola y se
+        espera a que termine de prepararse. Debe llamarse desde el hilo principal, que es
+        donde se convierte la capa estática al formato de la ventana.
+
+        Args:
+            level_key (str): Clave del nivel.
+
+        Returns:
+            Nonogram: El Nonogram preparado, o None si el nivel no estaba pedido.
+        """
+        with self.condition:
+            if level_key in self.wanted:
+                self.wanted.remove(level_key)
+                self.wanted.insert(0, level_key)
+                self.condition.notify_all()
+            while self.running and (self.loading == level_key or level_key in self.wanted):
+                self.condition.wait()
+            nonogram = self.cache.pop(level_key, None)
+            if nonogram is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        # La capa se compuso en el hilo de fondo sin convertir; convert_alpha solo se usa en el hilo principal
+        if nonogram is not None and nonogram.static_layer is not None and pygame.display.get_surface() is not None:
+            nonogram.static_layer = nonogram.static_layer.convert_alpha()
+        return nonogram
+
+    def prepare(self, level_key):
+        """
+        Prepara un nivel: lee sus datos, construye el Nonogram y, si el tablero entra en
+        view_area, compone su capa estática.
+
+        Args:
+            level_key (str): Clave del nivel.
+
+        Returns:
+            Nonogram: El Nonogram preparado, o None si los datos no son válidos.
+        """
+        level_data = self.load_data(level_key)
+        if not level_data or not all(key in level_data for key in ["grid", "row_clues", "col_clues"]):
+            return None
+        nonogram = Nonogram.from_level_data(level_data)
+        nonogram.view_area = self.view_area
+        nonogram.update_layout(self.screen_size)
+        # Un tablero desplazable se dibuja por partes y nunca usa la capa del tablero completo
+        if nonogram.view_rect is None:
+            nonogram.get_static_layer(self.screen_size)
+        return nonogram
+
+    def ensure_thread(self):
+        """
+        Inicia el hilo de fondo si todavía no existe.
+        """
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="LevelLoader", daemon=True)
+            self.thread.start()
+
+    def run(self):
+        """
+        Bucle del hilo de fondo: prepara los niveles pedidos de a uno.
+        """
+        while True:
+            with self.condition:
+                while self.running and not self.wanted:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                level_key = self.wanted.pop(0)
+                self.loading = level_key
+
+            try:
+                nonogram = self.prepare(level_key)
+            except Exception as e:
+                print(f"Error preparando el nivel {level_key}: {str(e)}")
+                nonogram = None
+
+            with self.condition:
+                self.loading = None
+                if nonogram is not None:
+                    self.cache[level_key] = nonogram
+                    while len(self.cache) > self.max_cached:
+                        self.cache.popitem(last=False)
+                self.condition.notify_all()
+
+    def stop(self):
+        """
+        Detiene el hilo de fondo y descarta los niveles preparados.
+        """
+        with self.condition:
+            self.running = False
+            self.wanted = []
+            self.cache.clear()
+            self.condition.notify_all()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
@@ -1,68 +1,208 @@
 import json
 import os
+import sqlite3
+from contextlib import contextmanager
+
+from src.config import PROGRESS_PATH, LEGACY_PROGRESS_PATH
+
+# Evento que se notifica cuando cambia el progreso de un nivel
+PROGRESS_CHANGED = "progress_changed"
 
 class ProgressTracker:
     """
     Clase que rastrea el progreso del jugador en el juego.
 
+    Es el único lugar donde se guarda el progreso. Los datos se guardan en una base de datos
+    SQLite (una fila por nivel, con su categoría, si está completo y su mejor tiempo) y se
+    mantienen en memoria, así que las consultas no leen el disco. Cada cambio es una sola
+    escritura pequeña y atómica; marcar de nuevo un nivel ya completo sin mejorar su tiempo no
+    escribe nada, y dentro de batch() los cambios se confirman juntos en una sola transacción.
+
     Atributos:
-        progress_file (str): Ruta al archivo de progreso del jugador.
-        progress (dict): Diccionario que contiene el progreso del jugador.
+        progress_file (str): Ruta a la base de datos del progreso del jugador.
+        progress (dict): Niveles completados por categoría, como {categoría: {nivel: True}}.
+        best_times (dict): Mejor tiempo de cada nivel completado, en segundos.
+        connection (sqlite3.Connection): Conexión con la base de datos.
+        batch_depth (int): Cantidad de bloques batch() abiertos; mientras sea mayor que 0 no se confirman los cambios.
+        writes (int): Transacciones confirmadas desde que se abrió la base de datos.
+        listeners (dict): Funciones suscritas a cada evento (PROGRESS_CHANGED).
     """
-    def __init__(self, progress_file="data/player_progress.json"):
+    def __init__(self, progress_file=PROGRESS_PATH, legacy_file=LEGACY_PROGRESS_PATH):
         """
         Inicializa una instancia de la clase ProgressTracker.
 
+        Si la base de datos no existe y hay un archivo de progreso JSON de una versión anterior,
+        su contenido se importa una sola vez.
+
         Args:
-            progress_file (str, optional): Ruta al archivo de progreso del jugador. Por defecto es "data/player_progress.json".
+            progress_file (str, optional): Ruta a la base de datos del progreso. Por defecto es config.PROGRESS_PATH.
+            legacy_file (str, optional): Ruta al archivo JSON de versiones anteriores. Por defecto es config.LEGACY_PROGRESS_PATH.
         """
         self.progress_file = progress_file
-        self.progress = self.load_progress()
+        self.progress = {}
+        self.best_times = {}
+        self.batch_depth = 0
+        self.writes = 0
+        self.listeners = {PROGRESS_CHANGED: []}
+        directory = os.path.dirname(progress_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(progress_file)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS levels ("
+            "level TEXT PRIMARY KEY, category TEXT NOT NULL, completed INTEGER NOT NULL DEFAULT 0, best_time REAL)")
+        self.connection.commit()
+        self.load_progress()
+        if not self.progress and legacy_file and os.path.exists(legacy_file):
+            self.import_legacy(legacy_file)
 
     def load_progress(self):
         """
-        Carga el progreso del jugador desde un archivo JSON.
+        Carga en memoria el progreso guardado en la base de datos.
 
         Returns:
             dict: Diccionario que contiene el progreso del jugador.
         """
+        self.progress = {}
+        self.best_times = {}
+        for level, category, completed, best_time in self.connection.execute(
+                "SELECT level, category, completed, best_time FROM levels"):
+            if completed:
+                self.progress.setdefault(category, {})[level] = True
+            if best_time is not None:
+                self.best_times[level] = best_time
+        return self.progress
+
+    def import_legacy(self, legacy_file):
+        """
+        Importa el progreso de un archivo JSON de una versión anterior.
 
-        if os.path.exists(self.progress_file):
-            with open(self.progress_file, 'r') as f:
-                return json.load(f)
-        return {}
+        Args:
+            legacy_file (str): Ruta al archivo JSON, con el formato {categoría: {nivel: True}}.
+        """
+        try:
+            with open(legacy_file, 'r') as f:
+                legacy = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error importando el progreso anterior: {str(e)}")
+            return
+        with self.batch():
+            for category, levels in legacy.items():
+                for level_name, completed in levels.items():
+                    if completed:
+                        self.mark_level_complete(str(category), level_name)
+
+    @contextmanager
+    def batch(self):
+        """
+        Agrupa varios cambios en una sola transacción, que se confirma al salir del bloque.
+        """
+        self.batch_depth += 1
+        try:
+            yield self
+        finally:
+            self.batch_depth -= 1
+            if self.batch_depth == 0:
+                self.commit()
+
+    def commit(self):
+        """
+        Confirma los cambios pendientes, si los hay y no hay un bloque batch() abierto.
+        """
+        if self.batch_depth == 0 and self.connection.in_transaction:
+            self.connection.commit()
+            self.writes += 1
 
     def save_progress(self):
         """
-        Guarda el progreso del jugador en un archivo JSON.
+        Confirma en el disco los cambios pendientes. Cada cambio se confirma solo, así que
+        solo hace falta llamarlo si se modificó la base de datos directamente.
         """
-        with open(self.progress_file, 'w') as f:
-            json.dump(self.progress, f)
+        self.commit()
 
-    def mark_level_complete(self, category, level_name):
+    def mark_level_complete(self, category, level_name, time=None):
         """
-        Marca un nivel como completado.
+        Marca un nivel como completado y guarda su tiempo si es el mejor.
 
         Args:
             category (str): Categoría del nivel (por ejemplo, "easy", "medium", "hard").
             level_name (str): Nombre del nivel.
+            time (float, optional): Tiempo en segundos con el que se completó el nivel.
+
+        Returns:
+            bool: True si el tiempo es un nuevo mejor tiempo para el nivel.
+        """
+        best_time = self.best_times.get(level_name)
+        new_best = time is not None and (best_time is None or time < best_time)
+        if self.is_level_complete(category, level_name) and not new_best:
+            return False
+
+        # Un nivel pertenece a una sola categoría
+        for levels in self.progress.values():
+            levels.pop(level_name, None)
+        self.progress.setdefault(category, {})[level_name] = True
+        if new_best:
+            self.best_times[level_name] = time
+        self.connection.execute(
+            "INSERT INTO levels (level, category, completed, best_time) VALUES (?, ?, 1, ?) "
+            "ON CONFLICT(level) DO UPDATE SET category = excluded.category, completed = 1, "
+            "best_time = COALESCE(excluded.best_time, levels.best_time)",
+            (level_name, category, self.best_times.get(level_name)))
+        self.commit()
+        self.emit(PROGRESS_CHANGED, category, level_name)
+        return new_best
+
+    def subscribe(self, event, callback):
+        """
+        Suscribe una función a un evento del progreso.
+
+        PROGRESS_CHANGED llama a callback(categoría, nivel) cada vez que un nivel se completa
+        o mejora su tiempo.
+
+        Args:
+            event (str): PROGRESS_CHANGED.
+            callback (function): Función a llamar.
         """
-        if category not in self.progress:
-            self.progress[category] = {}
-        self.progress[category][level_name] = True
-        self.save_progress()
+        if callback not in self.listeners[event]:
+            self.listeners[event].append(callback)
+
+    def unsubscribe(self, event, callback):
+        """
+        Cancela la suscripción de una función a un evento.
+
+        Args:
+            event (str): Evento al que se suscribió la función.
+            callback (function): Función suscrita.
+        """
+        if callback in self.listeners[event]:
+            self.listeners[event].remove(callback)
+
+    def emit(self, event, *args):
+        """
+        Notifica un evento a todas las funciones suscritas.
+
+        Args:
+            event (str): Evento a notificar.
+            *args: Datos del evento.
+        """
+        for callback in list(self.listeners[event]):
+            callback(*args)
 
     def is_level_complete(self, category, level_name):
         """
         Verifica si un nivel está completado.
 
         Args:
-            category (str): Categoría del nivel.
+            category (str): Categoría del nivel, o None para buscarlo en todas las categorías.
             level_name (str): Nombre del nivel.
 
         Returns:
             bool: True si el nivel está completado, False en caso contrario.
         """
+        if category is None:
+            return any(levels.get(level_name, False) for levels in self.progress.values())
         return self.progress.get(category, {}).get(level_name, False)
 
     def get_category_progress(self, category):
@@ -77,3 +217,23 @@ class ProgressTracker:
         """
         category_progress = self.progress.get(category, {})
         return len(category_progress)
+
+    def get_best_time(self, level_name):
+        """
+        Obtiene el mejor tiempo de un nivel.
+
+        Args:
+            level_name (str): Nombre del nivel.
+
+        Returns:
+            float: Mejor tiempo en segundos, o None si el nivel nunca se completó con tiempo.
+        """
+        return self.best_times.get(level_name)
+
+    def close(self):
+        """
+        Confirma los cambios pendientes y cierra la base de datos.
+        """
+        self.batch_depth = 0
+        self.commit()
+        self.connection.close()
@@ -0,0 +1,209 @@
+from collections import deque
+
+import numpy as np
+
+# Cada cambio guarda la celda, su valor anterior y su valor nuevo en 6 bytes
+CHANGE_DTYPE = np.dtype([("row", "<u2"), ("col", "<u2"), ("previous", "u1"), ("value", "u1")])
+
+
+class UndoLog:
+    """
+    Clase que guarda el historial para deshacer y rehacer, agrupado en trazos.
+
+    Un trazo son todas las celdas cambiadas entre begin_stroke y end_stroke (por ejemplo,
+    entre presionar y soltar el ratón); deshacer o rehacer un trazo completo cuesta
+    O(celdas del trazo). Los cambios se guardan en un arreglo circular de tamaño fijo:
+    cuando se llena, se descartan los trazos más antiguos.
+
+    Las posiciones de los cambios son absolutas y crecen siempre; la posición en el
+    arreglo es la posición absoluta módulo la capacidad.
+
+    Atributos:
+        capacity (int): Cantidad máxima de cambios guardados.
+        changes (numpy.ndarray): Arreglo circular de cambios (CHANGE_DTYPE).
+        strokes (collections.deque): Trazos como tuplas (inicio, fin) de posiciones absolutas, del más antiguo al más reciente.
+        cursor (int): Cantidad de trazos aplicados; los trazos desde cursor en adelante se pueden rehacer.
+        head (int): Posición absoluta donde se escribe el próximo cambio.
+        stroke_start (int): Posición absoluta donde empezó el trazo abierto, o None si no hay uno abierto.
+    """
+
+    def __init__(self, capacity=65536):
+        """
+        Inicializa una instancia de la clase UndoLog.
+
+        Args:
+            capacity (int, optional): Cantidad máxima de cambios guardados. Por defecto es 65536.
+        """
+        self.capacity = capacity
+        self.changes = np.zeros(capacity, dtype=CHANGE_DTYPE)
+        self.strokes = deque()
+        self.cursor = 0
+        self.head = 0
+        self.stroke_start = None
+
+    def begin_stroke(self):
+        """
+        Abre un trazo nuevo. Los cambios registrados hasta end_stroke se deshacen juntos.
+        """
+        self.end_stroke()
+        self.stroke_start = self.head
+
+    def end_stroke(self):
+        """
+        Cierra el trazo abierto, si tiene cambios.
+        """
+        if self.stroke_start is not None and self.head > self.stroke_start:
+            self.strokes.append((self.stroke_start, self.head))
+            self.cursor = len(self.strokes)
+        self.stroke_start = None
+
+    def record(self, row, col, previous, value):
+        """
+        Registra el cambio de una celda. Fuera de un trazo, el cambio forma un trazo propio.
+
+        El primer cambio de un trazo descarta los trazos que se podían rehacer.
+
+        Args:
+            row (int): Índice de la fila.
+            col (int): Índice de la columna.
+            previous (int): Valor anterior de la celda.
+            value (int): Valor nuevo de la celda.
+        """
+        single = self.stroke_start is None
+        if single:
+            self.stroke_start = self.head
+        if self.head == self.stroke_start:
+            self.discard_redo()
+            self.stroke_start = self.head
+
+        self.changes[self.head % self.capacity] = (row, col, previous, value)
+        self.head += 1
+        # Se descartan los trazos más antiguos que el arreglo circular ya sobrescribió
+        while self.strokes and self.strokes[0][0] < self.head - self.capacity:
+            self.strokes.popleft()
+            self.cursor -= 1
+        # Un trazo más largo que la capacidad pierde sus primeros cambios
+        self.stroke_start = max(self.stroke_start, self.head - self.capacity)
+
+        if single:
+            self.end_stroke()
+
+    def discard_redo(self):
+        """
+        Descarta los trazos deshechos, que ya no se podrán rehacer.
+        """
+        while len(self.strokes) > self.cursor:
+            self.strokes.pop()
+        self.head = self.strokes[-1][1] if self.strokes else self.head
+
+    def get_changes(self, start, end):
+        """
+        Obtiene los cambios entre dos posiciones absolutas.
+
+        Args:
+            start (int): Posición absoluta del primer cambio.
+            end (int): Posición absoluta siguiente al último cambio.
+
+        Returns:
+            numpy.ndarray: Los cambios, en el orden en que se registraron.
+        """
+        return self.changes[np.arange(start, end) % self.capacity]
+
+    def undo(self):
+        """
+        Deshace el último trazo aplicado.
+
+        Returns:
+            list: Tuplas (fila, columna, valor) a escribir, en orden inverso al registrado.
+        """
+        self.end_stroke()
+        if self.cursor == 0:
+            return []
+        self.cursor -= 1
+        changes = self.get_changes(*self.strokes[self.cursor])[::-1]
+        return list(zip(changes["row"].tolist(), changes["col"].tolist(), changes["previous"].tolist()))
+
+    def redo(self):
+        """
+        Rehace el último trazo deshecho.
+
+        Returns:
+            list: Tuplas (fila, columna, valor) a escribir, en el orden registrado.
+        """
+        self.end_stroke()
+        if self.cursor == len(self.strokes):
+            return []
+        changes = self.get_changes(*self.strokes[self.cursor])
+        self.cursor += 1
+        return list(zip(changes["row"].tolist(), changes["col"].tolist(), changes["value"].tolist()))
+
+    def can_undo(self):
+        """
+        Indica si hay algún trazo para deshacer.
+
+        Returns:
+            bool: True si hay un trazo aplicado.
+        """
+        return self.cursor > 0 or (self.stroke_start is not None and self.head > self.stroke_start)
+
+    def can_redo(self):
+        """
+        Indica si hay algún trazo para rehacer.
+
+        Returns:
+            bool: True si hay un trazo deshecho.
+        """
+        return self.cursor < len(self.strokes)
+
+    def get_state(self):
+        """
+        Obtiene el contenido del historial para guardarlo.
+
+        Returns:
+            dict: Diccionario con changes (cambios de todos los trazos, del más antiguo al más reciente),
+            stroke_lengths (cantidad de cambios de cada trazo) y cursor.
+        """
+        self.end_stroke()
+        if not self.strokes:
+            return {"changes": np.zeros(0, dtype=CHANGE_DTYPE), "stroke_lengths": [], "cursor": 0}
+        return {
+            "changes": self.get_changes(self.strokes[0][0], self.strokes[-1][1]),
+            "stroke_lengths": [end - start for start, end in self.strokes],
+            "cursor": self.cursor,
+        }
+
+    def set_state(self, state):
+        """
+        Reemplaza el historial por uno obtenido con get_state.
+
+        Si el historial guardado no cabe en la capacidad se conservan sus trazos más recientes.
+
+        Args:
+            state (dict): Diccionario con changes, stroke_lengths y cursor.
+        """
+        changes = np.asarray(state["changes"], dtype=CHANGE_DTYPE)
+        lengths = deque(state["stroke_lengths"])
+        cursor = state["cursor"]
+        total = len(changes)
+        while total > self.capacity:
+            length = lengths.popleft()
+            changes = changes[length:]
+            total -= length
+            cursor -= 1
+
+        self.changes[:total] = changes
+        self.strokes.clear()
+        self.stroke_start = None
+        self.head = 0
+        for length in lengths:
+            self.strokes.append((self.head, self.head + length))
+            self.head += length
+        self.cursor = max(0, cursor)
+
+    def clear(self):
+        """
+        Borra todo el historial.
+        """
+        self.strokes.clear()
+        self.cursor = 0
+        self.stroke_start = None
@@ -1,24 +1,61 @@
+from src.logic.line_solver import FILLED, EMPTY, UNKNOWN, solve_line
+
+
 def get_hint(grid, row_clues, col_clues):
     """
-    Proporciona una pista para el Nonogram, indicando una celda que debería ser llenada o vacía.
+    Proporciona una pista para el Nonogram, indicando una celda que se puede deducir lógicamente.
+
+    Resuelve cada fila y luego cada columna con el resolvedor de líneas sobre el estado
+    parcial de la cuadrícula y devuelve la primera celda forzada por su pista.
 
     Args:
-        grid (list): La cuadrícula actual del Nonogram.
+        grid (list): La cuadrícula actual del Nonogram (0 desconocida, 1 llena, 2 marcada con X).
         row_clues (list): Pistas para las filas.
         col_clues (list): Pistas para las columnas.
 
     Returns:
-        tuple: Una tupla (fila, columna, valor) indicando la celda y el valor correcto, o None si no hay pistas disponibles.
+        tuple: Una tupla (fila, columna, valor) indicando la celda y el valor deducido (1 llena, 2 vacía), o None si no hay pistas disponibles.
     """
     for row in range(len(grid)):
-        for col in range(len(grid[0])):
-            if grid[row][col] == 0:
-                if should_be_filled(grid, row, col, row_clues, col_clues):
-                    return row, col, 1
-                elif should_be_empty(grid, row, col, row_clues, col_clues):
-                    return row, col, -1
+        solved = solve_line(row_clues[row], grid[row])
+        if solved is None:
+            continue
+        for col, value in enumerate(solved):
+            if grid[row][col] == UNKNOWN and value != UNKNOWN:
+                return row, col, value
+
+    for col in range(len(grid[0]) if len(grid) else 0):
+        line = [grid[row][col] for row in range(len(grid))]
+        solved = solve_line(col_clues[col], line)
+        if solved is None:
+            continue
+        for row, value in enumerate(solved):
+            if line[row] == UNKNOWN and value != UNKNOWN:
+                return row, col, value
     return None
 
+def deduce_cell(grid, row, col, row_clues, col_clues):
+    """
+    Deduce el valor de una celda a partir de las pistas de su fila y su columna.
+
+    Args:
+        grid (list): La cuadrícula actual del Nonogram.
+        row (int): Índice de la fila.
+        col (int): Índice de la columna.
+        row_clues (list): Pistas para las filas.
+        col_clues (list): Pistas para las columnas.
+
+    Returns:
+        int: 1 si la celda debe llenarse, 2 si debe quedar vacía, o 0 si no se puede deducir.
+    """
+    solved_row = solve_line(row_clues[row], grid[row])
+    if solved_row is not None and solved_row[col] != UNKNOWN:
+        return solved_row[col]
+    solved_col = solve_line(col_clues[col], [grid[r][col] for r in range(len(grid))])
+    if solved_col is not None and solved_col[row] != UNKNOWN:
+        return solved_col[row]
+    return UNKNOWN
+
 def should_be_filled(grid, row, col, row_clues, col_clues):
     """
     Verifica si una celda debería ser llenada.
@@ -33,9 +70,7 @@ def should_be_filled(grid, row, col, row_clues, col_clues):
     Returns:
         bool: True si la celda debería ser llenada, False en caso contrario.
     """
-    row_filled = check_row(grid[row], row_clues[row])
-    col_filled = check_col([grid[r][col] for r in range(len(grid))], col_clues[col])
-    return row_filled and col_filled
+    return deduce_cell(grid, row, col, row_clues, col_clues) == FILLED
 
 def should_be_empty(grid, row, col, row_clues, col_clues):
     """
@@ -51,9 +86,7 @@ def should_be_empty(grid, row, col, row_clues, col_clues):
     Returns:
         bool: True si la celda debería estar vacía, False en caso contrario.
     """
-    row_empty = check_row(grid[row], row_clues[row], check_empty=True)
-    col_empty = check_col([grid[r][col] for r in range(len(grid))], col_clues[col], check_empty=True)
-    return row_empty or col_empty
+    return deduce_cell(grid, row, col, row_clues, col_clues) == EMPTY
 
 def check_row(row, row_clue, check_empty=False):
     """
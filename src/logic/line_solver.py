@@ -0,0 +1,176 @@
+from functools import lru_cache
+
+# Estados de celda, iguales a los que usa Nonogram.player_grid
+UNKNOWN = 0
+FILLED = 1
+EMPTY = 2
+
+
+def normalize_clue(clue):
+    """
+    Normaliza una pista de fila o columna a una tupla de bloques positivos.
+
+    Los archivos de nivel usan tanto [] como [0] para una línea vacía.
+
+    Args:
+        clue (list): Pista de la línea.
+
+    Returns:
+        tuple: Tupla con los largos de los bloques, vacía si la línea no tiene bloques.
+    """
+    if not clue:
+        return ()
+    return tuple(block for block in clue if block > 0)
+
+
+def solve_line(clue, line):
+    """
+    Deduce todas las celdas forzadas de una línea a partir de su pista y su estado parcial.
+
+    Usa programación dinámica sobre las posiciones posibles de cada bloque: una celda
+    desconocida queda forzada si en todas las ubicaciones válidas de los bloques
+    tiene el mismo valor. El costo es O(n·k) para una línea de n celdas y k bloques.
+
+    Args:
+        clue (list): Pista de la línea.
+        line (list): Estado actual de la línea (UNKNOWN, FILLED o EMPTY).
+
+    Returns:
+        tuple: La línea con las celdas deducidas, o None si la línea contradice la pista.
+    """
+    return _solve_line(normalize_clue(clue), tuple(line))
+
+
+def line_deductions(clue, line):
+    """
+    Obtiene solo las celdas nuevas que se pueden deducir en una línea.
+
+    Args:
+        clue (list): Pista de la línea.
+        line (list): Estado actual de la línea.
+
+    Returns:
+        list: Lista de tuplas (índice, valor) con las celdas deducidas, o None si hay contradicción.
+    """
+    solved = solve_line(clue, line)
+    if solved is None:
+        return None
+    return [(i, value) for i, value in enumerate(solved) if line[i] == UNKNOWN and value != UNKNOWN]
+
+
+@lru_cache(maxsize=8192)
+def _solve_line(clue, line):
+    """
+    Implementación cacheada de solve_line; recibe la pista y la línea como tuplas.
+    """
+    n = len(line)
+    k = len(clue)
+
+    # Sumas prefijas de celdas marcadas como vacías y como llenas
+    empties = [0] * (n + 1)
+    filled = [0] * (n + 1)
+    for i, cell in enumerate(line):
+        empties[i + 1] = empties[i] + (cell == EMPTY)
+        filled[i + 1] = filled[i] + (cell == FILLED)
+
+    # Espacio mínimo que ocupan los bloques [0, j) y los bloques [j, k)
+    before = [0] * (k + 1)
+    for j, block in enumerate(clue):
+        before[j + 1] = before[j] + block + (1 if j else 0)
+    after = [0] * (k + 1)
+    for j in range(k - 1, -1, -1):
+        after[j] = after[j + 1] + clue[j] + (1 if j < k - 1 else 0)
+    if after[0] > n:
+        return None
+    # Línea sin marcas: solo el solapamiento de los bloques más largos que la holgura fuerza celdas
+    if k and not empties[n] and not filled[n] and max(clue) <= n - after[0]:
+        return line
+
+    # prefix[j][i]: las celdas [0, i) pueden contener exactamente los bloques [0, j).
+    # Solo se calculan los i compatibles con los bloques restantes; el resto queda en False.
+    prefix = [[False] * (n + 1) for _ in range(k + 1)]
+    for i in range(n + 1):
+        if filled[i]:
+            break
+        prefix[0][i] = True
+    for j in range(1, k + 1):
+        block = clue[j - 1]
+        current = prefix[j]
+        previous = prefix[j - 1]
+        for i in range(before[j], n - after[j] + (0 if j == k else -1) + 1):
+            fits = line[i - 1] != FILLED and current[i - 1]
+            if not fits and empties[i] == empties[i - block]:
+                start = i - block
+                if start == 0:
+                    fits = j == 1
+                else:
+                    fits = line[start - 1] != FILLED and previous[start - 1]
+            current[i] = fits
+
+    if not prefix[k][n]:
+        return None
+
+    # suffix[j][i]: las celdas [i, n) pueden contener exactamente los bloques [j, k)
+    suffix = [[False] * (n + 1) for _ in range(k + 1)]
+    for i in range(n, -1, -1):
+        if filled[n] - filled[i]:
+            break
+        suffix[k][i] = True
+    for j in range(k - 1, -1, -1):
+        block = clue[j]
+        current = suffix[j]
+        following = suffix[j + 1]
+        for i in range(n - after[j], before[j] + (1 if j else 0) - 1, -1):
+            fits = line[i] != FILLED and current[i + 1]
+            if not fits and empties[i + block] == empties[i]:
+                end = i + block
+                if end == n:
+                    fits = j == k - 1
+                else:
+                    fits = line[end] != FILLED and following[end + 1]
+            current[i] = fits
+
+    # Celdas que pueden quedar vacías: existe un corte j entre bloques que pasa por ellas
+    can_be_empty = [False] * n
+    for j in range(k + 1):
+        current = prefix[j]
+        following = suffix[j]
+        for i in range(before[j], n - after[j]):
+            if line[i] != FILLED and current[i] and following[i + 1]:
+                can_be_empty[i] = True
+
+    # Celdas que pueden quedar llenas: cubiertas por alguna ubicación válida de un bloque
+    coverage = [0] * (n + 1)
+    for j, block in enumerate(clue):
+        first = before[j] + (1 if j else 0)
+        last = n - after[j]
+        for start in range(first, last + 1):
+            end = start + block
+            if empties[end] != empties[start]:
+                continue
+            if start == 0:
+                if j != 0:
+                    continue
+            elif line[start - 1] == FILLED or not prefix[j][start - 1]:
+                continue
+            if end == n:
+                if j != k - 1:
+                    continue
+            elif line[end] == FILLED or not suffix[j + 1][end + 1]:
+                continue
+            coverage[start] += 1
+            coverage[end] -= 1
+
+    result = list(line)
+    covered = 0
+    for i in range(n):
+        covered += coverage[i]
+        if line[i] != UNKNOWN:
+            continue
+        if covered and not can_be_empty[i]:
+            result[i] = FILLED
+        elif can_be_empty[i] and not covered:
+            result[i] = EMPTY
+        elif not covered:
+            return None
+    return tuple(result)
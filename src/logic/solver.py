@@ -0,0 +1,397 @@
+import time
+from collections import deque
+
+from src.logic.line_solver import UNKNOWN, FILLED, EMPTY, normalize_clue, _solve_line
+
+# Nodos de la búsqueda simple antes de reiniciarla probando celdas
+SIMPLE_SEARCH_NODES = 100
+
+
+class NonogramSolver:
+    """
+    Clase que resuelve un Nonogram a partir de sus pistas.
+
+    Propaga las deducciones de línea hasta un punto fijo usando una cola de líneas
+    modificadas. Cuando ya no se puede deducir nada, primero ramifica sobre la celda más
+    restringida, lo que basta para la mayoría de los puzzles. Si esa búsqueda no termina en
+    SIMPLE_SEARCH_NODES nodos, se reinicia probando celdas: las celdas desconocidas junto a
+    celdas conocidas (o en el borde) se fijan con los dos valores y se propagan; si uno lleva
+    a una contradicción, la celda toma el otro. Si ninguna celda queda forzada, se ramifica
+    sobre la que más deduce con ambos valores. La búsqueda se detiene al encontrar
+    max_solutions soluciones, lo que permite saber si un puzzle no tiene solución, tiene
+    una única o tiene varias. Con time_budget, la búsqueda también se detiene al agotarse el
+    tiempo; la propagación de la raíz siempre se completa.
+
+    Atributos:
+        row_clues (list): Pistas normalizadas de las filas.
+        col_clues (list): Pistas normalizadas de las columnas.
+        rows (int): Número de filas.
+        cols (int): Número de columnas.
+        max_solutions (int): Cantidad de soluciones a partir de la cual se detiene la búsqueda.
+        max_nodes (int): Límite de nodos de búsqueda, o None para no limitar.
+        time_budget (float): Segundos disponibles para la búsqueda, o None para no limitar.
+        solutions (list): Soluciones encontradas, como listas de listas de 0 y 1.
+        nodes (int): Nodos de búsqueda visitados.
+        propagations (int): Líneas resueltas durante la propagación, incluidas las de las pruebas.
+        probes (int): Valores de celda probados.
+        logic_solvable (bool): Indica si el puzzle se resolvió solo con lógica de líneas, sin probar celdas ni ramificar.
+        exhausted (bool): Indica si la búsqueda terminó antes de recorrer todo el espacio por el límite de nodos o de tiempo.
+    """
+
+    def __init__(self, row_clues, col_clues, max_solutions=2, max_nodes=None, time_budget=None):
+        """
+        Inicializa una instancia de la clase NonogramSolver.
+
+        Args:
+            row_clues (list): Pistas para las filas, con el mismo formato que los archivos de nivel.
+            col_clues (list): Pistas para las columnas.
+            max_solutions (int, optional): Soluciones a buscar antes de detenerse. Por defecto es 2, suficiente para verificar unicidad.
+            max_nodes (int, optional): Límite de nodos de búsqueda. Por defecto no hay límite.
+            time_budget (float, optional): Segundos disponibles para la búsqueda. Por defecto no hay límite.
+        """
+        self.row_clues = [normalize_clue(clue) for clue in row_clues]
+        self.col_clues = [normalize_clue(clue) for clue in col_clues]
+        self.rows = len(self.row_clues)
+        self.cols = len(self.col_clues)
+        self.max_solutions = max_solutions
+        self.max_nodes = max_nodes
+        self.time_budget = time_budget
+        self.deadline = None
+        self.solutions = []
+        self.nodes = 0
+        self.propagations = 0
+        self.probes = 0
+        self.logic_solvable = False
+        self.exhausted = False
+
+    @property
+    def status(self):
+        """
+        Obtiene el resultado de la búsqueda.
+
+        Returns:
+            str: "none" si no hay solución, "unique" si hay exactamente una, "multiple" si hay varias,
+                o "unknown" si se alcanzó el límite de nodos o de tiempo sin poder decidirlo.
+        """
+        if len(self.solutions) > 1:
+            return "multiple"
+        if self.exhausted:
+            return "unknown"
+        return "unique" if self.solutions else "none"
+
+    @property
+    def is_unique(self):
+        """
+        Verifica si el puzzle tiene exactamente una solución.
+
+        Returns:
+            bool: True si la solución es única, False en caso contrario.
+        """
+        return self.status == "unique"
+
+    def solve(self):
+        """
+        Resuelve el puzzle desde una cuadrícula vacía.
+
+        Returns:
+            NonogramSolver: La misma instancia, con los resultados en sus atributos.
+        """
+        self.solutions = []
+        self.nodes = 0
+        self.propagations = 0
+        self.probes = 0
+        self.logic_solvable = False
+        self.exhausted = False
+        self.deadline = None if self.time_budget is None else time.monotonic() + self.time_budget
+
+        all_lines = list(range(self.rows + self.cols))
+        grid = [[UNKNOWN] * self.cols for _ in range(self.rows)]
+        if not self.propagate(grid, all_lines):
+            self.nodes = 1
+            return self
+        self.logic_solvable = not any(UNKNOWN in line for line in grid)
+
+        simple_limit = SIMPLE_SEARCH_NODES if self.max_nodes is None else min(SIMPLE_SEARCH_NODES, self.max_nodes // 2)
+        if self.search([line[:] for line in grid], self.branch, simple_limit):
+            return self
+        if self.out_of_time():
+            self.exhausted = True
+            return self
+        # Las soluciones de la búsqueda simple se vuelven a encontrar al reiniciar
+        self.solutions = []
+        self.exhausted = not self.search(grid, self.probe, self.max_nodes)
+        return self
+
+    def search(self, grid, expand, max_nodes):
+        """
+        Recorre en profundidad los nodos que genera expand a partir de una cuadrícula propagada.
+
+        Args:
+            grid (list): Cuadrícula propagada de la raíz.
+            expand (callable): branch o probe; recibe una cuadrícula y sus líneas cambiadas y devuelve sus hijos.
+            max_nodes (int): Límite del total de nodos visitados, o None para no limitar.
+
+        Returns:
+            bool: True si la búsqueda terminó o encontró max_solutions soluciones, False si alcanzó el límite de nodos o de tiempo.
+        """
+        # Cada nodo es una cuadrícula ya propagada y las líneas que cambiaron al crearla
+        stack = [(grid, set(range(self.rows + self.cols)))]
+        while stack:
+            if (max_nodes is not None and self.nodes >= max_nodes) or self.out_of_time():
+                return False
+            grid, focus = stack.pop()
+            self.nodes += 1
+            children = expand(grid, focus)
+            # Un nodo interrumpido por el tiempo no se puede interpretar
+            if self.out_of_time():
+                return False
+            if children is None:
+                continue
+            if not children:
+                self.solutions.append([[1 if value == FILLED else 0 for value in line] for line in grid])
+                if len(self.solutions) >= self.max_solutions:
+                    return True
+                continue
+            # El primer hijo se explora primero
+            stack.extend(reversed(children))
+        return True
+
+    def branch(self, grid, focus):
+        """
+        Ramifica sobre la celda más restringida, propagando cada valor.
+
+        Args:
+            grid (list): Cuadrícula propagada.
+            focus (set): Líneas que cambiaron al crear la cuadrícula; no se usan.
+
+        Returns:
+            list: Lista vacía si la cuadrícula está resuelta, o las tuplas (cuadrícula, líneas cambiadas)
+            de los valores que no contradicen las pistas. None si ninguno es posible.
+        """
+        cell = self.most_constrained_cell(grid)
+        if cell is None:
+            return []
+        row, col = cell
+        children = []
+        for value in (FILLED, EMPTY):
+            child = [line[:] for line in grid]
+            child[row][col] = value
+            if self.propagate(child, [row, self.rows + col]):
+                children.append((child, None))
+        return children or None
+
+    def probe(self, grid, focus):
+        """
+        Prueba las celdas candidatas de una cuadrícula propagada hasta que ninguna quede forzada.
+
+        Se prueban las celdas desconocidas de las líneas de focus que están en el borde o junto a
+        una celda conocida, donde una prueba suele deducir más. Cada celda forzada se fija en el
+        lugar y la pasada siguiente solo revisa las líneas que cambiaron.
+
+        Args:
+            grid (list): Cuadrícula propagada; se modifica en el lugar con las celdas forzadas.
+            focus (set): Líneas que cambiaron desde la última prueba (filas 0..rows-1, columnas rows..rows+cols-1).
+
+        Returns:
+            list: Lista vacía si la cuadrícula quedó resuelta, o dos tuplas (cuadrícula, líneas cambiadas)
+            con los hijos de la celda elegida para ramificar, en el orden en que se exploran.
+            None si la cuadrícula no tiene solución o si se agotó el tiempo.
+        """
+        while True:
+            unknown = sum(line.count(UNKNOWN) for line in grid)
+            if not unknown:
+                return []
+            cells = self.probe_candidates(grid, focus)
+            if not cells:
+                cells = self.probe_candidates(grid, None)
+
+            before = [line[:] for line in grid]
+            forced = False
+            best = None
+            best_score = None
+            for row, col in cells:
+                if grid[row][col] != UNKNOWN:
+                    continue
+                if self.out_of_time():
+                    return None
+                results = []
+                for value in (FILLED, EMPTY):
+                    branch = [line[:] for line in grid]
+                    branch[row][col] = value
+                    self.probes += 1
+                    results.append(branch if self.propagate(branch, [row, self.rows + col]) else None)
+                filled, empty = results
+                if filled is None and empty is None:
+                    return None
+                if filled is None or empty is None:
+                    # Solo un valor es posible: la celda y todo lo que se deduce de ella quedan fijos
+                    grid[:] = filled if filled is not None else empty
+                    unknown = sum(line.count(UNKNOWN) for line in grid)
+                    forced = True
+                    continue
+                if forced:
+                    continue
+                # Se prefiere la celda que más deduce con los dos valores, así ambas ramas quedan más chicas
+                filled_known = unknown - sum(line.count(UNKNOWN) for line in filled)
+                empty_known = unknown - sum(line.count(UNKNOWN) for line in empty)
+                score = (filled_known * empty_known, filled_known + empty_known)
+                if best_score is None or score > best_score:
+                    best_score = score
+                    best = (filled, empty) if filled_known >= empty_known else (empty, filled)
+
+            if not forced:
+                return [(child, self.changed_lines(grid, child)) for child in best]
+            focus = self.changed_lines(before, grid)
+
+    def out_of_time(self):
+        """
+        Verifica si se agotó el tiempo de la búsqueda.
+
+        Returns:
+            bool: True si hay time_budget y ya pasó, False en caso contrario.
+        """
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def probe_candidates(self, grid, focus):
+        """
+        Obtiene las celdas desconocidas en el borde o junto a una celda conocida.
+
+        Args:
+            grid (list): Cuadrícula parcial.
+            focus (set): Líneas a revisar, o None para revisar todas.
+
+        Returns:
+            list: Tuplas (fila, columna), fila por fila.
+        """
+        cells = []
+        last_row = self.rows - 1
+        last_col = self.cols - 1
+        for row in range(self.rows):
+            line = grid[row]
+            if UNKNOWN not in line:
+                continue
+            row_in_focus = focus is None or row in focus
+            for col in range(self.cols):
+                if line[col] != UNKNOWN or not (row_in_focus or self.rows + col in focus):
+                    continue
+                if (row == 0 or col == 0 or row == last_row or col == last_col or line[col - 1] != UNKNOWN
+                        or line[col + 1] != UNKNOWN or grid[row - 1][col] != UNKNOWN or grid[row + 1][col] != UNKNOWN):
+                    cells.append((row, col))
+        return cells
+
+    def changed_lines(self, old, new):
+        """
+        Obtiene las líneas que difieren entre dos cuadrículas.
+
+        Args:
+            old (list): Cuadrícula anterior.
+            new (list): Cuadrícula nueva.
+
+        Returns:
+            set: Índices de las líneas cambiadas (filas 0..rows-1, columnas rows..rows+cols-1).
+        """
+        lines = set()
+        for row in range(self.rows):
+            old_line = old[row]
+            new_line = new[row]
+            if old_line != new_line:
+                lines.add(row)
+                lines.update(self.rows + col for col in range(self.cols) if old_line[col] != new_line[col])
+        return lines
+
+    def propagate(self, grid, dirty):
+        """
+        Aplica el resolvedor de líneas hasta que ninguna línea cambie.
+
+        Cada línea que gana celdas nuevas marca como pendientes las líneas que la cruzan.
+
+        Args:
+            grid (list): Cuadrícula parcial; se modifica en el lugar.
+            dirty (list): Índices de las líneas pendientes (filas 0..rows-1, columnas rows..rows+cols-1).
+
+        Returns:
+            bool: False si alguna línea contradice su pista, True en caso contrario.
+        """
+        queue = deque(dirty)
+        queued = [False] * (self.rows + self.cols)
+        for line_id in dirty:
+            queued[line_id] = True
+
+        while queue:
+            line_id = queue.popleft()
+            queued[line_id] = False
+            self.propagations += 1
+
+            # Las pistas ya están normalizadas, así que se usa directamente la versión cacheada
+            if line_id < self.rows:
+                row = grid[line_id]
+                solved = _solve_line(self.row_clues[line_id], tuple(row))
+                if solved is None:
+                    return False
+                for col, value in enumerate(solved):
+                    if row[col] != value:
+                        row[col] = value
+                        if not queued[self.rows + col]:
+                            queued[self.rows + col] = True
+                            queue.append(self.rows + col)
+            else:
+                col = line_id - self.rows
+                line = tuple(grid[row][col] for row in range(self.rows))
+                solved = _solve_line(self.col_clues[col], line)
+                if solved is None:
+                    return False
+                for row, value in enumerate(solved):
+                    if line[row] != value:
+                        grid[row][col] = value
+                        if not queued[row]:
+                            queued[row] = True
+                            queue.append(row)
+        return True
+
+    def most_constrained_cell(self, grid):
+        """
+        Elige la celda desconocida cuya fila y columna tienen menos celdas por decidir.
+
+        Args:
+            grid (list): Cuadrícula parcial.
+
+        Returns:
+            tuple: Una tupla (fila, columna), o None si no quedan celdas desconocidas.
+        """
+        row_unknown = [row.count(UNKNOWN) for row in grid]
+        col_unknown = [0] * self.cols
+        for row in grid:
+            for col, value in enumerate(row):
+                if value == UNKNOWN:
+                    col_unknown[col] += 1
+
+        best = None
+        best_score = None
+        for row in range(self.rows):
+            if not row_unknown[row]:
+                continue
+            line = grid[row]
+            for col in range(self.cols):
+                if line[col] == UNKNOWN:
+                    score = row_unknown[row] + col_unknown[col]
+                    if best_score is None or score < best_score:
+                        best = (row, col)
+                        best_score = score
+        return best
+
+
+def solve_puzzle(row_clues, col_clues, max_solutions=2, max_nodes=None, time_budget=None):
+    """
+    Resuelve un Nonogram a partir de sus pistas.
+
+    Args:
+        row_clues (list): Pistas para las filas.
+        col_clues (list): Pistas para las columnas.
+        max_solutions (int, optional): Soluciones a buscar antes de detenerse. Por defecto es 2.
+        max_nodes (int, optional): Límite de nodos de búsqueda. Por defecto no hay límite.
+        time_budget (float, optional): Segundos disponibles para la búsqueda. Por defecto no hay límite.
+
+    Returns:
+        NonogramSolver: El resolvedor con las soluciones, el estado y las estadísticas de la búsqueda.
+    """
+    return NonogramSolver(row_clues, col_clues, max_solutions, max_nodes, time_budget).solve()
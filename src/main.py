@@ -1,12 +1,94 @@
+import argparse
+import json
 import pygame
 import sys
 import os
+import time
 from src.Game import Game
 from src.ui.LevelSelectScreen import LevelSelectScreen
 from src.ui.Menu import Menu
 from src.ui.GameScreen import GameScreen
+from src.ui.JoystickCursor import JoystickCursor
+from src.config import DIRTY_RECT_RENDERING, PROFILE_ENV_VAR
+from src.utils import conversion
+from src.utils.input_recording import InputRecorder, load_recording, board_checksum, frame_time_summary
 
-def main():
+def parse_args(argv):
+    """
+    Lee las opciones de línea de comandos del juego.
+
+    Args:
+        argv (list): Argumentos de la línea de comandos, sin el nombre del programa.
+
+    Returns:
+        argparse.Namespace: Las opciones leídas.
+    """
+    parser = argparse.ArgumentParser(description="AtomicGram")
+    parser.add_argument("--record", metavar="ARCHIVO", help="Graba los eventos de entrada de la sesión en ARCHIVO.")
+    parser.add_argument("--replay", metavar="ARCHIVO", help="Reproduce una grabación de entrada y muestra los tiempos de fotograma.")
+    parser.add_argument("--realtime", action="store_true", help="Reproduce a 60 fotogramas por segundo en lugar de a toda velocidad.")
+    parser.add_argument("--headless", action="store_true", help="Ejecuta sin ventana ni sonido (drivers dummy de SDL).")
+    parser.add_argument("--report", metavar="ARCHIVO", help="Escribe en ARCHIVO el resultado de la reproducción en JSON.")
+    return parser.parse_args(argv)
+
+def replay_report(game, replay, frame, frame_times):
+    """
+    Resume una reproducción: tiempos de fotograma y si el tablero final coincide con el grabado.
+
+    Args:
+        game (Game): Instancia del juego.
+        replay (dict): Grabación reproducida (load_recording).
+        frame (int): Cantidad de fotogramas reproducidos.
+        frame_times (list): Tiempo de cada fotograma en segundos.
+
+    Returns:
+        dict: El resumen de la reproducción.
+    """
+    checksum = board_checksum(game.nonogram)
+    return {
+        "frames": frame,
+        "recorded_frames": replay["total_frames"],
+        "level": game.current_level,
+        "board_checksum": checksum,
+        "board_matches": replay["checksum"] is None or checksum == replay["checksum"],
+        "frame_times": frame_time_summary(frame_times),
+    }
+
+def render_frame(game, screen, background_image, current_screen, last_screen):
+    """
+    Dibuja un fotograma de la pantalla actual y lo envía a la ventana.
+
+    Args:
+        game (Game): Instancia del juego.
+        screen (pygame.Surface): Superficie de la ventana.
+        background_image (pygame.Surface): Imagen de fondo.
+        current_screen: Pantalla que se dibuja.
+        last_screen: Pantalla dibujada en el fotograma anterior, o None.
+    """
+    profiler = game.profiler
+    # Con dirty rects solo se envían a la pantalla las áreas que cambiaron desde el fotograma anterior
+    dirty_rects = None
+    if DIRTY_RECT_RENDERING and current_screen is last_screen and not game.needs_full_redraw:
+        dirty_rects = current_screen.draw_dirty(screen, background_image)
+        profiler.mark("draw_dirty", current_screen)
+    if dirty_rects is None:
+        screen.blit(background_image, (0, 0))
+        profiler.mark("background")
+        current_screen.draw(screen)
+        profiler.mark("draw", current_screen)
+        profiler.draw_overlay(screen)
+        pygame.display.flip()
+        game.needs_full_redraw = False
+    else:
+        # La superposición del perfilador se vuelve a copiar en cada fotograma, por si se dibujó algo debajo
+        overlay_rect = profiler.draw_overlay(screen)
+        if overlay_rect is not None:
+            dirty_rects.append(overlay_rect)
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+    profiler.mark("present")
+
+def main(argv=None):
     """
         Función principal que inicializa y ejecuta el juego AtomicGram.
 
@@ -20,9 +102,18 @@ def main():
     menu, game_screen, editor_screen, level_select_screen: Instancias de las diferentes pantallas del juego.
     screens: Diccionario que mapea los nombres de las pantallas a sus respectivas instancias.
     joystick_connected: Booleano que indica si hay un joystick conectado.
-    mouse_speed: Velocidad del cursor del ratón.
-    console_controller_x, console_controller_y: Coordenadas del cursor del ratón controlado por el joystick.
+    cursor: Cursor controlado por el joystick (ver JoystickCursor); también se usa al reproducir una grabación.
+    recorder: Grabador de los eventos de entrada, con --record.
+    replay: Grabación que reemplaza los eventos de entrada, con --replay.
+    scheduler: Decide cuánto esperar a los eventos entre fotogramas (ver RenderScheduler).
+
+    Args:
+        argv (list, optional): Opciones de línea de comandos (ver parse_args). Por defecto no se usa ninguna.
         """
+    args = parse_args(argv or [])
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
     joystick = None
     WINDOW_WIDTH = 1200
     WINDOW_HEIGHT = 900
@@ -39,8 +130,7 @@ def main():
         joystick = pygame.joystick.Joystick(0)
         joystick.init()
         joystick_connected = True
-    mouse_speed = 5
-    console_controller_x, console_controller_y = pygame.mouse.get_pos()
+    cursor = JoystickCursor((WINDOW_WIDTH, WINDOW_HEIGHT))
     game = Game(screen, joystick)
     #game.run()
     menu = Menu(game)
@@ -54,32 +144,83 @@ def main():
 
     }
 
+    recorder = None
+    if args.record:
+        recorder = InputRecorder(args.record, (WINDOW_WIDTH, WINDOW_HEIGHT), game.current_screen, game.current_level)
+    replay = None
+    if args.replay:
+        replay = load_recording(args.replay)
+        if replay["screen"] == "game" and replay["level"]:
+            game.start_level(replay["level"])
+        elif replay["screen"]:
+            game.set_screen(replay["screen"])
+
+    profiler = game.profiler
+    frame = 0
+    frame_times = []
+    last_screen = None
+    scheduler = game.render_scheduler
     while True:
         current_screen = screens[game.current_screen]
+        # Sin cambios pendientes se espera al próximo evento; la reproducción nunca espera
+        timeout = 0 if replay is not None else scheduler.get_timeout(game, current_screen, last_screen)
+        events = scheduler.get_events(timeout)
+        frame_start = time.perf_counter()
+        profiler.begin_frame()
+
+        if replay is not None:
+            # Durante la reproducción solo se usan los eventos grabados (y QUIT para poder cerrar)
+            events = [event for event in events if event.type == pygame.QUIT] + replay["frames"].get(frame, [])
+            if frame >= replay["total_frames"]:
+                events.append(pygame.event.Event(pygame.QUIT))
+        elif recorder is not None:
+            recorder.record(frame, events)
+        profiler.mark("events")
 
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
+                if recorder is not None:
+                    recorder.close(frame, board_checksum(game.nonogram))
+                if replay is not None:
+                    report = replay_report(game, replay, frame, frame_times)
+                    print(json.dumps(report, indent=2))
+                    if args.report:
+                        with open(args.report, "w") as f:
+                            json.dump(report, f, indent=2)
+                profiler.stop_capture(os.environ.get(PROFILE_ENV_VAR))
+                if game.level_loader is not None:
+                    game.level_loader.stop()
+                game.cancel_conversion()
+                game.progress_tracker.close()
+                conversion.shutdown()
                 pygame.quit()
                 sys.exit()
-            if joystick_connected and event.type == pygame.JOYAXISMOTION:
-                # Derecha o izquierda
-                x_axis = joystick.get_axis(0)
-                # Arriba o abajo
-                y_axis = joystick.get_axis(1)
-
-                console_controller_x += x_axis * mouse_speed
-                console_controller_y += y_axis * mouse_speed
-                mouse_x = max(0, min(console_controller_x, WINDOW_WIDTH))
-                mouse_y = max(0, min(console_controller_y, WINDOW_WIDTH))
-                pygame.mouse.set_pos(mouse_x, mouse_y)
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                game.invalidate()
+            # Los eventos del joystick llevan la posición del cursor, calculada solo con los eventos
+            event = cursor.handle_event(event)
+            if event.type == pygame.JOYAXISMOTION and replay is None:
+                pygame.mouse.set_pos(event.pos)
+            if profiler.handle_event(event):
+                # Al mostrar u ocultar la superposición hay que volver a dibujar lo que tapaba
+                game.invalidate()
+                continue
             current_screen.handle_event(event)
+        profiler.mark("handle_event", current_screen)
 
         current_screen.update()
-        screen.blit(background_image, (0, 0))
-        current_screen.draw(screen)
-        pygame.display.flip()
+        profiler.mark("update", current_screen)
+        render_frame(game, screen, background_image, current_screen, last_screen)
+        last_screen = current_screen
+        profiler.end_frame()
+        if replay is not None:
+            # Solo el informe de la reproducción usa los tiempos; en una sesión normal la lista crecería sin límite
+            frame_times.append(time.perf_counter() - frame_start)
+        frame += 1
 
-        clock.tick(60)
+        # A toda velocidad no se espera entre fotogramas; la grabación se reproduce por número de fotograma
+        if replay is None or args.realtime:
+            clock.tick(60)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(sys.argv[1:])
\ No newline at end of file
@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import unittest
+
+from PIL import Image
+
+from src.utils.batch_convert import batch_convert, find_images
+from src.utils.image_converter import image_to_nonogram
+
+class TestBatchConvert(unittest.TestCase):
+    """
+    Clase de prueba unitaria para la conversión de imágenes por lotes.
+
+    Métodos:
+        test_lote(): Prueba que cada combinación de imagen, tamaño y colores genera su archivo levelN.json.
+        test_numeracion_sin_huecos(): Prueba que las imágenes que no se pueden convertir no dejan huecos en la numeración.
+        test_busqueda_con_varios_colores(): Prueba que la búsqueda genera un nivel por cada cantidad de colores.
+    """
+
+    def test_lote(self):
+        """
+        Prueba que cada combinación de imagen, tamaño y colores genera su archivo levelN.json.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            input_dir = os.path.join(folder, "imagenes")
+            output_dir = os.path.join(folder, "niveles")
+            os.makedirs(input_dir)
+            os.makedirs(output_dir)
+            open(os.path.join(output_dir, "level3.json"), "w").close()
+            for i, color in enumerate([(0, 0, 0), (90, 90, 90)]):
+                image = Image.new("RGB", (80, 60), (255, 255, 255))
+                image.paste(color, (10 * i, 5, 50, 40))
+                image.save(os.path.join(input_dir, f"imagen{i}.png"))
+
+            images = find_images(input_dir)
+            summary = batch_convert(images, output_dir, sizes=(10, 15), workers=2)
+            levels = [entry["level"] for entry in summary["conversions"]]
+            self.assertEqual(levels, ["level4", "level5", "level6", "level7"])
+
+            with open(os.path.join(output_dir, "level5.json"), "r") as f:
+                level_data = json.load(f)
+            expected = image_to_nonogram(images[0], 15)
+            self.assertEqual([level_data["grid"], level_data["row_clues"], level_data["col_clues"]], expected)
+
+    def test_numeracion_sin_huecos(self):
+        """
+        Prueba que las imágenes que no se pueden convertir no dejan huecos en la numeración.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            paths = []
+            for name in ("a.png", "b.png", "c.png"):
+                paths.append(os.path.join(folder, name))
+                if name == "b.png":
+                    with open(paths[-1], "wb") as f:
+                        f.write(b"no es una imagen")
+                else:
+                    image = Image.new("RGB", (40, 40), (255, 255, 255))
+                    image.paste((0, 0, 0), (5, 5, 25, 30))
+                    image.save(paths[-1])
+
+            output_dir = os.path.join(folder, "niveles")
+            summary = batch_convert(paths, output_dir, sizes=(10,), workers=2, first_level=1)
+            entries = summary["conversions"]
+            self.assertEqual([entry.get("level") for entry in entries], ["level1", None, "level2"])
+            self.assertIn("error", entries[1])
+            self.assertEqual(sorted(os.listdir(output_dir)), ["level1.json", "level2.json"])
+
+    def test_busqueda_con_varios_colores(self):
+        """
+        Prueba que la búsqueda genera un nivel por cada cantidad de colores.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "imagen.png")
+            image = Image.new("RGB", (40, 40), (255, 255, 255))
+            image.paste((0, 0, 0), (5, 5, 25, 30))
+            image.save(path)
+
+            output_dir = os.path.join(folder, "niveles")
+            summary = batch_convert([path], output_dir, sizes=(10,), colors=(2, 3), workers=2, first_level=1, search=True)
+            entries = summary["conversions"]
+            self.assertEqual([(entry["colors"], entry["level"]) for entry in entries], [(2, "level1"), (3, "level2")])
+            self.assertEqual(sorted(os.listdir(output_dir)), ["level1.json", "level2.json"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from src.utils.benchmark import random_board, compare_results
+
+class TestBenchmark(unittest.TestCase):
+    """
+    Clase de prueba unitaria para las utilidades del benchmark.
+
+    Métodos:
+        test_tablero_reproducible(): Prueba que el tablero aleatorio es siempre el mismo para un tamaño.
+        test_comparacion(): Prueba la comparación de dos resultados.
+    """
+
+    def test_tablero_reproducible(self):
+        """
+        Prueba que el tablero aleatorio es siempre el mismo para un tamaño.
+        """
+        grid, row_clues, col_clues = random_board(15)
+        self.assertEqual([grid, row_clues, col_clues], random_board(15))
+        self.assertEqual((len(grid), len(grid[0]), len(row_clues), len(col_clues)), (15, 15, 15, 15))
+        self.assertNotEqual(grid, random_board(15, seed=1)[0])
+
+    def test_comparacion(self):
+        """
+        Prueba la comparación de dos resultados.
+        """
+        baseline = {"scenarios": {"menu_idle": {"p95_ms": 2.0}, "viejo": {"p95_ms": 1.0}}}
+        current = {"scenarios": {"menu_idle": {"p95_ms": 3.0}, "nuevo": {"p95_ms": 1.0}}}
+        self.assertEqual(compare_results(baseline, current), {"menu_idle": (2.0, 3.0, 1.5)})
+
+if __name__ == "__main__":
+    unittest.main()
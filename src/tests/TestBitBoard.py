@@ -0,0 +1,77 @@
+import unittest
+
+import pygame
+
+from src.Nonogram import Nonogram
+from src.logic.BitBoard import BitBoard, mask_to_clue
+
+class TestBitBoard(unittest.TestCase):
+    """
+    Clase de prueba unitaria para el tablero compacto BitBoard.
+
+    Métodos:
+        test_celdas_y_vista(): Prueba la lectura y escritura de celdas y la vista como lista de listas.
+        test_pistas_de_mascaras(): Prueba la extracción de pistas desde filas y columnas.
+        test_nonograma_bitset(): Prueba la validación de un Nonogram con el backend "bitset".
+    """
+
+    def test_celdas_y_vista(self):
+        """
+        Prueba la lectura y escritura de celdas y la vista como lista de listas.
+        """
+        grid = [[1, 0, 2], [0, 1, 1]]
+        board = BitBoard.from_list(grid)
+        self.assertEqual(board.tolist(), grid)
+        self.assertEqual(board, grid)
+        board[0][1] = 2
+        board.set(1, 2, 0)
+        self.assertEqual(board.get(0, 1), 2)
+        self.assertEqual(board[1][2], 0)
+        self.assertEqual(board.get_column(1), [2, 1])
+        self.assertEqual(len(board), 2)
+        self.assertEqual(len(board[0]), 3)
+        self.assertEqual(board[1][-1], 0)
+        for col in (3, -4):
+            with self.assertRaises(IndexError):
+                board[0][col]
+            with self.assertRaises(IndexError):
+                board[0][col] = 1
+        self.assertEqual(board.tolist(), [[1, 2, 2], [0, 1, 0]])
+
+    def test_pistas_de_mascaras(self):
+        """
+        Prueba la extracción de pistas desde filas y columnas.
+        """
+        self.assertEqual(mask_to_clue(0b0111001101), [1, 2, 3])
+        self.assertEqual(mask_to_clue(0), [])
+        board = BitBoard.from_list([[1, 1, 0, 1], [0, 1, 0, 1], [1, 2, 1, 1]])
+        self.assertEqual(board.row_clue(0), [2, 1])
+        self.assertEqual(board.row_clue(2), [1, 2])
+        self.assertEqual(board.col_clue(1), [2])
+        self.assertEqual(board.col_clue(3), [3])
+
+    def test_nonograma_bitset(self):
+        """
+        Prueba la validación de un Nonogram con el backend "bitset".
+        """
+        pygame.font.init()
+        clues = [[5], [1, 1], [1, 1, 1], [1, 1], [5]]
+        nonograma = Nonogram([[1, 1, 1, 1, 1], [1, 0, 0, 0, 1], [1, 0, 1, 0, 1], [1, 0, 0, 0, 1], [1, 1, 1, 1, 1]],
+                             clues, clues, backend="bitset")
+        for i in range(5):
+            nonograma.set_cell(0, i, 1)
+            nonograma.set_cell(4, i, 1)
+        for i in range(3):
+            nonograma.set_cell(i + 1, 0, 1)
+            nonograma.set_cell(i + 1, 4, 1)
+        nonograma.set_cell(1, 1, 2)
+        self.assertFalse(nonograma.is_solved())
+        nonograma.set_cell(2, 2, 1)
+        self.assertTrue(nonograma.is_solved())
+        self.assertEqual(nonograma.get_player_grid()[1], [1, 2, 0, 0, 1])
+        nonograma.undo()
+        self.assertFalse(nonograma.is_solved())
+
+
+if __name__ == '__main__':
+    unittest.main()
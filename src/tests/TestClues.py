@@ -0,0 +1,48 @@
+import unittest
+
+import numpy as np
+import pygame
+
+from src.Nonogram import Nonogram
+from src.utils.clues import grid_clues
+
+class TestClues(unittest.TestCase):
+    """
+    Clase de prueba unitaria para la extracción vectorizada de pistas y el backend "numpy".
+
+    Métodos:
+        test_pistas_vectorizadas(): Prueba que las pistas vectorizadas coinciden con las de cada línea.
+        test_nonograma_numpy(): Prueba la validación y el conteo de errores con el backend "numpy".
+    """
+
+    def test_pistas_vectorizadas(self):
+        """
+        Prueba que las pistas vectorizadas coinciden con las de cada línea.
+        """
+        rng = np.random.default_rng(0)
+        grid = (rng.random((12, 9)) < 0.5).astype(np.uint8)
+        row_clues, col_clues = grid_clues(grid)
+        self.assertEqual(row_clues, [Nonogram.get_row_clue(row) or [] for row in grid.tolist()])
+        self.assertEqual(col_clues, [Nonogram.get_row_clue(col) or [] for col in grid.T.tolist()])
+        self.assertEqual(grid_clues([[0, 1, 1], [0, 0, 0]], empty=[0]), ([[2], [0]], [[0], [1], [1]]))
+
+    def test_nonograma_numpy(self):
+        """
+        Prueba la validación y el conteo de errores con el backend "numpy".
+        """
+        pygame.font.init()
+        solution = [[1, 0, 1], [0, 1, 0]]
+        nonograma = Nonogram(solution, [[1, 1], [1]], [[1], [1], [1]], backend="numpy")
+        self.assertEqual(nonograma.count_mismatches(), 3)
+        nonograma.set_cell(0, 0, 1)
+        nonograma.set_cell(0, 2, 1)
+        nonograma.set_cell(1, 0, 2)
+        self.assertFalse(nonograma.is_solved())
+        nonograma.set_cell(1, 1, 1)
+        self.assertTrue(nonograma.is_solved())
+        self.assertEqual(nonograma.count_mismatches(), 0)
+        self.assertEqual(nonograma.get_player_grid(), [[1, 0, 1], [2, 1, 0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
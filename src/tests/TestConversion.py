@@ -0,0 +1,84 @@
+import os
+import tempfile
+import time
+import unittest
+
+from PIL import Image
+
+from src.utils import conversion
+from src.utils.image_converter import image_to_nonogram, find_best_nonogram
+
+class TestConversion(unittest.TestCase):
+    """
+    Clase de prueba unitaria para la conversión de imágenes en un proceso aparte.
+
+    Métodos:
+        test_conversion_en_proceso(): Prueba que la conversión informa su progreso y da el mismo resultado que la directa.
+        test_cancelar(): Prueba que una conversión cancelada no entrega resultado.
+        test_busqueda_en_paralelo(): Prueba que la búsqueda evaluada en el pool elige lo mismo que la búsqueda directa.
+        test_error_en_busqueda(): Prueba que el error de una imagen ilegible llega a quien pide el resultado.
+    """
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.image_path = os.path.join(self.folder.name, "imagen.png")
+        image = Image.new("RGB", (64, 64), (255, 255, 255))
+        image.paste((0, 0, 0), (8, 8, 40, 56))
+        image.save(self.image_path)
+
+    def tearDown(self):
+        conversion.shutdown()
+        self.folder.cleanup()
+
+    def wait(self, job):
+        deadline = time.time() + 30
+        while not job.poll() and time.time() < deadline:
+            time.sleep(0.01)
+
+    def test_conversion_en_proceso(self):
+        """
+        Prueba que la conversión informa su progreso y da el mismo resultado que la directa.
+        """
+        job = conversion.ConversionJob(self.image_path)
+        self.wait(job)
+        self.assertEqual(job.result(), image_to_nonogram(self.image_path))
+        job.poll()
+        self.assertEqual(job.progress, 1.0)
+
+    def test_cancelar(self):
+        """
+        Prueba que una conversión cancelada no entrega resultado.
+        """
+        job = conversion.ConversionJob(self.image_path)
+        job.cancel()
+        self.assertTrue(job.poll())
+        with self.assertRaises(conversion.ConversionCancelled):
+            job.result()
+
+    def test_busqueda_en_paralelo(self):
+        """
+        Prueba que la búsqueda evaluada en el pool elige lo mismo que la búsqueda directa.
+        """
+        job = conversion.ConversionJob(self.image_path, sizes=(10, 12))
+        self.wait(job)
+        best = find_best_nonogram(self.image_path, (10, 12))["best"]
+        self.assertEqual(job.result(), [best["grid"], best["row_clues"], best["col_clues"]])
+        self.assertEqual(len(job.report["rejected"]), 11)
+        self.assertAlmostEqual(job.progress, 1.0)
+
+    def test_error_en_busqueda(self):
+        """
+        Prueba que el error de una imagen ilegible llega a quien pide el resultado.
+        """
+        broken_path = os.path.join(self.folder.name, "rota.png")
+        with open(broken_path, "wb") as f:
+            f.write(b"no es una imagen")
+        job = conversion.ConversionJob(broken_path, sizes=(10, 12))
+        self.wait(job)
+        self.assertTrue(job.done)
+        with self.assertRaises(OSError):
+            job.result()
+
+
+if __name__ == '__main__':
+    unittest.main()
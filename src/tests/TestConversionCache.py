@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+
+from src.utils.conversion_cache import ConversionCache, conversion_key, image_content_hash, is_custom_level
+
+class TestConversionCache(unittest.TestCase):
+    """
+    Clase de prueba unitaria para el caché de imágenes convertidas.
+
+    Métodos:
+        test_clave_estable(): Prueba que la clave depende del contenido de la imagen y de los parámetros.
+        test_expulsion_lru(): Prueba que al superar el tamaño máximo se borra la entrada usada hace más tiempo.
+    """
+
+    def test_clave_estable(self):
+        """
+        Prueba que la clave depende del contenido de la imagen y de los parámetros.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            first = os.path.join(folder, "a.png")
+            second = os.path.join(folder, "b.png")
+            for path in (first, second):
+                with open(path, "wb") as f:
+                    f.write(b"mismos bytes")
+            params = {"size": 20, "num_colors": 2}
+            key = conversion_key(image_content_hash(first), params)
+            self.assertEqual(key, conversion_key(image_content_hash(second), dict(params)))
+            self.assertNotEqual(key, conversion_key(image_content_hash(first), {"size": 25, "num_colors": 2}))
+            self.assertTrue(is_custom_level(key))
+            self.assertFalse(is_custom_level("level1"))
+
+    def test_expulsion_lru(self):
+        """
+        Prueba que al superar el tamaño máximo se borra la entrada usada hace más tiempo.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            data = {"grid": [[1] * 20] * 20, "row_clues": [[20]] * 20, "col_clues": [[20]] * 20}
+            cache = ConversionCache(folder, max_bytes=10 ** 6)
+            cache.put("custom_a", data)
+            entry_size = os.path.getsize(cache.get_path("custom_a"))
+            cache.max_bytes = entry_size * 2
+            cache.put("custom_b", data)
+            os.utime(cache.get_path("custom_a"), (1, 1))
+            os.utime(cache.get_path("custom_b"), (2, 2))
+            self.assertEqual(cache.get("custom_a")["grid"], data["grid"])
+            cache.put("custom_c", data)
+            self.assertIsNone(cache.get("custom_b"))
+            self.assertIsNotNone(cache.get("custom_a"))
+            self.assertIsNotNone(cache.get("custom_c"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from src.Game import Game
+from src.config import WINDOW_WIDTH, WINDOW_HEIGHT, CUSTOM_CACHE_MAX_BYTES
+from src.logic.ProgressTracker import ProgressTracker
+from src.ui.GameScreen import GameScreen
+from src.utils.conversion_cache import ConversionCache
+
+WINDOW_SIZE = (WINDOW_WIDTH, WINDOW_HEIGHT)
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class TestDirtyRects(unittest.TestCase):
+    """
+    Clase de prueba unitaria para el dibujado parcial de la pantalla del juego.
+
+    Métodos:
+        test_sin_cambios(): Prueba que un fotograma sin cambios no actualiza ningún área.
+        test_celda_y_deshacer(): Prueba que editar una celda y deshacerla actualizan solo el área de esa celda.
+        test_temporizador(): Prueba que el temporizador actualiza solo el área de su texto.
+    """
+
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        # Las fuentes, los sonidos y los niveles se cargan con rutas relativas a src
+        self.previous_dir = os.getcwd()
+        os.chdir(SRC_DIR)
+        pygame.display.init()
+        pygame.font.init()
+        pygame.joystick.init()
+        self.screen = pygame.display.set_mode(WINDOW_SIZE)
+        self.folder = tempfile.TemporaryDirectory()
+        self.progress_tracker = ProgressTracker(os.path.join(self.folder.name, "player_progress.sqlite3"), None)
+        conversion_cache = ConversionCache(os.path.join(self.folder.name, "user_created"), CUSTOM_CACHE_MAX_BYTES)
+        self.game = Game(self.screen, None, self.progress_tracker, conversion_cache)
+        self.game.start_custom_level([[[1, 0, 1], [0, 1, 0], [1, 1, 1]], [[1, 1], [1], [3]], [[1, 1], [2], [1, 1]]])
+        self.game.timer.stop()
+        self.game.timer.set_time(1.0)
+
+        self.background = pygame.Surface(WINDOW_SIZE)
+        self.background.fill((90, 120, 150))
+        self.game_screen = GameScreen(self.game)
+        self.game_screen.update()
+        self.screen.blit(self.background, (0, 0))
+        self.game_screen.draw(self.screen)
+
+    def tearDown(self):
+        if self.game.level_loader is not None:
+            self.game.level_loader.stop()
+        self.progress_tracker.close()
+        self.folder.cleanup()
+        pygame.display.quit()
+        os.chdir(self.previous_dir)
+
+    def test_sin_cambios(self):
+        """
+        Prueba que un fotograma sin cambios no actualiza ningún área.
+        """
+        self.assertEqual(self.game_screen.draw_dirty(self.screen, self.background), [])
+        self.game_screen.invalidate()
+        self.assertIsNone(self.game_screen.draw_dirty(self.screen, self.background))
+
+    def test_celda_y_deshacer(self):
+        """
+        Prueba que editar una celda y deshacerla actualizan solo el área de esa celda.
+        """
+        nonogram = self.game.nonogram
+        area = nonogram.get_cell_rect(1, 2).inflate(4, 4)
+        nonogram.begin_stroke()
+        nonogram.set_cell(1, 2, 1)
+        nonogram.end_stroke()
+        self.assertEqual(self.game_screen.draw_dirty(self.screen, self.background), [area])
+
+        self.game.undo()
+        self.assertEqual(nonogram.player_grid[1][2], 0)
+        self.assertEqual(self.game_screen.draw_dirty(self.screen, self.background), [area])
+        self.assertEqual(self.game_screen.draw_dirty(self.screen, self.background), [])
+
+    def test_temporizador(self):
+        """
+        Prueba que el temporizador actualiza solo el área de su texto.
+        """
+        previous_rect = self.game_screen.timer_rect
+        self.game.timer.set_time(12.3)
+        rects = self.game_screen.draw_dirty(self.screen, self.background)
+        self.assertEqual(rects, [previous_rect.union(self.game_screen.timer_rect)])
+        self.assertFalse(rects[0].colliderect(self.game.nonogram.board_rect))
+        self.assertEqual(self.game_screen.timer_text, "Time: 12.3s")
+        self.assertEqual(self.game_screen.draw_dirty(self.screen, self.background), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
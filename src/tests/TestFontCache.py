@@ -0,0 +1,41 @@
+import unittest
+
+import pygame
+
+from src.utils.font_cache import FontCache
+
+class TestFontCache(unittest.TestCase):
+    """
+    Clase de prueba unitaria para el caché de fuentes y textos.
+
+    Métodos:
+        test_fuente_compartida(): Prueba que una fuente se carga una sola vez por ruta y tamaño.
+        test_expulsion_lru(): Prueba que se descarta el texto usado hace más tiempo.
+    """
+
+    def test_fuente_compartida(self):
+        """
+        Prueba que una fuente se carga una sola vez por ruta y tamaño.
+        """
+        pygame.font.init()
+        cache = FontCache()
+        self.assertIs(cache.get_font(None, 24), cache.get_font(None, 24))
+        self.assertIsNot(cache.get_font(None, 24), cache.get_font(None, 36))
+        self.assertEqual(len(cache.fonts), 2)
+
+    def test_expulsion_lru(self):
+        """
+        Prueba que se descarta el texto usado hace más tiempo.
+        """
+        pygame.font.init()
+        cache = FontCache(max_texts=2)
+        first = cache.render(None, 24, "1", (0, 0, 0))
+        cache.render(None, 24, "2", (0, 0, 0))
+        self.assertIs(cache.render(None, 24, "1", (0, 0, 0)), first)
+        cache.render(None, 24, "3", (0, 0, 0))
+        self.assertEqual([key[2] for key in cache.texts], ["1", "3"])
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import pstats
+import tempfile
+import time
+import unittest
+
+import pygame
+
+from src.utils.frame_profiler import FrameProfiler, OVERLAY_KEY, OVERLAY_SIZE
+
+class TestFrameProfiler(unittest.TestCase):
+    """
+    Clase de prueba unitaria para el perfilador de fotogramas.
+
+    Métodos:
+        test_desactivado(): Prueba que desactivado no guarda ningún fotograma.
+        test_fases(): Prueba que se miden las fases, con el nombre de la pantalla, y el peor fotograma.
+        test_superposicion(): Prueba que la tecla de la superposición la muestra y activa la medición, y que ocultarla la desactiva.
+        test_captura(): Prueba que una captura de cProfile se escribe en un archivo .pstats.
+    """
+
+    def setUp(self):
+        pygame.font.init()
+
+    def test_desactivado(self):
+        """
+        Prueba que desactivado no guarda ningún fotograma.
+        """
+        profiler = FrameProfiler()
+        profiler.begin_frame()
+        profiler.mark("events")
+        profiler.end_frame()
+        self.assertEqual(len(profiler.frames), 0)
+        self.assertIsNone(profiler.draw_overlay(pygame.Surface((400, 300))))
+
+    def test_fases(self):
+        """
+        Prueba que se miden las fases, con el nombre de la pantalla, y el peor fotograma.
+        """
+        profiler = FrameProfiler(enabled=True)
+        for pause in (0.0, 0.02, 0.0):
+            profiler.begin_frame()
+            profiler.mark("events")
+            time.sleep(pause)
+            profiler.mark("draw", self)
+            profiler.end_frame()
+        stats = profiler.get_stats()
+        self.assertEqual(stats["frames"], 3)
+        self.assertEqual(stats["phases"][0][0], "TestFrameProfiler.draw")
+        worst_total, worst_phases = stats["worst"]
+        self.assertGreaterEqual(worst_total, 0.02)
+        self.assertGreaterEqual(worst_phases["TestFrameProfiler.draw"], 0.02)
+
+    def test_superposicion(self):
+        """
+        Prueba que la tecla de la superposición la muestra y activa la medición, y que ocultarla la desactiva.
+        """
+        profiler = FrameProfiler()
+        self.assertTrue(profiler.handle_event(pygame.event.Event(pygame.KEYDOWN, key=OVERLAY_KEY)))
+        self.assertFalse(profiler.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)))
+        self.assertTrue(profiler.enabled)
+        profiler.mark("events")
+        profiler.end_frame()
+        rect = profiler.draw_overlay(pygame.Surface((400, 300)))
+        self.assertEqual(rect.size, OVERLAY_SIZE)
+
+        profiler.toggle_overlay()
+        self.assertFalse(profiler.enabled)
+        self.assertIsNone(profiler.draw_overlay(pygame.Surface((400, 300))))
+        # Si la medición estaba activa desde el inicio, sigue activa al ocultar la superposición
+        profiler = FrameProfiler(enabled=True)
+        profiler.toggle_overlay()
+        profiler.toggle_overlay()
+        self.assertTrue(profiler.enabled)
+
+    def test_captura(self):
+        """
+        Prueba que una captura de cProfile se escribe en un archivo .pstats.
+        """
+        profiler = FrameProfiler()
+        profiler.start_capture()
+        sum(range(1000))
+        with tempfile.TemporaryDirectory() as folder:
+            path = profiler.stop_capture(os.path.join(folder, "sesion.pstats"))
+            self.assertTrue(pstats.Stats(path).total_calls > 0)
+        self.assertIsNone(profiler.profile)
+        self.assertIsNone(profiler.stop_capture())
+
+if __name__ == "__main__":
+    unittest.main()
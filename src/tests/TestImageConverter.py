@@ -0,0 +1,100 @@
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+from PIL import Image, ImageFilter
+
+from src.utils.image_converter import dark_ratio, open_image, image_to_nonogram, evaluate_candidate, choose_best_candidate, find_best_nonogram
+
+class TestImageConverter(unittest.TestCase):
+    """
+    Clase de prueba unitaria para la conversión de imágenes en Nonogramas.
+
+    Métodos:
+        test_proporcion_oscura(): Prueba el cálculo vectorizado de la proporción de píxeles oscuros.
+        test_jpeg_reducido(): Prueba que decodificar un JPEG a escala reducida da la misma cuadrícula en una imagen nítida.
+        test_png_reducido(): Prueba que una imagen PNG grande con paleta se reduce al abrirla y conserva la transparencia.
+        test_elegir_candidato(): Prueba que se elige el candidato con solución única y se explica el descarte de los demás.
+        test_busqueda_con_tiempo_limitado(): Prueba que todos los candidatos de 30x30 de una foto se evalúan en menos de un segundo.
+    """
+
+    def test_proporcion_oscura(self):
+        """
+        Prueba el cálculo vectorizado de la proporción de píxeles oscuros.
+        """
+        image = Image.new("L", (40, 1500), 255)
+        image.paste(0, (0, 0, 10, 1500))
+        self.assertAlmostEqual(dark_ratio(image), 0.25)
+
+    def test_jpeg_reducido(self):
+        """
+        Prueba que decodificar un JPEG a escala reducida da la misma cuadrícula en una imagen nítida.
+        """
+        image = Image.new("RGB", (2000, 1600), (255, 255, 255))
+        image.paste((0, 0, 0), (200, 200, 1000, 1400))
+        image.paste((0, 0, 0), (1300, 0, 1700, 800))
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "imagen.jpg")
+            image.save(path, quality=95)
+            exact = image_to_nonogram(path, draft=False)
+            self.assertEqual(image_to_nonogram(path), exact)
+        self.assertEqual(len(exact[0]), 20)
+        self.assertEqual(len(exact[1]), 20)
+
+    def test_png_reducido(self):
+        """
+        Prueba que una imagen PNG grande con paleta se reduce al abrirla y conserva la transparencia.
+        """
+        image = Image.new("RGBA", (2000, 1600), (0, 0, 0, 0))
+        image.paste((0, 0, 0, 255), (200, 200, 1000, 1400))
+        image = image.convert("P", palette=Image.ADAPTIVE, colors=4)
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "imagen.png")
+            image.save(path, transparency=image.getpixel((0, 0)))
+            reduced = open_image(path, 20)
+            self.assertEqual(reduced.size, (400, 320))
+            self.assertTrue(reduced.has_transparency_data)
+            self.assertEqual(open_image(path, 20, draft=False).size, (2000, 1600))
+            self.assertEqual(image_to_nonogram(path), image_to_nonogram(path, draft=False))
+
+    def test_elegir_candidato(self):
+        """
+        Prueba que se elige el candidato con solución única y se explica el descarte de los demás.
+        """
+        candidates = [
+            {"size": 2, "method": "adaptive", "grid": [[1, 0], [0, 1]], "row_clues": [[1], [1]], "col_clues": [[1], [1]]},
+            {"size": 2, "method": "threshold 128", "grid": [[0, 0], [0, 0]], "row_clues": [[0], [0]], "col_clues": [[0], [0]]},
+            {"size": 2, "method": "threshold 96", "grid": [[1, 1], [0, 1]], "row_clues": [[2], [1]], "col_clues": [[1], [2]]},
+        ]
+        evaluations = [evaluate_candidate(candidate) for candidate in candidates]
+        self.assertEqual(evaluations[0]["status"], "multiple")
+        self.assertEqual(evaluations[2]["rank"], 2)
+
+        report = choose_best_candidate(candidates, evaluations)
+        self.assertTrue(report["accepted"])
+        self.assertEqual(report["best"]["method"], "threshold 96")
+        self.assertEqual([rejected["reason"] for rejected in report["rejected"]],
+                         ["tiene varias soluciones", "la cuadrícula está vacía"])
+
+    def test_busqueda_con_tiempo_limitado(self):
+        """
+        Prueba que todos los candidatos de 30x30 de una foto se evalúan en menos de un segundo.
+        """
+        # Ruido suavizado: sin límite de tiempo, verificar la unicidad de estos candidatos tarda más de un minuto
+        noise = (np.random.default_rng(0).random((600, 600)) * 255).astype(np.uint8)
+        image = Image.fromarray(noise).filter(ImageFilter.GaussianBlur(8)).convert("RGB")
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "foto.jpg")
+            image.save(path)
+            start = time.perf_counter()
+            report = find_best_nonogram(path, (30,))
+            elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(report["best"]["size"], 30)
+        self.assertIn("se alcanzó el límite de búsqueda o de tiempo", [rejected["reason"] for rejected in report["rejected"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from src.ui.JoystickCursor import JoystickCursor
+from src.utils.input_recording import InputRecorder, load_recording, frame_time_summary
+
+class TestInputRecording(unittest.TestCase):
+    """
+    Clase de prueba unitaria para la grabación y reproducción de eventos de entrada.
+
+    Métodos:
+        test_ida_y_vuelta(): Prueba que los eventos grabados se recuperan en su fotograma y con sus datos.
+        test_grabacion_interrumpida(): Prueba que una grabación sin registro final se puede leer.
+        test_resumen_de_tiempos(): Prueba los percentiles de los tiempos de fotograma.
+        test_reproduccion_con_joystick(): Prueba que los eventos del joystick grabados mueven el cursor sin un joystick conectado.
+    """
+
+    def setUp(self):
+        pygame.init()
+        self.events = {
+            3: [pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(120, 340))],
+            4: [pygame.event.Event(pygame.MOUSEMOTION, pos=(150, 340), rel=(30, 0), buttons=(1, 0, 0)),
+                pygame.event.Event(pygame.VIDEOEXPOSE)],
+            5: [pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=(150, 340)),
+                pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, mod=0, scancode=41, unicode="\x1b")],
+        }
+
+    def record(self, path, close=True):
+        recorder = InputRecorder(path, (1200, 900), "game", "level7")
+        for frame in range(8):
+            recorder.record(frame, self.events.get(frame, []))
+        if close:
+            recorder.close(8, 1234)
+        else:
+            recorder.file.write(recorder.compressor.flush(2))
+            recorder.file.close()
+
+    def test_ida_y_vuelta(self):
+        """
+        Prueba que los eventos grabados se recuperan en su fotograma y con sus datos.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "sesion.rec")
+            self.record(path)
+            replay = load_recording(path)
+        self.assertEqual((replay["screen"], replay["level"], replay["screen_size"]), ("game", "level7", (1200, 900)))
+        self.assertEqual((replay["total_frames"], replay["checksum"]), (8, 1234))
+        self.assertEqual(sorted(replay["frames"]), [3, 4, 5])
+        motion = replay["frames"][4]
+        self.assertEqual(len(motion), 1)
+        self.assertEqual((motion[0].pos, motion[0].rel, motion[0].buttons), ((150, 340), (30, 0), (True, False, False)))
+        up, key = replay["frames"][5]
+        self.assertEqual((up.type, up.button, up.pos), (pygame.MOUSEBUTTONUP, 1, (150, 340)))
+        self.assertEqual((key.type, key.key), (pygame.KEYDOWN, pygame.K_ESCAPE))
+
+    def test_grabacion_interrumpida(self):
+        """
+        Prueba que una grabación sin registro final se puede leer.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "sesion.rec")
+            self.record(path, close=False)
+            replay = load_recording(path)
+        self.assertIsNone(replay["checksum"])
+        self.assertEqual(replay["total_frames"], 6)
+        self.assertEqual(replay["frames"][3][0].pos, (120, 340))
+
+    def test_resumen_de_tiempos(self):
+        """
+        Prueba los percentiles de los tiempos de fotograma.
+        """
+        summary = frame_time_summary([i / 1000 for i in range(1, 101)])
+        self.assertEqual(summary["frames"], 100)
+        self.assertAlmostEqual(summary["p50_ms"], 50.5)
+        self.assertAlmostEqual(summary["p99_ms"], 99.01)
+        self.assertEqual(summary["max_ms"], 100.0)
+        self.assertEqual(frame_time_summary([])["frames"], 0)
+
+    def test_reproduccion_con_joystick(self):
+        """
+        Prueba que los eventos del joystick grabados mueven el cursor sin un joystick conectado.
+        """
+        events = {frame: [pygame.event.Event(pygame.JOYAXISMOTION, instance_id=0, axis=0, value=1.0)] for frame in range(20)}
+        events[20] = [pygame.event.Event(pygame.JOYAXISMOTION, instance_id=0, axis=1, value=-0.5),
+                      pygame.event.Event(pygame.JOYAXISMOTION, instance_id=0, axis=0, value=0.0)]
+        events[21] = [pygame.event.Event(pygame.JOYBUTTONDOWN, instance_id=0, button=0)]
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "sesion.rec")
+            recorder = InputRecorder(path, (1200, 900), "menu")
+            for frame in range(22):
+                recorder.record(frame, events.get(frame, []))
+            recorder.close(22, 0)
+            replay = load_recording(path)
+
+        cursor = JoystickCursor((1200, 900))
+        replayed = [cursor.handle_event(event) for frame in range(replay["total_frames"])
+                    for event in replay["frames"].get(frame, [])]
+        self.assertEqual([event.pos for event in replayed[:3]], [(605, 450), (610, 450), (615, 450)])
+        self.assertEqual(cursor.pos, (705, 445))
+        self.assertEqual((replayed[-1].type, replayed[-1].button, replayed[-1].pos), (pygame.JOYBUTTONDOWN, 0, (705, 445)))
+        # El movimiento del mouse también mueve el cursor
+        cursor.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=(10, 20), rel=(0, 0), buttons=(0, 0, 0)))
+        self.assertEqual(cursor.handle_event(pygame.event.Event(pygame.JOYBUTTONDOWN, instance_id=0, button=1)).pos, (10, 20))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+from src.utils.level_index import compute_level_metadata, difficulty_for_score
+
+class TestLevelIndex(unittest.TestCase):
+    """
+    Clase de prueba unitaria para el índice de metadatos de los niveles.
+
+    Métodos:
+        test_metadatos(): Prueba las dimensiones, la densidad, los conteos de pistas y la dificultad de un nivel.
+        test_hash_estable(): Prueba que el hash depende solo del contenido del nivel.
+    """
+
+    def test_metadatos(self):
+        """
+        Prueba las dimensiones, la densidad, los conteos de pistas y la dificultad de un nivel.
+        """
+        level = {"grid": [[1, 0, 1], [0, 0, 0]], "row_clues": [[1, 1], [0]], "col_clues": [[1], [0], [1]]}
+        metadata = compute_level_metadata(level)
+        self.assertEqual((metadata["rows"], metadata["cols"]), (2, 3))
+        self.assertAlmostEqual(metadata["density"], 0.3333)
+        self.assertEqual((metadata["row_clue_count"], metadata["col_clue_count"]), (2, 2))
+        self.assertEqual(metadata["difficulty"], "easy")
+        self.assertEqual(difficulty_for_score(500), "medium")
+        self.assertEqual(difficulty_for_score(5000), "hard")
+
+    def test_hash_estable(self):
+        """
+        Prueba que el hash depende solo del contenido del nivel.
+        """
+        level = {"grid": [[1]], "row_clues": [[1]], "col_clues": [[1]]}
+        reordered = {"col_clues": [[1]], "row_clues": [[1]], "grid": [[1]], "name": "otro"}
+        self.assertEqual(compute_level_metadata(level)["hash"], compute_level_metadata(reordered)["hash"])
+        level["grid"] = [[0]]
+        self.assertNotEqual(compute_level_metadata(level)["hash"], compute_level_metadata(reordered)["hash"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+import pygame
+
+from src.logic.LevelLoader import LevelLoader
+
+class TestLevelLoader(unittest.TestCase):
+    """
+    Clase de prueba unitaria para la preparación de niveles en segundo plano.
+
+    Métodos:
+        test_nivel_preparado(): Prueba que un nivel pedido se entrega construido y con su capa estática.
+        test_cache_acotado(): Prueba que no se guardan más niveles que el máximo.
+        test_tablero_desplazable(): Prueba que no se compone la capa estática de un tablero que no entra en la vista.
+    """
+
+    def setUp(self):
+        pygame.font.init()
+        self.levels = {
+            f"level{i}": {"grid": [[1, 0], [0, 1]], "row_clues": [[1], [1]], "col_clues": [[1], [1]]}
+            for i in range(1, 5)
+        }
+
+    def test_nivel_preparado(self):
+        """
+        Prueba que un nivel pedido se entrega construido y con su capa estática.
+        """
+        loader = LevelLoader(self.levels.get, (900, 750))
+        loader.prefetch(["level1"])
+        nonogram = loader.take("level1")
+        self.assertIsNotNone(nonogram)
+        self.assertIsNotNone(nonogram.static_layer)
+        self.assertEqual(nonogram.grid, self.levels["level1"]["grid"])
+        self.assertIsNone(loader.take("level1"))
+        self.assertEqual((loader.hits, loader.misses), (1, 1))
+        loader.stop()
+
+    def test_cache_acotado(self):
+        """
+        Prueba que no se guardan más niveles que el máximo.
+        """
+        loader = LevelLoader(self.levels.get, (900, 750), max_cached=2)
+        loader.prefetch(["level1", "level2", "level3"])
+        self.assertIsNotNone(loader.take("level2"))
+        loader.prefetch(["level3", "level4"])
+        self.assertIsNotNone(loader.take("level4"))
+        self.assertLessEqual(len(loader.cache), 2)
+        loader.stop()
+
+    def test_tablero_desplazable(self):
+        """
+        Prueba que no se compone la capa estática de un tablero que no entra en la vista.
+        """
+        size = 100
+        grande = {"grid": [[(row + col) % 2 for col in range(size)] for row in range(size)],
+                  "row_clues": [[1] * (size // 2)] * size, "col_clues": [[1] * (size // 2)] * size}
+        levels = dict(self.levels, grande=grande)
+        loader = LevelLoader(levels.get, (1200, 900), view_area=pygame.Rect(20, 20, 1020, 860))
+        loader.prefetch(["grande", "level1"])
+        nonogram = loader.take("grande")
+        self.assertIsNotNone(nonogram.view_rect)
+        self.assertIsNone(nonogram.static_layer)
+        self.assertIsNotNone(loader.take("level1").static_layer)
+        loader.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
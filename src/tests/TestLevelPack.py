@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+
+from src.utils.level_pack import LevelPack, build_level_pack
+
+class TestLevelPack(unittest.TestCase):
+    """
+    Clase de prueba unitaria para el paquete de niveles compilado.
+
+    Métodos:
+        test_ida_y_vuelta(): Prueba que los niveles leídos del paquete son iguales a los originales.
+        test_archivo_invalido(): Prueba que se rechaza un archivo que no es un paquete de niveles.
+        test_paquete_truncado(): Prueba que un paquete truncado se rechaza con ValueError.
+    """
+
+    def test_ida_y_vuelta(self):
+        """
+        Prueba que los niveles leídos del paquete son iguales a los originales.
+        """
+        levels = {
+            "level1": {"grid": [[1, 0, 1], [0, 0, 0]], "row_clues": [[1, 1], [0]], "col_clues": [[1], [0], [1]]},
+            "level2": {"grid": [[1] * 200], "row_clues": [[200]], "col_clues": [[1]] * 200},
+        }
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "levels.pack")
+            build_level_pack(levels, path)
+            pack = LevelPack(path)
+            self.assertEqual(pack.keys(), ["level1", "level2"])
+            self.assertIn("level2", pack)
+            self.assertEqual(pack.load("level1"), levels["level1"])
+            self.assertEqual(pack.load("level2"), levels["level2"])
+            self.assertIsNone(pack.load("level3"))
+            pack.close()
+
+    def test_archivo_invalido(self):
+        """
+        Prueba que se rechaza un archivo que no es un paquete de niveles.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "levels.pack")
+            with open(path, "wb") as f:
+                f.write(b"\0" * 32)
+            with self.assertRaises(ValueError):
+                LevelPack(path)
+
+    def test_paquete_truncado(self):
+        """
+        Prueba que un paquete truncado se rechaza con ValueError.
+        """
+        levels = {f"level{i}": {"grid": [[1, 0]], "row_clues": [[1]], "col_clues": [[1], [0]]} for i in range(1, 11)}
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "levels.pack")
+            size = build_level_pack(levels, path)
+            with open(path, "rb") as f:
+                data = f.read()
+            for length in (0, 10, 30, size - 50, size - 1):
+                with open(path, "wb") as f:
+                    f.write(data[:length])
+                with self.assertRaises(ValueError):
+                    LevelPack(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from src.logic.line_solver import solve_line, line_deductions, UNKNOWN, FILLED, EMPTY
+from src.logic.hint_system import get_hint
+
+class TestLineSolver(unittest.TestCase):
+    """
+    Clase de prueba unitaria para el resolvedor de líneas y el sistema de pistas.
+
+    Métodos:
+        test_solapamiento(): Prueba que se deducen las celdas comunes a todas las ubicaciones de un bloque.
+        test_linea_parcial(): Prueba las deducciones sobre una línea con celdas ya marcadas.
+        test_contradiccion(): Prueba que una línea imposible se detecta.
+        test_pista_vacia(): Prueba que una pista [0] vacía toda la línea.
+        test_pista_logica(): Prueba que la pista del sistema es una deducción válida.
+    """
+
+    def test_solapamiento(self):
+        """
+        Prueba que se deducen las celdas comunes a todas las ubicaciones de un bloque.
+        """
+        self.assertEqual(solve_line([4], [UNKNOWN] * 6),
+                         (UNKNOWN, UNKNOWN, FILLED, FILLED, UNKNOWN, UNKNOWN))
+        self.assertEqual(solve_line([2, 2], [UNKNOWN] * 5),
+                         (FILLED, FILLED, EMPTY, FILLED, FILLED))
+
+    def test_linea_parcial(self):
+        """
+        Prueba las deducciones sobre una línea con celdas ya marcadas.
+        """
+        line = [UNKNOWN, FILLED, UNKNOWN, UNKNOWN, UNKNOWN, EMPTY, UNKNOWN]
+        self.assertEqual(line_deductions([3, 1], line), [(2, FILLED)])
+
+    def test_contradiccion(self):
+        """
+        Prueba que una línea imposible se detecta.
+        """
+        self.assertIsNone(solve_line([3], [UNKNOWN, EMPTY, UNKNOWN, EMPTY]))
+        self.assertIsNone(solve_line([1], [FILLED, FILLED, UNKNOWN]))
+
+    def test_pista_vacia(self):
+        """
+        Prueba que una pista [0] vacía toda la línea.
+        """
+        self.assertEqual(solve_line([0], [UNKNOWN] * 3), (EMPTY, EMPTY, EMPTY))
+
+    def test_pista_logica(self):
+        """
+        Prueba que la pista del sistema es una deducción válida.
+        """
+        grid = [[0] * 5 for _ in range(5)]
+        row_clues = [[5], [1, 1], [1, 1, 1], [1, 1], [5]]
+        col_clues = [[5], [1, 1], [1, 1, 1], [1, 1], [5]]
+        self.assertEqual(get_hint(grid, row_clues, col_clues), (0, 0, FILLED))
+        grid[0] = [1] * 5
+        grid[4] = [1] * 5
+        self.assertEqual(get_hint(grid, row_clues, col_clues), (2, 0, FILLED))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,7 @@ import unittest
 
 import pygame
 
-from src.Nonogram import Nonogram
+from src.Nonogram import Nonogram, LINE_COMPLETED, PUZZLE_SOLVED, BOARD_RESET
 
 class TestNonogram(unittest.TestCase):
     """
@@ -11,6 +11,9 @@ class TestNonogram(unittest.TestCase):
     Métodos:
         test_crear_tablero(): Prueba la creación de un tablero de Nonogram.
         test_validar_solucionado(): Prueba la validación de un Nonogram solucionado.
+        test_eventos_de_completado(): Prueba los eventos de línea completada y puzzle resuelto.
+        test_cargar_cuadricula_resuelta(): Prueba que reemplazar la cuadrícula por una resuelta emite PUZZLE_SOLVED.
+        test_capa_estatica(): Prueba que la capa estática se reutiliza entre fotogramas y se vuelve a crear al cambiar el tamaño de celda o de pantalla.
     """
 
     def test_crear_tablero(self):
@@ -39,6 +42,75 @@ class TestNonogram(unittest.TestCase):
         nonograma.set_cell(2, 2, 1)
         self.assertTrue(nonograma.is_solved())
 
+    def test_eventos_de_completado(self):
+        """
+        Prueba los eventos de línea completada y puzzle resuelto.
+        """
+        pygame.font.init()
+        nonograma = Nonogram([[1, 0], [1, 1]], [[1], [2]], [[2], [1]])
+        lineas = []
+        resueltos = []
+        nonograma.subscribe(LINE_COMPLETED, lambda kind, index: lineas.append((kind, index)))
+        nonograma.subscribe(PUZZLE_SOLVED, lambda: resueltos.append(True))
+        nonograma.set_cell(1, 0, 1)
+        nonograma.set_cell(1, 1, 1)
+        self.assertEqual(lineas, [("row", 1), ("col", 1)])
+        self.assertFalse(nonograma.is_solved())
+        nonograma.set_cell(0, 1, 2)
+        self.assertEqual(nonograma.mismatches, 1)
+        nonograma.set_cell(0, 0, 1)
+        self.assertEqual(lineas, [("row", 1), ("col", 1), ("row", 0), ("col", 0)])
+        self.assertEqual(resueltos, [True])
+        nonograma.undo()
+        self.assertFalse(nonograma.is_solved())
+        self.assertFalse(nonograma.row_matches[0])
+        nonograma.redo()
+        self.assertTrue(nonograma.is_solved())
+        self.assertEqual(resueltos, [True, True])
+
+    def test_cargar_cuadricula_resuelta(self):
+        """
+        Prueba que reemplazar la cuadrícula por una resuelta emite PUZZLE_SOLVED.
+        """
+        pygame.font.init()
+        nonograma = Nonogram([[1, 0], [1, 1]], [[1], [2]], [[2], [1]])
+        eventos = []
+        nonograma.subscribe(BOARD_RESET, lambda: eventos.append(BOARD_RESET))
+        nonograma.subscribe(PUZZLE_SOLVED, lambda: eventos.append(PUZZLE_SOLVED))
+        nonograma.set_player_grid([[1, 2], [0, 1]])
+        self.assertEqual(eventos, [BOARD_RESET])
+        nonograma.set_player_grid([[1, 2], [1, 1]])
+        self.assertTrue(nonograma.is_solved())
+        self.assertEqual(eventos, [BOARD_RESET, BOARD_RESET, PUZZLE_SOLVED])
+
+    def test_capa_estatica(self):
+        """
+        Prueba que la capa estática se reutiliza entre fotogramas y se vuelve a crear al cambiar el tamaño de celda o de pantalla.
+        """
+        pygame.font.init()
+        nonograma = Nonogram([[1, 0, 1], [0, 1, 0], [1, 1, 1]], [[1, 1], [1], [3]], [[1, 1], [2], [1, 1]])
+        pantalla = pygame.Surface((900, 750))
+        nonograma.draw_grid(pantalla)
+        capa = nonograma.static_layer
+        self.assertIsNotNone(capa)
+        self.assertEqual(capa.get_size(), (nonograma.board_rect.width + 4, nonograma.board_rect.height + 4))
+        nonograma.draw_grid(pantalla)
+        self.assertIs(nonograma.static_layer, capa)
+
+        # Con otro tamaño de celda cambian las medidas del tablero
+        self.assertTrue(nonograma.zoom(1))
+        nonograma.draw_grid(pantalla)
+        self.assertIsNot(nonograma.static_layer, capa)
+        self.assertGreater(nonograma.static_layer.get_width(), capa.get_width())
+        capa = nonograma.static_layer
+        nonograma.draw_grid(pantalla)
+        self.assertIs(nonograma.static_layer, capa)
+
+        # Con otra pantalla el tablero se vuelve a centrar
+        nonograma.draw_grid(pygame.Surface((1200, 900)))
+        self.assertIsNot(nonograma.static_layer, capa)
+        self.assertEqual(nonograma.static_layer_key, (nonograma.cell_size, (1200, 900), nonograma.theme))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
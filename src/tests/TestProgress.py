@@ -1,6 +1,8 @@
 import unittest
+import json
+import tempfile
 
-from src.logic.ProgressTracker import ProgressTracker
+from src.logic.ProgressTracker import ProgressTracker, PROGRESS_CHANGED
 import os
 
 
@@ -11,25 +13,101 @@ class TestProgress(unittest.TestCase):
     Métodos:
         test_un_nivel_completo(): Prueba si un nivel se marca como completo correctamente.
         test_validar_cantidad_niveles_comp(): Prueba si se valida correctamente la cantidad de niveles completados.
+        test_mejor_tiempo_una_escritura(): Prueba que completar un nivel es una sola escritura y que solo se guarda el mejor tiempo.
+        test_lote_y_persistencia(): Prueba que los cambios de un lote se confirman juntos y se recuperan al reabrir.
+        test_importar_json_anterior(): Prueba que el progreso JSON de versiones anteriores se importa una sola vez.
+        test_notificar_cambios(): Prueba que PROGRESS_CHANGED se notifica solo cuando el progreso cambia.
     """
     def test_un_nivel_completo(self):
         """
         Prueba si un nivel se marca como completo correctamente.
         """
-        os.makedirs(os.path.dirname("data/tests/progressTest1.json"), exist_ok=True)
-        progress = ProgressTracker("data/tests/progressTest1.json")
-        progress.mark_level_complete("easy", "level1")
-        self.assertTrue(progress.is_level_complete("easy", "level1"))
+        with tempfile.TemporaryDirectory() as folder:
+            progress = ProgressTracker(os.path.join(folder, "progressTest1.sqlite3"), None)
+            progress.mark_level_complete("easy", "level1")
+            self.assertTrue(progress.is_level_complete("easy", "level1"))
+            progress.close()
 
     def test_validar_cantidad_niveles_comp(self):
         """
         Prueba si se valida correctamente la cantidad de niveles completados.
         """
-        os.makedirs(os.path.dirname("data/tests/progressTest2.json"), exist_ok=True)
-        progress = ProgressTracker("data/tests/progressTest2.json")
-        progress.mark_level_complete("easy", "level1")
-        progress.mark_level_complete("easy", "level2")
-        self.assertEqual(progress.get_category_progress("easy"), 2)
+        with tempfile.TemporaryDirectory() as folder:
+            progress = ProgressTracker(os.path.join(folder, "progressTest2.sqlite3"), None)
+            progress.mark_level_complete("easy", "level1")
+            progress.mark_level_complete("easy", "level2")
+            self.assertEqual(progress.get_category_progress("easy"), 2)
+            progress.close()
+
+    def test_mejor_tiempo_una_escritura(self):
+        """
+        Prueba que completar un nivel es una sola escritura y que solo se guarda el mejor tiempo.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            progress = ProgressTracker(os.path.join(folder, "progress.sqlite3"), None)
+            self.assertTrue(progress.mark_level_complete("easy", "level1", 42.0))
+            self.assertEqual(progress.writes, 1)
+            self.assertFalse(progress.mark_level_complete("easy", "level1", 50.0))
+            self.assertFalse(progress.mark_level_complete("easy", "level1"))
+            self.assertEqual(progress.writes, 1)
+            self.assertTrue(progress.mark_level_complete("easy", "level1", 30.5))
+            self.assertEqual((progress.writes, progress.get_best_time("level1")), (2, 30.5))
+            progress.close()
+
+    def test_lote_y_persistencia(self):
+        """
+        Prueba que los cambios de un lote se confirman juntos y se recuperan al reabrir.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "progress.sqlite3")
+            progress = ProgressTracker(path, None)
+            with progress.batch():
+                progress.mark_level_complete("easy", "level1", 12.0)
+                progress.mark_level_complete("hard", "level9")
+                self.assertEqual(progress.writes, 0)
+            self.assertEqual(progress.writes, 1)
+            progress.close()
+
+            reopened = ProgressTracker(path, None)
+            self.assertTrue(reopened.is_level_complete(None, "level9"))
+            self.assertEqual(reopened.get_best_time("level1"), 12.0)
+            self.assertEqual(reopened.get_category_progress("easy"), 1)
+            reopened.close()
+
+    def test_importar_json_anterior(self):
+        """
+        Prueba que el progreso JSON de versiones anteriores se importa una sola vez.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            legacy = os.path.join(folder, "player_progress.json")
+            with open(legacy, "w") as f:
+                json.dump({"easy": {"level1": True, "level2": True}, "2": {"level20": True}}, f)
+            path = os.path.join(folder, "progress.sqlite3")
+            progress = ProgressTracker(path, legacy)
+            self.assertEqual(progress.get_category_progress("easy"), 2)
+            self.assertTrue(progress.is_level_complete("2", "level20"))
+            self.assertEqual(progress.writes, 1)
+            progress.close()
+
+            with open(legacy, "w") as f:
+                json.dump({"easy": {"level3": True}}, f)
+            reopened = ProgressTracker(path, legacy)
+            self.assertFalse(reopened.is_level_complete("easy", "level3"))
+            reopened.close()
+
+    def test_notificar_cambios(self):
+        """
+        Prueba que PROGRESS_CHANGED se notifica solo cuando el progreso cambia.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            progress = ProgressTracker(os.path.join(folder, "progress.sqlite3"), None)
+            changes = []
+            progress.subscribe(PROGRESS_CHANGED, lambda category, level: changes.append((category, level)))
+            progress.mark_level_complete("medium", "level12", 80.0)
+            progress.mark_level_complete("medium", "level12", 95.0)
+            progress.mark_level_complete("medium", "level12", 60.0)
+            self.assertEqual(changes, [("medium", "level12"), ("medium", "level12")])
+            progress.close()
 
 
 if __name__ == '__main__':
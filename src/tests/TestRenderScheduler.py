@@ -0,0 +1,74 @@
+import os
+import time
+import unittest
+from types import SimpleNamespace
+
+import pygame
+
+from src.utils.render_scheduler import RenderScheduler
+
+class Screen:
+    """
+    Pantalla mínima con un intervalo de actualización fijo.
+    """
+    def __init__(self, interval):
+        self.interval = interval
+
+    def get_refresh_interval(self):
+        return self.interval
+
+class TestRenderScheduler(unittest.TestCase):
+    """
+    Clase de prueba unitaria para el planificador de fotogramas.
+
+    Métodos:
+        test_espera(): Prueba cuánto se espera según la pantalla y los cambios pendientes.
+        test_eventos(): Prueba que un evento corta la espera y que sin eventos la espera vence.
+    """
+
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.display.set_mode((100, 100))
+        pygame.event.clear()
+        self.game = SimpleNamespace(needs_full_redraw=False, profiler=SimpleNamespace(overlay_visible=False))
+
+    def tearDown(self):
+        pygame.display.quit()
+
+    def test_espera(self):
+        """
+        Prueba cuánto se espera según la pantalla y los cambios pendientes.
+        """
+        scheduler = RenderScheduler(max_wait=1000)
+        idle, timer = Screen(None), Screen(100)
+        self.assertEqual(scheduler.get_timeout(self.game, idle, idle), 1000)
+        self.assertEqual(scheduler.get_timeout(self.game, timer, timer), 100)
+        self.assertEqual(scheduler.get_timeout(self.game, idle, timer), 0)
+        self.game.needs_full_redraw = True
+        self.assertEqual(scheduler.get_timeout(self.game, idle, idle), 0)
+        self.game.needs_full_redraw = False
+        self.game.profiler.overlay_visible = True
+        self.assertEqual(scheduler.get_timeout(self.game, idle, idle), 0)
+        self.assertEqual(RenderScheduler(enabled=False).get_timeout(SimpleNamespace(needs_full_redraw=False,
+                         profiler=SimpleNamespace(overlay_visible=False)), idle, idle), 0)
+
+    def test_eventos(self):
+        """
+        Prueba que un evento corta la espera y que sin eventos la espera vence.
+        """
+        scheduler = RenderScheduler(poll_interval=5)
+        start = time.perf_counter()
+        self.assertEqual(scheduler.get_events(30), [])
+        self.assertGreaterEqual(time.perf_counter() - start, 0.025)
+        self.assertEqual(scheduler.idle_frames, 1)
+
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+        start = time.perf_counter()
+        events = scheduler.get_events(1000)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual([event.type for event in events], [pygame.KEYDOWN])
+        self.assertEqual(scheduler.idle_frames, 1)
+
+if __name__ == "__main__":
+    unittest.main()
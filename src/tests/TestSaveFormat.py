@@ -0,0 +1,110 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+import zlib
+
+from src.logic.UndoLog import UndoLog
+from src.utils.save_format import HEADER_SIZE, encode_save, decode_save, write_save, read_save, get_save_path, list_slots
+
+class TestSaveFormat(unittest.TestCase):
+    """
+    Clase de prueba unitaria para el formato binario de las partidas guardadas.
+
+    Métodos:
+        test_ida_y_vuelta(): Prueba que una partida se recupera igual, con su tiempo e historial.
+        test_tamano_compacto(): Prueba que una partida de 100x100 ocupa mucho menos que en JSON.
+        test_datos_invalidos(): Prueba que un archivo que no es una partida se rechaza.
+        test_contenido_inconsistente(): Prueba que se rechaza una partida bien comprimida con celdas, cursor o cambios inválidos.
+        test_ranuras(): Prueba que cada nivel puede tener varias ranuras y que no quedan archivos temporales.
+    """
+
+    def setUp(self):
+        random.seed(17)
+        self.grid = [[random.choice((0, 0, 1, 2)) for _ in range(100)] for _ in range(100)]
+        self.undo_log = UndoLog()
+        for _ in range(50):
+            self.undo_log.begin_stroke()
+            for _ in range(10):
+                self.undo_log.record(random.randrange(100), random.randrange(100), random.randrange(3), random.randrange(3))
+            self.undo_log.end_stroke()
+        self.undo_log.undo()
+        self.undo_log.undo()
+        self.empty_state = UndoLog().get_state()
+
+    def test_ida_y_vuelta(self):
+        """
+        Prueba que una partida se recupera igual, con su tiempo e historial.
+        """
+        state = self.undo_log.get_state()
+        data = decode_save(encode_save(self.grid, 123.5, state))
+        self.assertEqual(data["player_grid"], self.grid)
+        self.assertEqual(data["timer"], 123.5)
+        self.assertEqual(data["undo_state"]["stroke_lengths"], state["stroke_lengths"])
+        self.assertEqual(data["undo_state"]["cursor"], 48)
+        self.assertEqual(data["undo_state"]["changes"].tolist(), state["changes"].tolist())
+
+        odd = [[1, 2, 0], [0, 1, 1], [2, 2, 2]]
+        self.assertEqual(decode_save(encode_save(odd, 0, self.empty_state))["player_grid"], odd)
+
+    def test_tamano_compacto(self):
+        """
+        Prueba que una partida de 100x100 ocupa mucho menos que en JSON.
+        """
+        state = self.undo_log.get_state()
+        encoded = encode_save(self.grid, 123.5, state)
+        as_json = json.dumps({"player_grid": self.grid, "timer": 123.5, "history": state["changes"].tolist()})
+        self.assertLess(len(encoded), 100 * 100 // 4 + 500 * 6 + 50 * 4 + 64)
+        self.assertLess(len(encoded) * 5, len(as_json))
+
+    def test_datos_invalidos(self):
+        """
+        Prueba que un archivo que no es una partida se rechaza.
+        """
+        with self.assertRaises(ValueError):
+            decode_save(b'{"player_grid": []}')
+        encoded = encode_save(self.grid, 1.0, self.empty_state)
+        with self.assertRaises(ValueError):
+            decode_save(encoded[:20])
+        # Un cuerpo comprimido correctamente pero truncado también se rechaza con ValueError
+        body = zlib.decompress(encoded[HEADER_SIZE:])
+        for size in (0, 4, 8, 20, len(body) - 1):
+            with self.assertRaises(ValueError):
+                decode_save(encoded[:HEADER_SIZE] + zlib.compress(body[:size]))
+
+    def test_contenido_inconsistente(self):
+        """
+        Prueba que se rechaza una partida bien comprimida con celdas, cursor o cambios inválidos.
+        """
+        grid = [row[:] for row in self.grid]
+        grid[5][7] = 3
+        with self.assertRaises(ValueError):
+            decode_save(encode_save(grid, 1.0, self.empty_state))
+
+        state = self.undo_log.get_state()
+        state["cursor"] = len(state["stroke_lengths"]) + 1
+        with self.assertRaises(ValueError):
+            decode_save(encode_save(self.grid, 1.0, state))
+
+        for field, value in (("row", 100), ("col", 100), ("value", 3)):
+            state = self.undo_log.get_state()
+            state["changes"] = state["changes"].copy()
+            state["changes"][field][4] = value
+            with self.assertRaises(ValueError):
+                decode_save(encode_save(self.grid, 1.0, state))
+
+    def test_ranuras(self):
+        """
+        Prueba que cada nivel puede tener varias ranuras y que no quedan archivos temporales.
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            for slot, timer in (("quicksave", 1.0), ("antes del final", 2.0)):
+                write_save(get_save_path(folder, "level3", slot), encode_save(self.grid, timer, self.empty_state))
+            self.assertEqual(list_slots(folder, "level3"), ["antes del final", "quicksave"])
+            self.assertEqual(list_slots(folder, "level4"), [])
+            self.assertEqual(read_save(get_save_path(folder, "level3", "antes del final"))["timer"], 2.0)
+            self.assertEqual(sorted(os.listdir(os.path.join(folder, "level3"))), ["antes del final.sav", "quicksave.sav"])
+
+if __name__ == "__main__":
+    unittest.main()
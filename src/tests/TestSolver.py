@@ -0,0 +1,79 @@
+import time
+import unittest
+
+import numpy as np
+
+from src.logic.solver import solve_puzzle
+from src.utils.clues import grid_clues
+
+class TestSolver(unittest.TestCase):
+    """
+    Clase de prueba unitaria para el resolvedor completo de Nonogramas.
+
+    Métodos:
+        test_solucion_unica(): Prueba que un puzzle con solución única se resuelve solo con lógica.
+        test_soluciones_multiples(): Prueba que se detecta un puzzle ambiguo.
+        test_sin_solucion(): Prueba que se detecta un puzzle sin solución.
+        test_tablero_aleatorio_grande(): Prueba que un tablero aleatorio de 50x50 con densidad 0.5 se decide rápido.
+        test_limite_de_tiempo(): Prueba que la búsqueda se detiene al agotar time_budget.
+    """
+
+    def test_solucion_unica(self):
+        """
+        Prueba que un puzzle con solución única se resuelve solo con lógica.
+        """
+        clues = [[5], [1, 1], [1, 1, 1], [1, 1], [5]]
+        solver = solve_puzzle(clues, clues)
+        self.assertEqual(solver.status, "unique")
+        self.assertTrue(solver.logic_solvable)
+        self.assertEqual(solver.solutions[0], [[1, 1, 1, 1, 1], [1, 0, 0, 0, 1], [1, 0, 1, 0, 1], [1, 0, 0, 0, 1], [1, 1, 1, 1, 1]])
+        self.assertGreater(solver.propagations, 0)
+
+    def test_soluciones_multiples(self):
+        """
+        Prueba que se detecta un puzzle ambiguo.
+        """
+        solver = solve_puzzle([[1], [1]], [[1], [1]])
+        self.assertEqual(solver.status, "multiple")
+        self.assertFalse(solver.logic_solvable)
+        self.assertGreater(solver.nodes, 1)
+
+    def test_sin_solucion(self):
+        """
+        Prueba que se detecta un puzzle sin solución.
+        """
+        solver = solve_puzzle([[2], [0]], [[0], [1]])
+        self.assertEqual(solver.status, "none")
+        self.assertEqual(solver.solutions, [])
+
+    def test_tablero_aleatorio_grande(self):
+        """
+        Prueba que un tablero aleatorio de 50x50 con densidad 0.5 se decide rápido.
+
+        Sin probar celdas, la búsqueda agotaba el límite de nodos en tableros como este.
+        """
+        grid = (np.random.default_rng(5).random((50, 50)) < 0.5).astype(np.uint8)
+        row_clues, col_clues = grid_clues(grid)
+        start = time.perf_counter()
+        solver = solve_puzzle(row_clues, col_clues, max_nodes=200)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(solver.status, "multiple")
+        self.assertLess(elapsed, 30)
+        for solution in solver.solutions:
+            self.assertEqual(grid_clues(np.array(solution)), (row_clues, col_clues))
+
+    def test_limite_de_tiempo(self):
+        """
+        Prueba que la búsqueda se detiene al agotar time_budget.
+        """
+        grid = (np.random.default_rng(4).random((50, 50)) < 0.5).astype(np.uint8)
+        row_clues, col_clues = grid_clues(grid)
+        start = time.perf_counter()
+        solver = solve_puzzle(row_clues, col_clues, time_budget=0.2)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(solver.status, "unknown")
+        self.assertLess(elapsed, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
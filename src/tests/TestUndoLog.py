@@ -0,0 +1,105 @@
+import unittest
+
+import pygame
+
+from src.Nonogram import Nonogram
+from src.logic.UndoLog import UndoLog
+
+class TestUndoLog(unittest.TestCase):
+    """
+    Clase de prueba unitaria para el historial agrupado en trazos.
+
+    Métodos:
+        test_trazo_completo(): Prueba que un arrastre se deshace y rehace de una sola vez.
+        test_rehacer_se_descarta(): Prueba que un cambio nuevo descarta los trazos deshechos, pero presionar sin cambiar nada no.
+        test_capacidad_acotada(): Prueba que al llenarse el arreglo circular se descartan los trazos más antiguos.
+        test_estado_guardado(): Prueba que el historial se recupera con get_state y set_state.
+    """
+
+    def setUp(self):
+        pygame.font.init()
+
+    def test_trazo_completo(self):
+        """
+        Prueba que un arrastre se deshace y rehace de una sola vez.
+        """
+        nonograma = Nonogram([[1] * 100] * 100, [[100]] * 100, [[100]] * 100)
+        nonograma.set_cell(0, 0, 2)
+        nonograma.begin_stroke()
+        for col in range(100):
+            nonograma.set_cell(5, col, 1)
+        nonograma.end_stroke()
+        self.assertEqual(len(nonograma.undo_log.strokes), 2)
+
+        nonograma.undo()
+        self.assertEqual(nonograma.get_player_grid()[5], [0] * 100)
+        self.assertEqual(nonograma.get_player_grid()[0][0], 2)
+        nonograma.redo()
+        self.assertEqual(nonograma.get_player_grid()[5], [1] * 100)
+        self.assertTrue(nonograma.row_matches[5])
+        nonograma.undo()
+        nonograma.undo()
+        self.assertEqual(nonograma.get_player_grid()[0][0], 0)
+        self.assertFalse(nonograma.undo_log.can_undo())
+
+    def test_rehacer_se_descarta(self):
+        """
+        Prueba que un cambio nuevo descarta los trazos deshechos, pero presionar sin cambiar nada no.
+        """
+        log = UndoLog()
+        log.record(0, 0, 0, 1)
+        log.record(0, 1, 0, 1)
+        self.assertEqual(log.undo(), [(0, 1, 0)])
+        log.begin_stroke()
+        log.end_stroke()
+        self.assertTrue(log.can_redo())
+        log.record(2, 2, 0, 2)
+        self.assertFalse(log.can_redo())
+        self.assertEqual(log.undo(), [(2, 2, 0)])
+        self.assertEqual(log.undo(), [(0, 0, 0)])
+        self.assertEqual(log.undo(), [])
+
+    def test_capacidad_acotada(self):
+        """
+        Prueba que al llenarse el arreglo circular se descartan los trazos más antiguos.
+        """
+        log = UndoLog(capacity=10)
+        for stroke in range(5):
+            log.begin_stroke()
+            for col in range(3):
+                log.record(stroke, col, 0, 1)
+            log.end_stroke()
+        self.assertEqual(len(log.strokes), 3)
+        self.assertEqual(log.undo(), [(4, 2, 0), (4, 1, 0), (4, 0, 0)])
+        log.undo()
+        log.undo()
+        self.assertEqual(log.undo(), [])
+
+        log.begin_stroke()
+        for col in range(15):
+            log.record(9, col, 0, 1)
+        log.end_stroke()
+        self.assertEqual([row[1] for row in log.undo()], list(range(14, 4, -1)))
+
+    def test_estado_guardado(self):
+        """
+        Prueba que el historial se recupera con get_state y set_state.
+        """
+        log = UndoLog()
+        for stroke in range(4):
+            log.begin_stroke()
+            for col in range(stroke + 1):
+                log.record(stroke, col, 0, 2)
+            log.end_stroke()
+        log.undo()
+        copy = UndoLog(capacity=8)
+        copy.set_state(log.get_state())
+        self.assertEqual(len(copy.strokes), 2)
+        self.assertTrue(copy.can_redo())
+        self.assertEqual(copy.redo(), [(3, 0, 2), (3, 1, 2), (3, 2, 2), (3, 3, 2)])
+        self.assertEqual(copy.undo(), [(3, 3, 0), (3, 2, 0), (3, 1, 0), (3, 0, 0)])
+        self.assertEqual(copy.undo(), [(2, 2, 0), (2, 1, 0), (2, 0, 0)])
+        self.assertEqual(copy.undo(), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+import os
+import unittest
+
+import numpy as np
+import pygame
+
+from src.Nonogram import Nonogram
+from src.config import CELL_SIZE, CELL_SIZE_STEP
+from src.ui.Minimap import Minimap
+from src.utils.clues import grid_clues
+
+SCREEN_SIZE = (1200, 900)
+VIEW_AREA = pygame.Rect(20, 20, 1020, 860)
+
+def random_nonogram(size, seed=0):
+    """
+    Crea un Nonogram cuadrado con una solución aleatoria.
+    """
+    grid = (np.random.default_rng(seed).random((size, size)) < 0.5).astype(np.uint8)
+    row_clues, col_clues = grid_clues(grid)
+    return Nonogram(grid.tolist(), row_clues, col_clues)
+
+class TestViewport(unittest.TestCase):
+    """
+    Clase de prueba unitaria para la vista desplazable del tablero y el minimapa.
+
+    Métodos:
+        test_tablero_que_entra(): Prueba que un tablero chico se dibuja completo y centrado.
+        test_desplazamiento(): Prueba los límites del desplazamiento y la celda bajo el cursor.
+        test_zoom(): Prueba que el zoom mantiene fijo el punto bajo el cursor.
+        test_dibujado_parcial(): Prueba que dibujar una celda da el mismo resultado que un dibujado completo.
+        test_minimapa(): Prueba que el minimapa sigue los cambios de las celdas.
+    """
+
+    def setUp(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        pygame.font.init()
+        self.screen = pygame.display.set_mode(SCREEN_SIZE)
+
+    def tearDown(self):
+        pygame.display.quit()
+
+    def test_tablero_que_entra(self):
+        """
+        Prueba que un tablero chico se dibuja completo y centrado.
+        """
+        nonograma = random_nonogram(10)
+        centrado = nonograma.get_centered_layout(SCREEN_SIZE)
+        nonograma.view_area = VIEW_AREA
+        nonograma.update_layout(SCREEN_SIZE)
+        self.assertIsNone(nonograma.view_rect)
+        self.assertEqual((nonograma.grid_offset, nonograma.board_rect), centrado)
+        self.assertEqual(nonograma.get_visible_range(), (0, 10, 0, 10))
+        self.assertFalse(nonograma.pan(100, 100))
+
+    def test_desplazamiento(self):
+        """
+        Prueba los límites del desplazamiento y la celda bajo el cursor.
+        """
+        nonograma = random_nonogram(100)
+        nonograma.view_area = VIEW_AREA
+        nonograma.update_layout(SCREEN_SIZE)
+        self.assertIsNotNone(nonograma.view_rect)
+        self.assertTrue(VIEW_AREA.contains(nonograma.board_rect))
+        self.assertEqual(nonograma.scroll, [0, 0])
+        self.assertFalse(nonograma.pan(-50, -50))
+
+        first_row, last_row, first_col, last_col = nonograma.get_visible_range()
+        self.assertEqual((first_row, first_col), (0, 0))
+        self.assertLess(last_row, 100)
+        self.assertLess(last_col, 100)
+        self.assertEqual(nonograma.cell_at(nonograma.get_cell_rect(3, 4).center), (3, 4))
+        self.assertIsNone(nonograma.cell_at(nonograma.get_cell_rect(99, 99).center))
+
+        # El desplazamiento se detiene en el borde del tablero
+        self.assertTrue(nonograma.pan(10 ** 6, 10 ** 6))
+        self.assertEqual(nonograma.get_visible_range()[1::2], (100, 100))
+        self.assertEqual(nonograma.get_cell_rect(99, 99).bottomright, nonograma.view_rect.bottomright)
+        self.assertEqual(nonograma.cell_at(nonograma.get_cell_rect(99, 99).center), (99, 99))
+        self.assertIsNone(nonograma.cell_at(nonograma.get_cell_rect(0, 0).center))
+
+        nonograma.center_view(50, 50)
+        self.assertEqual(nonograma.cell_at(nonograma.view_rect.center), (50, 50))
+
+    def test_zoom(self):
+        """
+        Prueba que el zoom mantiene fijo el punto bajo el cursor.
+        """
+        nonograma = random_nonogram(100)
+        nonograma.view_area = VIEW_AREA
+        nonograma.update_layout(SCREEN_SIZE)
+        nonograma.center_view(40, 60)
+        cursor = nonograma.get_cell_rect(45, 62).center
+        self.assertTrue(nonograma.zoom(2, cursor))
+        self.assertEqual(nonograma.cell_size, CELL_SIZE + 2 * CELL_SIZE_STEP)
+        self.assertEqual(nonograma.cell_at(cursor), (45, 62))
+        self.assertTrue(nonograma.zoom(-4, cursor))
+        self.assertEqual(nonograma.cell_at(cursor), (45, 62))
+        self.assertTrue(nonograma.zoom(-100))
+        self.assertFalse(nonograma.zoom(-1))
+
+    def test_dibujado_parcial(self):
+        """
+        Prueba que dibujar una celda da el mismo resultado que un dibujado completo.
+        """
+        nonograma = random_nonogram(60)
+        nonograma.view_area = VIEW_AREA
+        nonograma.update_layout(SCREEN_SIZE)
+        nonograma.center_view(30.3, 30.7)
+        fondo = pygame.Surface(SCREEN_SIZE)
+        fondo.fill((90, 120, 150))
+        first_row, last_row, first_col, last_col = nonograma.get_visible_range()
+
+        self.screen.blit(fondo, (0, 0))
+        nonograma.draw_grid(self.screen)
+        nonograma.draw_cells(self.screen)
+        cambios = [(first_row, first_col, 1), (first_row + 1, first_col + 2, 2), (30, 30, 1), (31, 30, 2),
+                   (last_row - 1, last_col - 1, 1), (0, 0, 1)]
+        for row, col, value in cambios:
+            nonograma.set_cell(row, col, value)
+            nonograma.draw_cell(self.screen, row, col, fondo)
+        parcial = pygame.surfarray.array3d(self.screen)
+
+        self.screen.blit(fondo, (0, 0))
+        nonograma.draw_grid(self.screen)
+        nonograma.draw_cells(self.screen)
+        np.testing.assert_array_equal(parcial, pygame.surfarray.array3d(self.screen))
+
+    def test_minimapa(self):
+        """
+        Prueba que el minimapa sigue los cambios de las celdas.
+        """
+        nonograma = random_nonogram(50)
+        nonograma.view_area = VIEW_AREA
+        nonograma.update_layout(SCREEN_SIZE)
+        minimapa = Minimap(pygame.Rect(1050, 680, 120, 120))
+        minimapa.attach(nonograma)
+        minimapa.draw(self.screen)
+        self.assertFalse(minimapa.dirty)
+
+        nonograma.set_cell(10, 20, 1)
+        nonograma.set_cell(49, 49, 2)
+        self.assertTrue(minimapa.dirty)
+        actualizado = pygame.surfarray.array3d(minimapa.scaled)
+        minimapa.scaled = None
+        minimapa.draw(self.screen)
+        np.testing.assert_array_equal(actualizado, pygame.surfarray.array3d(minimapa.scaled))
+
+        row, col = minimapa.get_board_position(minimapa.board_rect.center)
+        self.assertAlmostEqual(row, 25)
+        self.assertAlmostEqual(col, 25)
+        minimapa.attach(None)
+        nonograma.set_cell(0, 0, 1)
+        self.assertEqual(minimapa.cells, None)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import pygame
-import os
+
+from src.utils.font_cache import NEWSWEEKLY_FONT, get_font, render_text
 
 class Button:
     """
@@ -37,6 +38,22 @@ class Button:
         self.rect = pygame.Rect(x, y, width, height)
         self.callback = callback
         self.sound_manager = sound_manager
+        self.set_type(type)
+        self.border_color = (63, 48, 43)
+        self.border_width = 3
+        self.font = get_font(NEWSWEEKLY_FONT, 36)
+        self.joystick_connected = False
+        if pygame.joystick.get_count() > 0 and joystick is not None:
+            self.joystick = joystick
+            self.joystick_connected = True
+
+    def set_type(self, type):
+        """
+        Cambia el tipo del botón y sus colores.
+
+        Args:
+            type (int): Tipo de botón (0 para normal, 1 para completado).
+        """
         self.type = type
         if type == 1:
             self.color = (63, 48, 43)
@@ -44,26 +61,29 @@ class Button:
         else:
             self.color = (251, 226, 204)
             self.text_color = (63, 48, 43)
-        self.border_color = (63, 48, 43)
-        self.border_width = 3
-        font_path = os.path.join("assets", "fonts", "newsweekly", "newsweekly-Regular.ttf")
-        self.font = pygame.font.Font(font_path, 36)
-        self.joystick_connected = False
-        if pygame.joystick.get_count() > 0 and joystick is not None:
-            self.joystick = joystick
-            self.joystick_connected = True
 
-    def draw(self, screen):
+    def get_outer_rect(self):
+        """
+        Obtiene el área que ocupa el botón al dibujarse, incluido el borde.
+
+        Returns:
+            pygame.Rect: Rectángulo del botón con su borde.
+        """
+        return self.rect.inflate(self.border_width * 2, self.border_width * 2)
+
+    def draw(self, screen, origin=(0, 0)):
         """
         Dibuja el botón en la pantalla.
 
         Args:
             screen (pygame.Surface): Superficie de la pantalla donde se dibuja el botón.
+            origin (tuple, optional): Posición de la superficie en la pantalla, para dibujar en una superficie intermedia. Por defecto es (0, 0).
         """
-        pygame.draw.rect(screen, self.border_color, self.rect.inflate(self.border_width * 2, self.border_width * 2), border_radius=10)
-        pygame.draw.rect(screen, self.color, self.rect, border_radius=7)
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
+        rect = self.rect.move(-origin[0], -origin[1])
+        pygame.draw.rect(screen, self.border_color, rect.inflate(self.border_width * 2, self.border_width * 2), border_radius=10)
+        pygame.draw.rect(screen, self.color, rect, border_radius=7)
+        text_surface = render_text(NEWSWEEKLY_FONT, 36, self.text, self.text_color)
+        text_rect = text_surface.get_rect(center=rect.center)
         screen.blit(text_surface, text_rect)
 
     def handle_event(self, event):
@@ -74,9 +94,9 @@ class Button:
             event (pygame.event.Event): Evento a manejar.
         """
         mouse_pos = (0,0)
-        if self.joystick_connected and event.type == pygame.JOYBUTTONDOWN:
-            if self.joystick.get_button(0):
-                mouse_pos = pygame.mouse.get_pos()
+        # Los eventos del joystick traen la posición de su cursor (ver JoystickCursor)
+        if event.type == pygame.JOYBUTTONDOWN and event.button == 0 and hasattr(event, "pos"):
+            mouse_pos = event.pos
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mouse_pos = event.pos
         if self.rect.collidepoint(mouse_pos):
@@ -1,7 +1,9 @@
 import pygame
-import json
 from src.ui.Button import Button
+from src.ui.Minimap import Minimap
 from src.config import *
+from src.Nonogram import CELL_CHANGED, BOARD_RESET
+from src.utils.font_cache import font_cache, get_font, render_text
 
 class GameScreen:
     """
@@ -13,7 +15,17 @@ class GameScreen:
         last_cell (tuple): Última celda interactuada.
         joystick_connected (bool): Indica si hay un joystick conectado.
         buttons (list): Lista de botones en la pantalla del juego.
-        player_progress (dict): Progreso del jugador.
+        nonogram (Nonogram): Nonogram al que está suscrita la pantalla.
+        dirty_cells (set): Celdas modificadas desde el último dibujado, como tuplas (fila, columna).
+        full_redraw (bool): Indica si el próximo dibujado debe ser completo.
+        timer_text (str): Último texto dibujado del temporizador.
+        timer_rect (pygame.Rect): Área ocupada por el último texto del temporizador.
+        timer_surface (pygame.Surface): Último texto renderizado del temporizador, o None.
+        play_area (pygame.Rect): Área de la pantalla disponible para el tablero, a la izquierda de los botones.
+        minimap (Minimap): Miniatura del tablero, visible cuando el tablero no entra en play_area.
+        pointer (tuple): Última posición conocida del mouse, o None.
+        panning (bool): Indica si se está arrastrando la vista con el botón del medio.
+        minimap_drag (bool): Indica si se está arrastrando sobre el minimapa.
     """
     def __init__(self, game):
         """
@@ -25,6 +37,12 @@ class GameScreen:
         self.game = game
         self.mouse_button = None
         self.last_cell = None
+        self.nonogram = None
+        self.dirty_cells = set()
+        self.full_redraw = True
+        self.timer_text = None
+        self.timer_rect = pygame.Rect(0, 0, 0, 0)
+        self.timer_surface = None
         self.joystick_connected = False
         if pygame.joystick.get_count() > 0 and self.game.joystick is not None:
             self.joystick = self.game.joystick
@@ -49,28 +67,15 @@ class GameScreen:
             Button("Menu", start_x, start_y + 5 * (button_height + padding), BUTTON_WIDTH, BUTTON_HEIGHT,
                    self.return_to_menu, self.game.sound_manager, self.game.joystick)
         ]
-        self.load_player_progress()
-
-    def load_player_progress(self):
-        """
-        Carga el progreso del jugador desde un archivo JSON.
-        """
-        try:
-            with open("data/player_progress.json", "r") as f:
-                self.player_progress = json.load(f)
-        except FileNotFoundError:
-            self.player_progress = {
-                "easy": {},
-                "medium": {},
-                "hard": {}
-            }
-
-    def save_player_progress(self):
-        """
-        Guarda el progreso del jugador en un archivo JSON.
-        """
-        with open("data/player_progress.json", "w") as f:
-            json.dump(self.player_progress, f, indent=2)
+        buttons_left = min(button.rect.left for button in self.buttons)
+        self.play_area = pygame.Rect(PLAY_AREA_MARGIN, PLAY_AREA_MARGIN, buttons_left - 2 * PLAY_AREA_MARGIN,
+                                     screen_height - 2 * PLAY_AREA_MARGIN)
+        minimap_rect = pygame.Rect(0, 0, MINIMAP_SIZE, MINIMAP_SIZE)
+        minimap_rect.midtop = (self.buttons[-1].rect.centerx, self.buttons[-1].rect.bottom + 30)
+        self.minimap = Minimap(minimap_rect)
+        self.pointer = None
+        self.panning = False
+        self.minimap_drag = False
 
     def handle_event(self, event):
         """
@@ -79,22 +84,55 @@ class GameScreen:
         Args:
             event (pygame.event.Event): Evento a manejar.
         """
+        self.track_nonogram()
         if self.game.nonogram is None:
             print("Error: Nonograma no inicializado.")
             print(f"self.game.nonogram: {self.game.nonogram}")
             return
-        if self.joystick_connected and event.type == pygame.JOYBUTTONDOWN:
+        # Los eventos del joystick traen la posición de su cursor (ver JoystickCursor), así que
+        # también se atienden al reproducir una grabación sin un joystick conectado
+        if event.type == pygame.JOYBUTTONDOWN and hasattr(event, "pos"):
             self.joystick = event.button
-            mouse_pos = pygame.mouse.get_pos()
-            self.update_cell(mouse_pos, event.button)
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            self.mouse_button = event.button
-            self.update_cell(event.pos, event.button)
-        elif event.type == pygame.MOUSEBUTTONUP:
-            self.mouse_button = None
-            self.last_cell = None
-        elif event.type == pygame.MOUSEMOTION and self.mouse_button:
-            self.update_cell(event.pos, self.mouse_button)
+            # Los botones superiores (LB y RB) alejan y acercan el tablero
+            if event.button in (4, 5):
+                self.zoom(1 if event.button == 5 else -1, event.pos)
+            else:
+                self.update_cell(event.pos, event.button)
+        elif event.type == pygame.JOYAXISMOTION and hasattr(event, "pos"):
+            self.edge_pan(event.pos)
+        if event.type == pygame.MOUSEWHEEL:
+            self.zoom(event.y, self.pointer)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button not in (4, 5):
+            # La rueda también genera los botones 4 y 5; el zoom se atiende con MOUSEWHEEL
+            self.pointer = event.pos
+            if event.button == 2:
+                self.panning = True
+            elif event.button == 1 and self.minimap_contains(event.pos):
+                self.minimap_drag = True
+                self.center_on_minimap(event.pos)
+            else:
+                self.mouse_button = event.button
+                self.game.nonogram.begin_stroke()
+                self.update_cell(event.pos, event.button)
+        elif event.type == pygame.MOUSEBUTTONUP and event.button not in (4, 5):
+            if event.button == 2:
+                self.panning = False
+            elif self.minimap_drag:
+                self.minimap_drag = False
+            else:
+                self.mouse_button = None
+                self.last_cell = None
+                self.game.nonogram.end_stroke()
+        elif event.type == pygame.MOUSEMOTION:
+            self.pointer = event.pos
+            if self.panning:
+                self.pan(-event.rel[0], -event.rel[1])
+            elif self.minimap_drag:
+                self.center_on_minimap(event.pos)
+            elif self.mouse_button:
+                self.update_cell(event.pos, self.mouse_button)
+        elif event.type == pygame.KEYDOWN:
+            self.handle_key(event.key)
 
         for button in self.buttons:
             button.handle_event(event)
@@ -107,10 +145,9 @@ class GameScreen:
             pos (tuple): Posición del ratón.
             button (int): Botón del ratón presionado.
         """
-        x, y = pos
-        grid_x = (x - self.game.nonogram.grid_offset[0]) // self.game.nonogram.cell_size
-        grid_y = (y - self.game.nonogram.grid_offset[1]) // self.game.nonogram.cell_size
-        if 0 <= grid_x < self.game.nonogram.cols and 0 <= grid_y < self.game.nonogram.rows:
+        cell = self.game.nonogram.cell_at(pos)
+        if cell is not None:
+            grid_y, grid_x = cell
             current_cell = (grid_x, grid_y)
             if current_cell != self.last_cell:
                 if button == 1: #Click Izquierdo
@@ -118,27 +155,137 @@ class GameScreen:
                 elif button == 3: #Click Derecho
                     self.game.nonogram.set_cell(grid_y, grid_x, 2)
                 self.last_cell = current_cell
-        self.game.draw()
         self.game.update()
 
-    def update(self):
+    def handle_key(self, key):
         """
-        Actualiza el estado de la pantalla del juego.
+        Atiende las teclas de la vista del tablero: las flechas la desplazan y + y - cambian el zoom.
+
+        Args:
+            key (int): Tecla presionada.
+        """
+        directions = {pygame.K_LEFT: (-1, 0), pygame.K_RIGHT: (1, 0), pygame.K_UP: (0, -1), pygame.K_DOWN: (0, 1)}
+        if key in directions:
+            dx, dy = directions[key]
+            self.pan(dx * PAN_STEP, dy * PAN_STEP)
+        elif key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+            self.zoom(1)
+        elif key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.zoom(-1)
+
+    def pan(self, dx, dy):
         """
-        if self.game.nonogram is not None and self.game.nonogram.is_solved():
-            self.update_player_progress()
+        Desplaza la vista del tablero y pide un dibujado completo si se movió.
 
+        Args:
+            dx (int): Píxeles hacia la derecha.
+            dy (int): Píxeles hacia abajo.
+        """
+        if self.game.nonogram.pan(dx, dy):
+            self.invalidate()
 
-    def update_player_progress(self):
+    def zoom(self, steps, anchor=None):
         """
-        Actualiza el progreso del jugador.
+        Cambia el zoom del tablero y pide un dibujado completo si cambió.
+
+        Args:
+            steps (int): Pasos de zoom; positivos para acercar.
+            anchor (tuple, optional): Posición de la pantalla que se mantiene fija. Por defecto es el centro de la vista.
+        """
+        if self.game.nonogram.zoom(steps, anchor):
+            self.invalidate()
+
+    def edge_pan(self, pos):
         """
-        level_key = self.game.current_level
-        if level_key == "custom":
+        Desplaza la vista cuando el cursor del joystick está junto a un borde del área visible.
+
+        Args:
+            pos (tuple): Posición del cursor.
+        """
+        view = self.game.nonogram.view_rect
+        if view is None or not view.collidepoint(pos):
             return
-        difficulty = self.get_level_difficulty()
-        self.player_progress[difficulty][level_key] = True
-        self.save_player_progress()
+        dx = -PAN_STEP if pos[0] < view.left + EDGE_PAN_MARGIN else PAN_STEP if pos[0] >= view.right - EDGE_PAN_MARGIN else 0
+        dy = -PAN_STEP if pos[1] < view.top + EDGE_PAN_MARGIN else PAN_STEP if pos[1] >= view.bottom - EDGE_PAN_MARGIN else 0
+        if dx or dy:
+            self.pan(dx, dy)
+
+    def minimap_contains(self, pos):
+        """
+        Verifica si una posición está sobre el minimapa visible.
+
+        Args:
+            pos (tuple): Posición en la pantalla.
+
+        Returns:
+            bool: True si el minimapa está visible y pos está sobre él.
+        """
+        return self.game.nonogram.view_rect is not None and self.minimap.rect.collidepoint(pos)
+
+    def center_on_minimap(self, pos):
+        """
+        Centra la vista en el punto del tablero que corresponde a una posición del minimapa.
+
+        Args:
+            pos (tuple): Posición en la pantalla, sobre el minimapa.
+        """
+        position = self.minimap.get_board_position(pos)
+        if position is not None and self.game.nonogram.center_view(*position):
+            self.invalidate()
+
+    def track_nonogram(self):
+        """
+        Suscribe la pantalla a los cambios del tablero cuando el juego carga un Nonogram nuevo.
+        """
+        if self.game.nonogram is not self.nonogram:
+            self.nonogram = self.game.nonogram
+            self.invalidate()
+            self.panning = False
+            self.minimap_drag = False
+            if self.nonogram is not None:
+                self.nonogram.view_area = self.play_area
+                self.nonogram.subscribe(CELL_CHANGED, self.invalidate_cell)
+                self.nonogram.subscribe(BOARD_RESET, self.invalidate)
+            self.minimap.attach(self.nonogram)
+
+    def invalidate(self):
+        """
+        Pide que el próximo dibujado de la pantalla sea completo.
+        """
+        self.full_redraw = True
+        self.dirty_cells.clear()
+
+    def invalidate_cell(self, row, col):
+        """
+        Marca una celda para volver a dibujarla en el próximo dibujado parcial.
+
+        Args:
+            row (int): Índice de la fila.
+            col (int): Índice de la columna.
+        """
+        if not self.full_redraw:
+            self.dirty_cells.add((row, col))
+
+    def update(self):
+        """
+        Actualiza el estado de la pantalla del juego.
+
+        El juego guarda el progreso al recibir el evento PUZZLE_SOLVED, así que aquí solo se
+        verifica si hay un Nonogram nuevo al que suscribirse.
+        """
+        self.track_nonogram()
+
+    def get_refresh_interval(self):
+        """
+        Obtiene cada cuánto hay que actualizar la pantalla sin eventos.
+
+        Returns:
+            int: TIMER_REFRESH_MS mientras corre el temporizador, o None si está detenido.
+        """
+        if self.game.timer.is_running:
+            return TIMER_REFRESH_MS
+        return None
+
 
     def get_level_difficulty(self):
         """
@@ -147,13 +294,7 @@ class GameScreen:
         Returns:
             str: Dificultad del nivel ("easy", "medium" o "hard").
         """
-        s = int(''.join(x for x in self.game.current_level if x.isdigit()))
-        if s <= 20:
-            return "easy"
-        elif s <= 40:
-            return "medium"
-        else:
-            return "hard"
+        return self.game.get_level_difficulty(self.game.current_level)
 
     def draw(self, screen):
         """
@@ -165,42 +306,47 @@ class GameScreen:
         if self.game.nonogram is not None:
             self.game.nonogram.draw_grid(screen)
             self.game.nonogram.draw_cells(screen)
-            self.draw_clues(screen)
             self.draw_timer(screen)
+            if self.game.nonogram.view_rect is not None:
+                self.minimap.draw(screen)
         else:
-            font = pygame.font.Font(None, 36)
-            message = font.render("No se cargó nivel.", True, (255, 0, 0))
+            message = render_text(None, 36, "No se cargó nivel.", (255, 0, 0))
             screen.blit(message, (300, 300))
 
         for button in self.buttons:
             button.draw(screen)
+        self.full_redraw = False
+        self.dirty_cells.clear()
 
-    def draw_clues(self, screen):
+    def draw_dirty(self, screen, background):
         """
-        Dibuja las pistas del Nonogram en la pantalla.
+        Vuelve a dibujar solo las celdas modificadas y el temporizador si su texto cambió.
 
         Args:
-            screen (pygame.Surface): Superficie de la pantalla donde se dibujan las pistas.
-        """
-        font = pygame.font.Font(None, 24)
-        for i, row_clue in enumerate(self.game.nonogram.row_clues):
-            text = " ".join(map(str, row_clue))
-            rendered = font.render(text, True, BLACK)
-            screen.blit(rendered, (
-                self.game.nonogram.grid_offset[0] - 10 - rendered.get_width(),
-                self.game.nonogram.grid_offset[1] + i * self.game.nonogram.cell_size + self.game.nonogram.cell_size //2 - rendered.get_height() // 2
-            ))
-
-        for j, col_clue in enumerate(self.game.nonogram.col_clues):
-            text_surfaces = [font.render(str(num), True, BLACK) for num in col_clue]
-            total_height = sum(surface.get_height() for surface in text_surfaces)
-            current_y = self.game.nonogram.grid_offset[1] - total_height - 10
-            for surface in text_surfaces:
-                screen.blit(surface, (
-                    self.game.nonogram.grid_offset[0] + j * self.game.nonogram.cell_size + self.game.nonogram.cell_size //2 - surface.get_width() //2,
-                    current_y
-                ))
-                current_y += surface.get_height()
+            screen (pygame.Surface): Superficie de la pantalla, con el contenido del fotograma anterior.
+            background (pygame.Surface): Imagen de fondo, usada para borrar el texto anterior del temporizador.
+
+        Returns:
+            list: Rectángulos modificados, o None si hace falta un dibujado completo.
+        """
+        self.track_nonogram()
+        if self.full_redraw or self.nonogram is None:
+            return None
+
+        rects = [self.nonogram.draw_cell(screen, row, col, background) for row, col in self.dirty_cells]
+        # Las celdas fuera de la vista devuelven un rectángulo vacío
+        rects = [rect for rect in rects if rect]
+        self.dirty_cells.clear()
+        if self.nonogram.view_rect is not None and self.minimap.dirty:
+            area = self.minimap.board_rect.inflate(6, 6)
+            screen.blit(background, area, area)
+            rects.append(self.minimap.draw(screen))
+
+        if self.get_timer_text() != self.timer_text:
+            previous_rect = self.timer_rect
+            screen.blit(background, previous_rect, previous_rect)
+            rects.append(previous_rect.union(self.draw_timer(screen)))
+        return rects
 
     def draw_timer(self, screen):
         """
@@ -208,13 +354,30 @@ class GameScreen:
 
         Args:
             screen (pygame.Surface): Superficie de la pantalla donde se dibuja el temporizador.
+
+        Returns:
+            pygame.Rect: Área ocupada por el texto.
         """
-        font = pygame.font.Font(None, 36)
-        timer_text = f"Time: {self.game.timer.get_time():.1f}s"
-        rendered = font.render(timer_text, True, BLACK)
+        timer_text = self.get_timer_text()
+        if self.timer_surface is None or timer_text != self.timer_text:
+            # El texto cambia cada décima de segundo; se renderiza sin el caché compartido para no desplazar
+            # de él las pistas y los botones, que sí se repiten
+            with font_cache.lock:
+                self.timer_surface = get_font(None, 36).render(timer_text, True, BLACK)
+        self.timer_text = timer_text
         timer_x = screen.get_width() - 150
         timer_y = self.buttons[0].rect.top - 50
-        screen.blit(rendered, (timer_x, timer_y))
+        self.timer_rect = screen.blit(self.timer_surface, (timer_x, timer_y))
+        return self.timer_rect
+
+    def get_timer_text(self):
+        """
+        Obtiene el texto del temporizador con una décima de segundo de precisión.
+
+        Returns:
+            str: Texto a mostrar.
+        """
+        return f"Time: {self.game.timer.get_time():.1f}s"
 
     def get_hint(self):
         """
@@ -223,7 +386,7 @@ class GameScreen:
         hint = self.game.get_hint()
         if hint:
             row, col, value = hint
-            self.game.nonogram.player_grid[row][col] = value
+            self.game.nonogram.apply_hint(row, col, value)
 
     def return_to_menu(self):
         """
@@ -0,0 +1,62 @@
+import pygame
+
+class JoystickCursor:
+    """
+    Clase que mueve el cursor con la palanca izquierda del joystick.
+
+    La posición se calcula solo con los datos de los eventos (eje y valor), sin leer el estado
+    del dispositivo, así que una grabación con eventos del joystick se reproduce igual sin un
+    joystick conectado. Los eventos del joystick se devuelven con la posición del cursor en pos,
+    igual que los del mouse.
+
+    Atributos:
+        screen_size (tuple): Ancho y alto de la ventana, que limitan el cursor.
+        speed (float): Píxeles que se mueve el cursor por evento con la palanca al máximo.
+        x, y (float): Posición del cursor.
+        axes (list): Último valor de los ejes horizontal y vertical de la palanca.
+    """
+    def __init__(self, screen_size, speed=5, pos=None):
+        """
+        Inicializa una instancia de la clase JoystickCursor.
+
+        Args:
+            screen_size (tuple): Ancho y alto de la ventana.
+            speed (float, optional): Velocidad del cursor. Por defecto es 5.
+            pos (tuple, optional): Posición inicial. Por defecto es el centro de la ventana.
+        """
+        self.screen_size = screen_size
+        self.speed = speed
+        self.x, self.y = pos if pos is not None else (screen_size[0] // 2, screen_size[1] // 2)
+        self.axes = [0.0, 0.0]
+
+    @property
+    def pos(self):
+        """
+        Posición del cursor en píxeles enteros.
+        """
+        return int(self.x), int(self.y)
+
+    def handle_event(self, event):
+        """
+        Actualiza el cursor con un evento y le agrega la posición si es del joystick.
+
+        Args:
+            event (pygame.event.Event): Evento recibido o reproducido.
+
+        Returns:
+            pygame.event.Event: El mismo evento o, si es del joystick, una copia con pos.
+        """
+        if event.type == pygame.MOUSEMOTION:
+            # El mouse también mueve el cursor; el movimiento que genera mouse.set_pos no pierde la fracción acumulada
+            if event.pos != self.pos:
+                self.x, self.y = event.pos
+            return event
+        if event.type == pygame.JOYAXISMOTION:
+            # Eje 0: derecha o izquierda; eje 1: arriba o abajo
+            if event.axis in (0, 1):
+                self.axes[event.axis] = event.value
+            self.x = max(0, min(self.x + self.axes[0] * self.speed, self.screen_size[0] - 1))
+            self.y = max(0, min(self.y + self.axes[1] * self.speed, self.screen_size[1] - 1))
+        elif event.type not in (pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP):
+            return event
+        return pygame.event.Event(event.type, event.dict, pos=self.pos)
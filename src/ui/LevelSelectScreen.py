@@ -1,8 +1,8 @@
 import pygame
-import os
 
-from src.logic.ProgressTracker import ProgressTracker
 from src.ui.Button import Button
+from src.logic.ProgressTracker import PROGRESS_CHANGED
+from src.utils.font_cache import NEWSWEEKLY_FONT, render_text
 from src.config import *
 import easygui as eg
 
@@ -12,7 +12,13 @@ class LevelSelectScreen:
 
     Atributos:
         game (Game): Instancia del juego.
-        buttons (list): Lista de botones en la pantalla de selección de nivel.
+        buttons (list): Lista de botones en la pantalla de selección de nivel, sin los de los niveles.
+        level_buttons (dict): Botón de cada nivel, por clave.
+        grid_rect (pygame.Rect): Área de la pantalla que ocupan los botones de los niveles.
+        grid_surface (pygame.Surface): Botones de los niveles dibujados una sola vez, con fondo transparente.
+        dirty_levels (set): Niveles cuyo botón cambió y falta volver a dibujar en grid_surface.
+        hovered_level (str): Clave del nivel bajo el cursor, o None.
+        cancel_button (Button): Botón para cancelar la conversión de una imagen personalizada.
     """
     def __init__(self, game):
         """
@@ -23,14 +29,26 @@ class LevelSelectScreen:
         """
         self.game = game
         self.buttons = []
+        self.level_buttons = {}
+        self.hovered_level = None
+        self.grid_rect = pygame.Rect(0, 0, 0, 0)
+        self.grid_surface = None
+        self.dirty_levels = set()
         self.create_level_buttons()
+        self.game.progress_tracker.subscribe(PROGRESS_CHANGED, self.on_progress_changed)
         self.buttons.append(
             Button("Custom", 100, 100, 200, 100, self.start_custom,
                    self.game.sound_manager, self.game.joystick))
+        screen_width, screen_height = pygame.display.get_surface().get_size()
+        self.cancel_button = Button("Cancel", screen_width // 2 - 100, screen_height // 2 + 20, 200, 60,
+                                    self.game.cancel_conversion, self.game.sound_manager, self.game.joystick)
 
     def create_level_buttons(self):
         """
-        Crea los botones para seleccionar los niveles del juego.
+        Crea los botones para seleccionar los niveles del juego y los dibuja en grid_surface.
+
+        Se llama una sola vez; después solo se vuelven a dibujar los botones de los niveles cuyo
+        progreso cambia (ver on_progress_changed).
         """
         screen_width, screen_height = pygame.display.get_surface().get_size()
         button_width, button_height = 50, 50
@@ -39,26 +57,62 @@ class LevelSelectScreen:
         total_height = ((len(self.game.levels) + 9) // 10) * (button_height + padding) - padding
         start_x = (screen_width - total_width) // 2
         start_y = (screen_height - total_height) // 2
-        pt = ProgressTracker()
+        pt = self.game.progress_tracker
+        self.level_buttons = {}
         for i, level_key in enumerate(self.game.levels.keys()):
             row = i // 10
             col = i % 10
             x = start_x + col * (button_width + padding)
             y = start_y + row * (button_width + padding)
-            dif = None
-            if i + 1 <= 20:
-                dif = "easy"
-            elif i + 1 <= 40:
-                dif = "medium"
-            else:
-                dif = "hard"
-            if pt.is_level_complete(dif, f"level{i + 1}"):
+            if pt.is_level_complete(None, level_key):
                 t = 1
             else:
                 t = 0
-            self.buttons.append(
-                Button(str(i + 1), x, y, button_width, button_height, lambda lk=level_key: self.select_level(lk),
-                       self.game.sound_manager, self.game.joystick, t))
+            button = Button(str(i + 1), x, y, button_width, button_height, lambda lk=level_key: self.select_level(lk),
+                            self.game.sound_manager, self.game.joystick, t)
+            self.level_buttons[level_key] = button
+
+        self.grid_rect = pygame.Rect(0, 0, 0, 0)
+        if self.level_buttons:
+            outer_rects = [button.get_outer_rect() for button in self.level_buttons.values()]
+            self.grid_rect = outer_rects[0].unionall(outer_rects[1:])
+        self.grid_surface = pygame.Surface(self.grid_rect.size, pygame.SRCALPHA)
+        for button in self.level_buttons.values():
+            button.draw(self.grid_surface, self.grid_rect.topleft)
+        self.dirty_levels.clear()
+
+    def on_progress_changed(self, category, level_key):
+        """
+        Reacciona al evento PROGRESS_CHANGED: marca el botón del nivel para volver a dibujarlo si cambió su tipo.
+
+        Args:
+            category (str): Categoría del nivel.
+            level_key (str): Clave del nivel.
+        """
+        button = self.level_buttons.get(level_key)
+        if button is None:
+            return
+        t = 1 if self.game.progress_tracker.is_level_complete(None, level_key) else 0
+        if button.type != t:
+            button.set_type(t)
+            self.dirty_levels.add(level_key)
+
+    def redraw_dirty_levels(self):
+        """
+        Vuelve a dibujar en grid_surface los botones de los niveles que cambiaron.
+
+        Returns:
+            list: Áreas de la pantalla de los botones dibujados.
+        """
+        rects = []
+        for level_key in self.dirty_levels:
+            button = self.level_buttons[level_key]
+            rect = button.get_outer_rect()
+            self.grid_surface.fill((0, 0, 0, 0), rect.move(-self.grid_rect.x, -self.grid_rect.y))
+            button.draw(self.grid_surface, self.grid_rect.topleft)
+            rects.append(rect)
+        self.dirty_levels.clear()
+        return rects
 
     def handle_event(self, event):
         """
@@ -67,12 +121,39 @@ class LevelSelectScreen:
         Args:
             event (pygame.event.Event): Evento a manejar.
         """
+        if self.game.conversion is not None:
+            # Mientras se convierte una imagen solo se puede cancelar
+            if event.type != pygame.JOYAXISMOTION:
+                self.cancel_button.handle_event(event)
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                self.game.cancel_conversion()
+            return
         if event.type != pygame.JOYAXISMOTION:
             for button in self.buttons:
                 button.handle_event(event)
+            for button in self.level_buttons.values():
+                button.handle_event(event)
+        if event.type == pygame.MOUSEMOTION:
+            self.update_hovered_level(event.pos)
         if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             self.game.set_screen('menu')
 
+    def update_hovered_level(self, pos):
+        """
+        Pide preparar en segundo plano el nivel bajo el cursor cuando cambia.
+
+        Args:
+            pos (tuple): Posición del cursor.
+        """
+        hovered = None
+        for level_key, button in self.level_buttons.items():
+            if button.rect.collidepoint(pos):
+                hovered = level_key
+                break
+        if hovered is not None and hovered != self.hovered_level:
+            self.game.prefetch_levels(hovered)
+        self.hovered_level = hovered
+
     def draw(self, screen):
         """
         Dibuja la pantalla de selección de nivel.
@@ -80,21 +161,71 @@ class LevelSelectScreen:
         Args:
             screen (pygame.Surface): Superficie de la pantalla donde se dibuja la selección de nivel.
         """
-        font_path = os.path.join("assets", "fonts", "newsweekly", "newsweekly-Regular.ttf")
         font_size = 64
 
-        border_font = pygame.font.Font(font_path, font_size)
-        border_title = border_font.render("Select Level", True, WHITE)
+        border_title = render_text(NEWSWEEKLY_FONT, font_size, "Select Level", WHITE)
         border_rect = border_title.get_rect(center=((screen.get_width() // 2) + 2, (screen.get_height() // 2) - 198))
         screen.blit(border_title, border_rect)
 
-        font = pygame.font.Font(font_path, font_size)
-        title = font.render("Select Level", True, BLACK)
+        title = render_text(NEWSWEEKLY_FONT, font_size, "Select Level", BLACK)
         title_rect = title.get_rect(center=(screen.get_width() // 2, screen.get_height() // 2 - 200))
         screen.blit(title, title_rect)
 
+        self.redraw_dirty_levels()
+        screen.blit(self.grid_surface, self.grid_rect)
         for button in self.buttons:
             button.draw(screen)
+
+        if self.game.conversion is not None:
+            self.draw_conversion(screen)
+
+    def draw_conversion(self, screen):
+        """
+        Dibuja el panel de conversión de una imagen personalizada con su barra de progreso.
+
+        Args:
+            screen (pygame.Surface): Superficie de la pantalla.
+
+        Returns:
+            pygame.Rect: Rectángulo del panel.
+        """
+        dark_color = (63, 48, 43)
+        light_color = (251, 226, 204)
+        panel_rect = pygame.Rect(0, 0, 440, 220)
+        panel_rect.center = (screen.get_width() // 2, screen.get_height() // 2)
+        pygame.draw.rect(screen, dark_color, panel_rect, border_radius=10)
+        pygame.draw.rect(screen, light_color, panel_rect.inflate(-6, -6), border_radius=7)
+
+        progress = self.game.conversion.progress
+        text = render_text(NEWSWEEKLY_FONT, 36, f"Converting... {int(progress * 100)}%", dark_color)
+        screen.blit(text, text.get_rect(center=(panel_rect.centerx, panel_rect.y + 45)))
+
+        bar_rect = pygame.Rect(panel_rect.x + 40, panel_rect.y + 80, panel_rect.width - 80, 20)
+        pygame.draw.rect(screen, dark_color, bar_rect, 2)
+        pygame.draw.rect(screen, dark_color, (bar_rect.x, bar_rect.y, int(bar_rect.width * progress), bar_rect.height))
+
+        self.cancel_button.draw(screen)
+        return panel_rect
+
+    def draw_dirty(self, screen, background):
+        """
+        Dibujado parcial: solo se actualizan los botones de los niveles cuyo progreso cambió y el panel de conversión.
+
+        Args:
+            screen (pygame.Surface): Superficie de la pantalla.
+            background (pygame.Surface): Imagen de fondo.
+
+        Returns:
+            list: Rectángulos modificados.
+        """
+        dirty_rects = self.redraw_dirty_levels()
+        for rect in dirty_rects:
+            screen.blit(background, rect, rect)
+            screen.blit(self.grid_surface, rect, rect.move(-self.grid_rect.x, -self.grid_rect.y))
+        if self.game.conversion is not None:
+            dirty_rects.append(self.draw_conversion(screen))
+        return dirty_rects
+
     def start_custom(self):
         """
         Inicia un Nonogram personalizado a partir de una imagen seleccionada por el usuario.
@@ -102,7 +233,8 @@ class LevelSelectScreen:
         path=eg.fileopenbox()
         if path is None:
             return
-        self.game.start_level("custom", path)
+        self.game.start_custom_conversion(path)
+        self.game.invalidate()
 
     def select_level(self, level_key):
         """
@@ -116,7 +248,17 @@ class LevelSelectScreen:
 
     def update(self):
         """
-        Actualiza el estado de la pantalla de selección de nivel.
+        Actualiza el estado de la pantalla de selección de nivel y revisa la conversión en curso.
         """
-        self.create_level_buttons()
-        pass
\ No newline at end of file
+        self.game.poll_conversion()
+
+    def get_refresh_interval(self):
+        """
+        Obtiene cada cuánto hay que actualizar la pantalla sin eventos.
+
+        Returns:
+            int: CONVERSION_REFRESH_MS mientras se convierte una imagen, para revisar su progreso, o None.
+        """
+        if self.game.conversion is not None:
+            return CONVERSION_REFRESH_MS
+        return None
\ No newline at end of file
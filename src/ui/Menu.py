@@ -1,6 +1,6 @@
 import pygame
-import os
 from src.ui.Button import Button
+from src.utils.font_cache import NEWSWEEKLY_FONT, render_text
 from src.config import *
 from sys import exit
 
@@ -50,23 +50,33 @@ class Menu:
         Args:
             screen (pygame.Surface): Superficie de la pantalla donde se dibuja el menú.
         """
-        font_path =  os.path.join("assets", "fonts", "newsweekly", "newsweekly-Regular.ttf")
         font_size = 128
         border_size = 3
 
-        border_font = pygame.font.Font(font_path, font_size)
-        border_title = border_font.render("AtomicGram", True, WHITE)
+        border_title = render_text(NEWSWEEKLY_FONT, font_size, "AtomicGram", WHITE)
         border_rect = border_title.get_rect(center=((screen.get_width() // 2) + 2, (screen.get_height() // 2) - 163))
         screen.blit(border_title, border_rect)
 
-        font = pygame.font.Font(font_path, font_size)
-        title = font.render("AtomicGram", True, BLACK)
+        title = render_text(NEWSWEEKLY_FONT, font_size, "AtomicGram", BLACK)
         title_rect = title.get_rect(center=(screen.get_width() //2, screen.get_height() // 2 - 165))
         screen.blit(title, title_rect)
 
         for button in self.buttons:
             button.draw(screen)
 
+    def draw_dirty(self, screen, background):
+        """
+        Dibujado parcial: el menú no cambia mientras está visible, así que no hay áreas que actualizar.
+
+        Args:
+            screen (pygame.Surface): Superficie de la pantalla.
+            background (pygame.Surface): Imagen de fondo.
+
+        Returns:
+            list: Lista vacía de rectángulos modificados.
+        """
+        return []
+
     def select_level(self):
         """
         Cambia la pantalla actual a la selección de nivel.
@@ -84,4 +94,13 @@ class Menu:
         """
         Actualiza el estado del menú.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def get_refresh_interval(self):
+        """
+        Obtiene cada cuánto hay que actualizar el menú sin eventos.
+
+        Returns:
+            int: None, porque el menú solo cambia con la entrada del jugador.
+        """
+        return None
\ No newline at end of file
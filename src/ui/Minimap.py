@@ -0,0 +1,142 @@
+import numpy as np
+import pygame
+
+from src.config import WHITE, BLACK
+from src.Nonogram import CELL_CHANGED, BOARD_RESET
+
+# Color de cada valor de celda en el minimapa: vacía, llena y marcada con X
+CELL_COLORS = np.array([WHITE, BLACK, (230, 150, 150)], dtype=np.uint8)
+FRAME_COLOR = (63, 48, 43)
+VIEW_COLOR = (255, 0, 0)
+
+class Minimap:
+    """
+    Clase que muestra el tablero completo en miniatura, con el área visible marcada.
+
+    Guarda una superficie con un píxel por celda que se actualiza celda a celda con el evento
+    CELL_CHANGED, así que dibujarla solo cuesta escalarla al tamaño del minimapa.
+
+    Atributos:
+        rect (pygame.Rect): Área de la pantalla que ocupa el minimapa.
+        nonogram (Nonogram): Nonogram que se muestra.
+        cells (pygame.Surface): Un píxel por celda con el estado del tablero del jugador.
+        board_rect (pygame.Rect): Área dentro de rect donde se dibuja el tablero escalado.
+        scaled (pygame.Surface): Última versión escalada de cells, o None si hay que volver a escalarla.
+        dirty (bool): Indica si cambió algo desde el último dibujado.
+    """
+    def __init__(self, rect):
+        """
+        Inicializa una instancia de la clase Minimap.
+
+        Args:
+            rect (pygame.Rect): Área de la pantalla que ocupa el minimapa.
+        """
+        self.rect = pygame.Rect(rect)
+        self.nonogram = None
+        self.cells = None
+        self.board_rect = pygame.Rect(self.rect)
+        self.scaled = None
+        self.dirty = True
+
+    def attach(self, nonogram):
+        """
+        Empieza a mostrar un Nonogram y se suscribe a sus cambios.
+
+        Args:
+            nonogram (Nonogram): Nonogram a mostrar, o None.
+        """
+        if self.nonogram is not None:
+            self.nonogram.unsubscribe(CELL_CHANGED, self.on_cell_changed)
+            self.nonogram.unsubscribe(BOARD_RESET, self.rebuild)
+        self.nonogram = nonogram
+        self.cells = None
+        if nonogram is not None:
+            nonogram.subscribe(CELL_CHANGED, self.on_cell_changed)
+            nonogram.subscribe(BOARD_RESET, self.rebuild)
+            scale = min(self.rect.width / nonogram.cols, self.rect.height / nonogram.rows)
+            self.board_rect = pygame.Rect(0, 0, max(1, round(nonogram.cols * scale)), max(1, round(nonogram.rows * scale)))
+            self.board_rect.center = self.rect.center
+            self.rebuild()
+
+    def rebuild(self):
+        """
+        Vuelve a crear la superficie de las celdas a partir del tablero completo.
+        """
+        grid = np.asarray(self.nonogram.get_player_grid(), dtype=np.uint8)
+        # surfarray usa los índices (x, y), así que las columnas van primero
+        self.cells = pygame.surfarray.make_surface(CELL_COLORS[np.minimum(grid, 2)].transpose(1, 0, 2))
+        self.scaled = None
+        self.dirty = True
+
+    def on_cell_changed(self, row, col):
+        """
+        Reacciona al evento CELL_CHANGED actualizando el píxel de la celda.
+
+        Args:
+            row (int): Índice de la fila.
+            col (int): Índice de la columna.
+        """
+        color = tuple(CELL_COLORS[min(int(self.nonogram.player_grid[row][col]), 2)])
+        self.cells.set_at((col, row), color)
+        if self.scaled is not None:
+            # Se pinta solo el bloque de la celda en la versión escalada, sin volver a escalar todo
+            # (los mismos píxeles que le asigna pygame.transform.scale)
+            width, height = self.board_rect.size
+            cols, rows = self.nonogram.cols, self.nonogram.rows
+            left, right = -(-col * width // cols), -(-(col + 1) * width // cols)
+            top, bottom = -(-row * height // rows), -(-(row + 1) * height // rows)
+            self.scaled.fill(color, (left, top, right - left, bottom - top))
+        self.dirty = True
+
+    def invalidate(self):
+        """
+        Pide volver a dibujar el minimapa, por ejemplo porque se movió la vista.
+        """
+        self.dirty = True
+
+    def get_board_position(self, pos):
+        """
+        Convierte una posición del minimapa en una posición del tablero.
+
+        Args:
+            pos (tuple): Posición en la pantalla.
+
+        Returns:
+            tuple: (fila, columna) con parte decimal, o None si pos no está sobre el tablero del minimapa.
+        """
+        if self.nonogram is None or not self.board_rect.collidepoint(pos):
+            return None
+        col = (pos[0] - self.board_rect.x) * self.nonogram.cols / self.board_rect.width
+        row = (pos[1] - self.board_rect.y) * self.nonogram.rows / self.board_rect.height
+        return row, col
+
+    def draw(self, screen):
+        """
+        Dibuja el minimapa con el rectángulo del área visible del tablero.
+
+        Args:
+            screen (pygame.Surface): Superficie de la pantalla.
+
+        Returns:
+            pygame.Rect: Área modificada, incluido el marco.
+        """
+        nonogram = self.nonogram
+        if self.scaled is None:
+            self.scaled = pygame.transform.scale(self.cells, self.board_rect.size)
+        screen.blit(self.scaled, self.board_rect)
+        frame = self.board_rect.inflate(6, 6)
+        pygame.draw.rect(screen, FRAME_COLOR, frame, 3)
+
+        if nonogram.view_rect is not None:
+            # Área visible en celdas: desde el desplazamiento hasta el borde de view_rect
+            scale_x = self.board_rect.width / (nonogram.cols * nonogram.cell_size)
+            scale_y = self.board_rect.height / (nonogram.rows * nonogram.cell_size)
+            visible = pygame.Rect(
+                self.board_rect.x + round(nonogram.scroll[0] * scale_x),
+                self.board_rect.y + round(nonogram.scroll[1] * scale_y),
+                max(2, round((nonogram.view_rect.width + 2) * scale_x)),
+                max(2, round((nonogram.view_rect.height + 2) * scale_y))
+            )
+            pygame.draw.rect(screen, VIEW_COLOR, visible.clip(self.board_rect), 2)
+        self.dirty = False
+        return frame
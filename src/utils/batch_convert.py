@@ -0,0 +1,202 @@
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.utils.image_converter import image_to_nonogram, find_best_nonogram
+
+# Extensiones de imagen que se buscan en la carpeta de entrada
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp")
+
+
+def find_images(input_dir):
+    """
+    Busca las imágenes de una carpeta, ordenadas por nombre.
+
+    Args:
+        input_dir (str): Carpeta con las imágenes.
+
+    Returns:
+        list: Rutas de las imágenes.
+    """
+    names = sorted(name for name in os.listdir(input_dir) if name.lower().endswith(IMAGE_EXTENSIONS))
+    return [os.path.join(input_dir, name) for name in names]
+
+
+def next_level_number(output_dir):
+    """
+    Obtiene el primer número de nivel libre en una carpeta.
+
+    Args:
+        output_dir (str): Carpeta con archivos levelN.json.
+
+    Returns:
+        int: Número mayor que el de todos los niveles existentes.
+    """
+    numbers = [int(match.group(1)) for match in (re.fullmatch(r"level(\d+)\.json", name) for name in os.listdir(output_dir)) if match]
+    return max(numbers, default=0) + 1
+
+
+def write_level_file(level_data, path):
+    """
+    Escribe un nivel en el mismo formato que los archivos levelN.json del juego.
+
+    Args:
+        level_data (dict): Diccionario con las claves grid, row_clues y col_clues.
+        path (str): Ruta del archivo.
+    """
+    rows = ",\n".join("      " + json.dumps(row, separators=(", ", ": ")) for row in level_data["grid"])
+    with open(path, "w") as f:
+        f.write("{\n")
+        f.write(f'    "grid": [\n{rows}\n    ],\n')
+        f.write(f'    "row_clues": {json.dumps(level_data["row_clues"])},\n')
+        f.write(f'    "col_clues": {json.dumps(level_data["col_clues"])}\n')
+        f.write("}\n")
+
+
+def convert_task(image_path, size, num_colors, draft):
+    """
+    Convierte una imagen dentro de un proceso del pool y mide cuánto tarda.
+
+    Args:
+        image_path (str): Ruta a la imagen.
+        size (int): Tamaño de la cuadrícula.
+        num_colors (int): Número de colores para la cuantización.
+        draft (bool): Indica si se permite reducir la imagen antes de convertirla.
+
+    Returns:
+        tuple: Una tupla (datos del nivel o None, segundos, mensaje de error o None).
+    """
+    start = time.perf_counter()
+    try:
+        grid, row_clues, col_clues = image_to_nonogram(image_path, size, num_colors, draft=draft)
+        return {"grid": grid, "row_clues": row_clues, "col_clues": col_clues}, time.perf_counter() - start, None
+    except Exception as e:
+        return None, time.perf_counter() - start, str(e)
+
+
+def search_task(image_path, sizes, num_colors, draft):
+    """
+    Busca la mejor conversión de una imagen dentro de un proceso del pool y mide cuánto tarda.
+
+    Args:
+        image_path (str): Ruta a la imagen.
+        sizes (tuple): Tamaños de cuadrícula a probar, en orden de preferencia.
+        num_colors (int): Número de colores para la cuantización.
+        draft (bool): Indica si se permite reducir la imagen antes de convertirla.
+
+    Returns:
+        tuple: Una tupla (datos del nivel o None, segundos, mensaje de error o None, informe de la búsqueda o None).
+    """
+    start = time.perf_counter()
+    try:
+        report = find_best_nonogram(image_path, sizes, num_colors=num_colors, draft=draft)
+        best = report["best"]
+        level_data = {"grid": best["grid"], "row_clues": best["row_clues"], "col_clues": best["col_clues"]}
+        summary = {"size": best["size"], "method": best["method"], "status": best["status"],
+                   "accepted": report["accepted"], "rejected": report["rejected"]}
+        return level_data, time.perf_counter() - start, None, summary
+    except Exception as e:
+        return None, time.perf_counter() - start, str(e), None
+
+
+def batch_convert(image_paths, output_dir, sizes=(20,), colors=(2,), workers=None, first_level=None, draft=True, search=False):
+    """
+    Convierte un lote de imágenes en niveles, en paralelo en todos los núcleos.
+
+    Cada imagen se convierte una vez por cada combinación de tamaño y cantidad de colores. Con
+    search, cada imagen genera un nivel por cantidad de colores: el candidato con solución única
+    elegido por find_best_nonogram entre todos los tamaños y umbrales.
+    Los números de nivel se asignan al terminar todas las conversiones, en el orden de las
+    imágenes y solo a las que se convirtieron, así que el resultado no depende del orden en que
+    terminen los procesos y las conversiones fallidas no dejan huecos en la numeración.
+
+    Args:
+        image_paths (list): Rutas de las imágenes.
+        output_dir (str): Carpeta donde se escriben los archivos levelN.json.
+        sizes (tuple, optional): Tamaños de cuadrícula. Por defecto es (20,).
+        colors (tuple, optional): Cantidades de colores para la cuantización. Por defecto es (2,).
+        workers (int, optional): Cantidad de procesos. Por defecto es la cantidad de núcleos.
+        first_level (int, optional): Número del primer nivel. Por defecto es el primero libre en output_dir.
+        draft (bool, optional): Indica si se permite reducir la imagen antes de convertirla. Por defecto es True.
+        search (bool, optional): Indica si se busca la mejor conversión de cada imagen. Por defecto es False.
+
+    Returns:
+        dict: Resumen con una entrada por conversión, el tiempo total y las conversiones por segundo.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if first_level is None:
+        first_level = next_level_number(output_dir)
+    if search:
+        tasks = [(image_path, tuple(sizes), num_colors) for image_path in image_paths for num_colors in colors]
+    else:
+        tasks = [(image_path, size, num_colors) for image_path in image_paths for size in sizes for num_colors in colors]
+
+    results = [None] * len(tasks)
+    levels = [None] * len(tasks)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        task_function = search_task if search else convert_task
+        futures = {executor.submit(task_function, *task, draft): i for i, task in enumerate(tasks)}
+        for future in as_completed(futures):
+            i = futures[future]
+            image_path, size, num_colors = tasks[i]
+            level_data, seconds, error, *search_summary = future.result()
+            entry = {"image": image_path, "size": size, "colors": num_colors, "seconds": round(seconds, 4)}
+            if search_summary and search_summary[0] is not None:
+                entry.update(search_summary[0])
+            if level_data is None:
+                entry["error"] = error
+            levels[i] = level_data
+            results[i] = entry
+
+    level_number = first_level
+    for entry, level_data in zip(results, levels):
+        if level_data is not None:
+            level_key = f"level{level_number}"
+            write_level_file(level_data, os.path.join(output_dir, f"{level_key}.json"))
+            entry["level"] = level_key
+            level_number += 1
+    elapsed = time.perf_counter() - start
+
+    return {
+        "conversions": results,
+        "seconds": round(elapsed, 4),
+        "per_second": round(len(tasks) / elapsed, 2) if elapsed > 0 else 0.0,
+    }
+
+
+def main():
+    """
+    Convierte todas las imágenes de una carpeta en archivos levelN.json.
+    """
+    parser = argparse.ArgumentParser(description="Convierte un lote de imágenes en niveles del juego.")
+    parser.add_argument("input_dir", help="Carpeta con las imágenes.")
+    parser.add_argument("--output-dir", default="batch_levels", help="Carpeta donde se escriben los niveles.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20], help="Tamaños de cuadrícula.")
+    parser.add_argument("--colors", type=int, nargs="+", default=[2], help="Cantidades de colores para la cuantización.")
+    parser.add_argument("--workers", type=int, default=None, help="Cantidad de procesos. Por defecto, uno por núcleo.")
+    parser.add_argument("--first-level", type=int, default=None, help="Número del primer nivel generado.")
+    parser.add_argument("--exact", action="store_true", help="Decodifica los JPEG a resolución completa.")
+    parser.add_argument("--search", action="store_true", help="Genera un nivel por imagen y cantidad de colores, eligiendo entre los tamaños y umbrales la versión con solución única.")
+    args = parser.parse_args()
+
+    image_paths = find_images(args.input_dir)
+    summary = batch_convert(image_paths, args.output_dir, args.sizes, args.colors, args.workers, args.first_level,
+                            not args.exact, args.search)
+
+    for entry in summary["conversions"]:
+        result = entry.get("level") or f"error: {entry['error']}"
+        if "method" in entry:
+            result += f" [{entry['size']}x{entry['size']} {entry['method']}, {'aceptado' if entry['accepted'] else 'sin solución única'}]"
+        print(f"{os.path.basename(entry['image'])} {entry['size']} {entry['colors']} colores -> {result} ({entry['seconds'] * 1000:.1f} ms)")
+    print(f"{len(summary['conversions'])} conversiones en {summary['seconds']:.2f} s ({summary['per_second']} por segundo)")
+
+    with open(os.path.join(args.output_dir, "batch_summary.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+import argparse
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+import tracemalloc
+
+import pygame
+
+from src.Game import Game
+from src.config import CUSTOM_CACHE_MAX_BYTES
+from src.logic.ProgressTracker import ProgressTracker
+from src.main import render_frame
+from src.ui.GameScreen import GameScreen
+from src.ui.LevelSelectScreen import LevelSelectScreen
+from src.ui.Menu import Menu
+from src.utils.clues import grid_clues
+from src.utils.conversion_cache import ConversionCache
+from src.utils.input_recording import frame_time_summary
+
+# Versión del formato del resultado; cambia si cambian los escenarios o las métricas
+BENCHMARK_VERSION = 2
+# Tamaños de tablero de los escenarios de juego
+BOARD_SIZES = (5, 10, 15, 20, 25, 50, 100)
+# Fotogramas que se dibujan antes de empezar a medir cada escenario
+WARMUP_FRAMES = 5
+WINDOW_SIZE = (1200, 900)
+
+
+def random_board(size, seed=0):
+    """
+    Genera un Nonogram aleatorio, siempre el mismo para un tamaño y una semilla.
+
+    Args:
+        size (int): Cantidad de filas y columnas.
+        seed (int, optional): Semilla del generador. Por defecto es 0.
+
+    Returns:
+        list: Cuadrícula, pistas de las filas y pistas de las columnas.
+    """
+    rng = random.Random(seed * 1000 + size)
+    grid = [[int(rng.random() < 0.55) for _ in range(size)] for _ in range(size)]
+    row_clues, col_clues = grid_clues(grid, empty=[0])
+    return [grid, row_clues, col_clues]
+
+
+def find_button(screen, text):
+    """
+    Busca un botón de una pantalla por su texto.
+
+    Args:
+        screen: Pantalla con una lista buttons.
+        text (str): Texto del botón.
+
+    Returns:
+        Button: El botón encontrado.
+    """
+    return next(button for button in screen.buttons if button.text == text)
+
+
+def visible_cells(game, screens):
+    """
+    Obtiene las celdas del tablero que se ven en la pantalla del juego, recorridas en zigzag.
+
+    Args:
+        game (Game): Instancia del juego.
+        screens (dict): Pantallas del juego, por nombre.
+
+    Returns:
+        list: Centros de las celdas, en el orden de un arrastre continuo.
+    """
+    nonogram = game.nonogram
+    # La pantalla del juego le asigna al tablero el área disponible a la izquierda de los botones
+    screens["game"].track_nonogram()
+    nonogram.update_layout(WINDOW_SIZE)
+    area = nonogram.view_rect or pygame.Rect((0, 0), WINDOW_SIZE)
+    cells = []
+    for row in range(nonogram.rows):
+        columns = range(nonogram.cols) if row % 2 == 0 else range(nonogram.cols - 1, -1, -1)
+        cells.extend(nonogram.get_cell_rect(row, col).center for col in columns
+                     if area.contains(nonogram.get_cell_rect(row, col)))
+    return cells
+
+
+def idle_scenario(screen_name):
+    """
+    Escenario sin eventos en una pantalla.
+
+    Args:
+        screen_name (str): Pantalla del escenario ("menu" o "level_select").
+
+    Returns:
+        callable: Función que prepara el juego y devuelve la función de eventos por fotograma.
+    """
+    def setup(game, screens):
+        game.set_screen(screen_name)
+        return lambda frame: []
+    return setup
+
+
+def hover_scenario(game, screens):
+    """
+    Escenario que mueve el cursor sobre los botones de la selección de nivel.
+    """
+    game.set_screen("level_select")
+    screen = screens["level_select"]
+
+    def events(frame):
+        buttons = list(screen.level_buttons.values())
+        if not buttons:
+            return []
+        pos = buttons[frame % len(buttons)].rect.center
+        return [pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))]
+    return events
+
+
+def board_scenario(size, kind):
+    """
+    Escenario en la pantalla de juego con un tablero aleatorio.
+
+    Args:
+        size (int): Tamaño del tablero.
+        kind (str): "idle" (sin eventos), "drag" (arrastre continuo pintando celdas), "hints" (botón Hint
+            en cada fotograma) o "undo" (con el tablero lleno, botón Undo hasta vaciarlo y luego Redo).
+
+    Returns:
+        callable: Función que prepara el juego y devuelve la función de eventos por fotograma.
+    """
+    def setup(game, screens):
+        game.start_custom_level(random_board(size))
+        screens["game"].track_nonogram()
+        cells = visible_cells(game, screens)
+
+        if kind == "idle":
+            return lambda frame: []
+
+        if kind == "drag":
+            def events(frame):
+                pos = cells[frame % len(cells)]
+                if frame == 0:
+                    return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos)]
+                return [pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(1, 0, 0))]
+            return events
+
+        # Los botones se activan llamando a su acción, sin pasar por los eventos del mouse
+        if kind == "hints":
+            hint = find_button(screens["game"], "Hint")
+            return lambda frame: hint.callback() or []
+
+        nonogram = game.nonogram
+        for row in range(nonogram.rows):
+            nonogram.begin_stroke()
+            for col in range(nonogram.cols):
+                nonogram.set_cell(row, col, 1 + (row + col) % 2)
+            nonogram.end_stroke()
+        undo = find_button(screens["game"], "Undo")
+        redo = find_button(screens["game"], "Redo")
+        state = {"undoing": True}
+
+        def events(frame):
+            log = game.nonogram.undo_log
+            if state["undoing"] and not log.can_undo():
+                state["undoing"] = False
+            elif not state["undoing"] and not log.can_redo():
+                state["undoing"] = True
+            (undo if state["undoing"] else redo).callback()
+            return []
+        return events
+    return setup
+
+
+def get_scenarios(sizes=BOARD_SIZES):
+    """
+    Obtiene los escenarios del benchmark.
+
+    Args:
+        sizes (tuple, optional): Tamaños de tablero. Por defecto es BOARD_SIZES.
+
+    Returns:
+        dict: Función de preparación de cada escenario, por nombre.
+    """
+    scenarios = {
+        "menu_idle": idle_scenario("menu"),
+        "level_select_idle": idle_scenario("level_select"),
+        "level_select_hover": hover_scenario,
+    }
+    for kind in ("idle", "drag", "hints", "undo"):
+        for size in sizes:
+            scenarios[f"game_{kind}_{size}x{size}"] = board_scenario(size, kind)
+    return scenarios
+
+
+def run_scenario(setup, frames, trace=False):
+    """
+    Ejecuta un escenario con un juego nuevo, igual que el bucle principal de main.py.
+
+    El progreso y el caché de imágenes convertidas del juego se guardan en una carpeta temporal,
+    así que el benchmark no modifica los datos del jugador.
+
+    Args:
+        setup (callable): Función que prepara el juego y devuelve la función de eventos por fotograma.
+        frames (int): Fotogramas medidos.
+        trace (bool, optional): Indica si se mide la memoria con tracemalloc en lugar de los tiempos.
+
+    Returns:
+        list: Tiempo de cada fotograma en segundos o, con trace, tuplas (pico de memoria por encima
+        de la del inicio del fotograma, bytes retenidos) por fotograma.
+    """
+    screen = pygame.display.get_surface()
+    background_image = pygame.transform.scale(pygame.image.load(os.path.join("assets", "images", "background.jpg")), WINDOW_SIZE)
+    folder = tempfile.TemporaryDirectory()
+    progress_tracker = ProgressTracker(os.path.join(folder.name, "player_progress.sqlite3"), None)
+    conversion_cache = ConversionCache(os.path.join(folder.name, "user_created"), CUSTOM_CACHE_MAX_BYTES)
+    game = Game(screen, None, progress_tracker, conversion_cache)
+    results = []
+    last_screen = None
+    try:
+        screens = {"menu": Menu(game), "game": GameScreen(game), "level_select": LevelSelectScreen(game)}
+        events_for = setup(game, screens)
+        for frame in range(WARMUP_FRAMES + frames):
+            measured = frame >= WARMUP_FRAMES
+            if trace and measured:
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+
+            pygame.event.pump()
+            current_screen = screens[game.current_screen]
+            for event in events_for(frame):
+                current_screen.handle_event(event)
+            current_screen.update()
+            render_frame(game, screen, background_image, current_screen, last_screen)
+            last_screen = current_screen
+
+            if measured:
+                if trace:
+                    current, peak = tracemalloc.get_traced_memory()
+                    results.append((peak - before, current - before))
+                else:
+                    results.append(time.perf_counter() - start)
+    finally:
+        if game.level_loader is not None:
+            game.level_loader.stop()
+        progress_tracker.close()
+        folder.cleanup()
+    return results
+
+
+def run_benchmark(frames=240, sizes=BOARD_SIZES, only=None, memory=True):
+    """
+    Ejecuta todos los escenarios y resume sus tiempos de fotograma y su uso de memoria.
+
+    tracemalloc no cuenta las asignaciones liberadas, así que la memoria se informa como el pico
+    de cada fotograma por encima de la memoria al empezarlo (peak_kb_per_frame) y lo que queda
+    retenido al terminarlo (retained_kb_per_frame), promediados entre los fotogramas.
+
+    Args:
+        frames (int, optional): Fotogramas medidos por escenario. Por defecto es 240.
+        sizes (tuple, optional): Tamaños de tablero. Por defecto es BOARD_SIZES.
+        only (list, optional): Subcadenas de los nombres de los escenarios a ejecutar. Por defecto se ejecutan todos.
+        memory (bool, optional): Indica si se hace una segunda pasada con tracemalloc. Por defecto es True.
+
+    Returns:
+        dict: Resultado del benchmark, listo para guardarse en JSON.
+    """
+    results = {}
+    for name, setup in get_scenarios(sizes).items():
+        if only and not any(part in name for part in only):
+            continue
+        summary = frame_time_summary(run_scenario(setup, frames))
+        if memory:
+            tracemalloc.start()
+            try:
+                memory_use = run_scenario(setup, frames, trace=True)
+            finally:
+                tracemalloc.stop()
+            summary["peak_kb_per_frame"] = round(sum(peak for peak, _ in memory_use) / len(memory_use) / 1024, 3)
+            summary["retained_kb_per_frame"] = round(sum(net for _, net in memory_use) / len(memory_use) / 1024, 3)
+        results[name] = summary
+        print(f"{name:28} p50 {summary['p50_ms']:8.3f} ms  p95 {summary['p95_ms']:8.3f} ms  p99 {summary['p99_ms']:8.3f} ms"
+              + (f"  pico {summary['peak_kb_per_frame']:9.1f} KB/fotograma" if memory else ""))
+    return {
+        "version": BENCHMARK_VERSION,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "frames": frames,
+        "scenarios": results,
+    }
+
+
+def compare_results(baseline, current, metric="p95_ms"):
+    """
+    Compara dos resultados del benchmark escenario por escenario.
+
+    Args:
+        baseline (dict): Resultado anterior.
+        current (dict): Resultado nuevo.
+        metric (str, optional): Métrica comparada. Por defecto es "p95_ms".
+
+    Returns:
+        dict: Por escenario presente en ambos, una tupla (valor anterior, valor nuevo, cociente nuevo/anterior).
+    """
+    comparison = {}
+    for name, summary in current["scenarios"].items():
+        previous = baseline["scenarios"].get(name)
+        if previous is None or metric not in previous or metric not in summary:
+            continue
+        ratio = summary[metric] / previous[metric] if previous[metric] else float("inf")
+        comparison[name] = (previous[metric], summary[metric], round(ratio, 3))
+    return comparison
+
+
+def main():
+    """
+    Ejecuta el benchmark sin ventana ni sonido y guarda el resultado en JSON.
+    """
+    parser = argparse.ArgumentParser(description="Mide los tiempos de fotograma de todas las pantallas del juego.")
+    parser.add_argument("--frames", type=int, default=240, help="Fotogramas medidos por escenario.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(BOARD_SIZES), help="Tamaños de tablero.")
+    parser.add_argument("--only", nargs="+", default=None, help="Ejecuta solo los escenarios cuyo nombre contiene alguno de estos textos.")
+    parser.add_argument("--no-memory", action="store_true", help="No mide el uso de memoria.")
+    parser.add_argument("--output", default=None, help="Archivo JSON donde se guarda el resultado.")
+    parser.add_argument("--compare", default=None, help="Resultado anterior (JSON) con el que se compara el p95.")
+    args = parser.parse_args()
+
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pygame.init()
+    pygame.display.set_mode(WINDOW_SIZE)
+    result = run_benchmark(args.frames, tuple(args.sizes), args.only, not args.no_memory)
+    pygame.quit()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(result, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        for name, (previous, current, ratio) in compare_results(baseline, result).items():
+            print(f"{name:28} p95 {previous:8.3f} -> {current:8.3f} ms (x{ratio})")
+
+
+if __name__ == "__main__":
+    main()
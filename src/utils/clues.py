@@ -0,0 +1,52 @@
+import numpy as np
+
+
+def run_lengths(mask):
+    """
+    Calcula los largos de los bloques de celdas llenas de cada fila de una matriz.
+
+    Todas las filas se procesan en una sola pasada con np.diff y np.nonzero sobre la
+    matriz con un borde de ceros a cada lado.
+
+    Args:
+        mask (numpy.ndarray): Matriz 2D donde las celdas llenas son verdaderas (o 1).
+
+    Returns:
+        list: Una lista por fila con el largo de cada bloque, en orden.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    rows, cols = mask.shape
+    padded = np.zeros((rows, cols + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    start_rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    lengths = (ends - starts).tolist()
+    counts = np.bincount(start_rows, minlength=rows).tolist()
+
+    clues = []
+    position = 0
+    for count in counts:
+        clues.append(lengths[position:position + count])
+        position += count
+    return clues
+
+
+def grid_clues(grid, empty=None):
+    """
+    Calcula las pistas de todas las filas y columnas de una cuadrícula.
+
+    Args:
+        grid (list | numpy.ndarray): Cuadrícula donde el valor 1 indica una celda llena.
+        empty (list, optional): Pista a usar para las líneas sin bloques, por ejemplo [0]. Por defecto se deja la lista vacía.
+
+    Returns:
+        tuple: Una tupla (pistas de filas, pistas de columnas).
+    """
+    mask = np.asarray(grid) == 1
+    row_clues = run_lengths(mask)
+    col_clues = run_lengths(mask.T)
+    if empty is not None:
+        row_clues = [clue if clue else list(empty) for clue in row_clues]
+        col_clues = [clue if clue else list(empty) for clue in col_clues]
+    return row_clues, col_clues
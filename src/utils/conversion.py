@@ -0,0 +1,226 @@
+import multiprocessing
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.config import CONVERSION_WORKERS
+from src.utils.image_converter import (image_to_nonogram, conversion_candidates, evaluate_candidate, choose_best_candidate,
+                                       SEARCH_TIME_BUDGET)
+
+# Estado compartido con los procesos de conversión; se crea junto con el pool
+_executor = None
+_progress_queue = None
+_cancelled_job = None
+_next_job_id = 0
+
+
+class ConversionCancelled(Exception):
+    """
+    Excepción que indica que una conversión fue cancelada.
+    """
+
+
+def _init_worker(progress_queue, cancelled_job):
+    """
+    Guarda en el proceso de conversión la cola de progreso y el indicador de cancelación.
+
+    Args:
+        progress_queue (multiprocessing.Queue): Cola donde se informa el progreso.
+        cancelled_job (multiprocessing.Value): Número del último trabajo cancelado.
+    """
+    global _progress_queue, _cancelled_job
+    _progress_queue = progress_queue
+    _cancelled_job = cancelled_job
+
+
+def _convert(job_id, image_path, size, num_colors):
+    """
+    Convierte una imagen dentro de un proceso del pool, informando el progreso de cada etapa.
+
+    Args:
+        job_id (int): Número del trabajo.
+        image_path (str): Ruta a la imagen.
+        size (int): Tamaño de la cuadrícula.
+        num_colors (int): Número de colores para la cuantización.
+
+    Returns:
+        list: Cuadrícula, pistas de las filas y pistas de las columnas.
+
+    Raises:
+        ConversionCancelled: Si el trabajo se canceló mientras se convertía.
+    """
+    def report(fraction):
+        if _cancelled_job.value == job_id:
+            raise ConversionCancelled()
+        _progress_queue.put((job_id, fraction))
+
+    return image_to_nonogram(image_path, size, num_colors, progress=report)
+
+
+def _prepare_candidates(job_id, image_path, sizes, num_colors):
+    """
+    Genera las cuadrículas candidatas de una imagen dentro de un proceso del pool.
+
+    Args:
+        job_id (int): Número del trabajo.
+        image_path (str): Ruta a la imagen.
+        sizes (tuple): Tamaños de cuadrícula, en orden de preferencia.
+        num_colors (int): Número de colores para la cuantización.
+
+    Returns:
+        list: Candidatos generados por conversion_candidates.
+
+    Raises:
+        ConversionCancelled: Si el trabajo se canceló antes de empezar.
+    """
+    if _cancelled_job.value == job_id:
+        raise ConversionCancelled()
+    return conversion_candidates(image_path, sizes, num_colors=num_colors)
+
+
+def get_executor():
+    """
+    Obtiene el pool de procesos de conversión, creándolo la primera vez.
+
+    Los procesos se inician con "spawn" para no copiar el estado de pygame ni los hilos del juego.
+
+    Returns:
+        ProcessPoolExecutor: El pool de procesos.
+    """
+    global _executor, _progress_queue, _cancelled_job
+    if _executor is None:
+        context = multiprocessing.get_context("spawn")
+        _progress_queue = context.Queue()
+        _cancelled_job = context.Value("i", -1)
+        _executor = ProcessPoolExecutor(max_workers=CONVERSION_WORKERS, mp_context=context,
+                                        initializer=_init_worker, initargs=(_progress_queue, _cancelled_job))
+    return _executor
+
+
+def shutdown():
+    """
+    Cierra el pool de procesos de conversión, cancelando los trabajos pendientes.
+    """
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+class ConversionJob:
+    """
+    Clase que representa la conversión de una imagen en un Nonogram en un proceso aparte.
+
+    El bucle del juego llama a poll() en cada fotograma para actualizar el progreso sin bloquearse.
+
+    Si se indican varios tamaños, la conversión busca la mejor versión de la imagen: un proceso
+    genera los candidatos y luego cada candidato se evalúa con el resolvedor en paralelo en el pool.
+
+    Atributos:
+        job_id (int): Número del trabajo.
+        image_path (str): Ruta a la imagen.
+        sizes (tuple): Tamaños a probar en la búsqueda, o None para la conversión directa.
+        future (concurrent.futures.Future): Resultado de la conversión directa o de la generación de candidatos.
+        candidates (list): Candidatos de la búsqueda, o None mientras se generan.
+        evaluations (list): Evaluación en curso de cada candidato.
+        report (dict): Resultado de choose_best_candidate al terminar la búsqueda, con los candidatos descartados.
+        progress (float): Fracción completada, de 0 a 1.
+        cancelled (bool): Indica si se pidió cancelar la conversión.
+    """
+
+    def __init__(self, image_path, size=20, num_colors=2, sizes=None):
+        """
+        Inicia la conversión de una imagen.
+
+        Args:
+            image_path (str): Ruta a la imagen a convertir.
+            size (int, optional): Tamaño de la cuadrícula del Nonogram. Por defecto es 20.
+            num_colors (int, optional): Número de colores para la cuantización. Por defecto es 2.
+            sizes (tuple, optional): Tamaños a probar, en orden de preferencia, para buscar la versión con
+                solución única. Por defecto se hace la conversión directa con size.
+        """
+        global _next_job_id
+        _next_job_id += 1
+        self.job_id = _next_job_id
+        self.image_path = image_path
+        self.sizes = tuple(sizes) if sizes else None
+        self.candidates = None
+        self.evaluations = []
+        self.report = None
+        self.progress = 0.0
+        self.cancelled = False
+        if self.sizes:
+            self.future = get_executor().submit(_prepare_candidates, self.job_id, image_path, self.sizes, num_colors)
+        else:
+            self.future = get_executor().submit(_convert, self.job_id, image_path, size, num_colors)
+
+    def poll(self):
+        """
+        Lee el progreso informado por el proceso de conversión sin bloquearse.
+
+        Returns:
+            bool: True si la conversión terminó, falló o fue cancelada.
+        """
+        while True:
+            try:
+                job_id, fraction = _progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            if job_id == self.job_id:
+                self.progress = max(self.progress, fraction)
+        succeeded = self.future.done() and not self.future.cancelled() and self.future.exception() is None
+        if self.sizes and succeeded and not self.cancelled:
+            if self.candidates is None:
+                self.candidates = self.future.result()
+                deadline = time.time() + SEARCH_TIME_BUDGET
+                self.evaluations = [get_executor().submit(evaluate_candidate, candidate, deadline) for candidate in self.candidates]
+            finished = sum(evaluation.done() for evaluation in self.evaluations)
+            self.progress = 0.3 + 0.7 * finished / max(len(self.evaluations), 1)
+        elif succeeded:
+            self.progress = 1.0
+        return self.done
+
+    @property
+    def done(self):
+        """
+        Indica si la conversión ya no está en curso.
+
+        Returns:
+            bool: True si la conversión terminó, falló o fue cancelada.
+        """
+        if self.cancelled or not self.future.done():
+            return self.cancelled
+        if not self.sizes or self.future.cancelled() or self.future.exception() is not None:
+            return True
+        return self.candidates is not None and all(evaluation.done() for evaluation in self.evaluations)
+
+    def result(self):
+        """
+        Obtiene el resultado de una conversión terminada.
+
+        Returns:
+            list: Cuadrícula, pistas de las filas y pistas de las columnas.
+
+        Raises:
+            ConversionCancelled: Si la conversión fue cancelada.
+            Exception: El error ocurrido durante la conversión.
+        """
+        if self.cancelled:
+            raise ConversionCancelled()
+        # Si la preparación de los candidatos falló, su error es el que se propaga
+        candidates = self.future.result()
+        if not self.sizes:
+            return candidates
+        self.report = choose_best_candidate(self.candidates, [evaluation.result() for evaluation in self.evaluations])
+        best = self.report["best"]
+        return [best["grid"], best["row_clues"], best["col_clues"]]
+
+    def cancel(self):
+        """
+        Cancela la conversión. Si ya empezó, el proceso se detiene en la próxima etapa.
+        """
+        self.cancelled = True
+        for evaluation in self.evaluations:
+            evaluation.cancel()
+        if not self.future.cancel():
+            _cancelled_job.value = self.job_id
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+
+# Versión del formato de las entradas; cambiarla invalida todo el caché
+CACHE_VERSION = 1
+# Prefijo de las claves de los niveles personalizados
+CUSTOM_LEVEL_PREFIX = "custom_"
+
+
+def is_custom_level(level_key):
+    """
+    Indica si una clave de nivel corresponde a un Nonogram personalizado.
+
+    Args:
+        level_key (str): Clave del nivel.
+
+    Returns:
+        bool: True si el nivel se creó a partir de una imagen.
+    """
+    return level_key is not None and (level_key == "custom" or level_key.startswith(CUSTOM_LEVEL_PREFIX))
+
+
+def image_content_hash(image_path):
+    """
+    Calcula el hash del contenido de un archivo de imagen, leyéndolo por bloques.
+
+    Args:
+        image_path (str): Ruta a la imagen.
+
+    Returns:
+        str: Hash SHA-1 en hexadecimal.
+    """
+    digest = hashlib.sha1()
+    with open(image_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def conversion_key(content_hash, params):
+    """
+    Calcula la clave estable de un Nonogram personalizado.
+
+    Args:
+        content_hash (str): Hash del contenido de la imagen.
+        params (dict): Parámetros de la conversión (tamaños, colores, umbrales, etc.).
+
+    Returns:
+        str: Clave del nivel, con el prefijo CUSTOM_LEVEL_PREFIX.
+    """
+    encoded = json.dumps({"image": content_hash, "params": params, "version": CACHE_VERSION}, sort_keys=True)
+    return CUSTOM_LEVEL_PREFIX + hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+class ConversionCache:
+    """
+    Clase que guarda en disco los Nonogramas creados a partir de imágenes.
+
+    Cada entrada es un archivo <clave>.json. La fecha de modificación de los archivos marca el
+    último uso, y al superar max_bytes se borran las entradas usadas hace más tiempo.
+
+    Atributos:
+        directory (str): Carpeta del caché.
+        max_bytes (int): Tamaño máximo del caché en bytes.
+    """
+
+    def __init__(self, directory, max_bytes):
+        """
+        Inicializa una instancia de la clase ConversionCache.
+
+        Args:
+            directory (str): Carpeta del caché.
+            max_bytes (int): Tamaño máximo del caché en bytes.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def get_path(self, key):
+        """
+        Obtiene la ruta del archivo de una entrada.
+
+        Args:
+            key (str): Clave de la entrada.
+
+        Returns:
+            str: Ruta del archivo.
+        """
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        """
+        Obtiene una entrada y la marca como usada recientemente.
+
+        Args:
+            key (str): Clave de la entrada.
+
+        Returns:
+            dict: Datos del Nonogram (grid, row_clues, col_clues), o None si no está en el caché.
+        """
+        path = self.get_path(key)
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != CACHE_VERSION:
+            return None
+        return data
+
+    def put(self, key, data):
+        """
+        Guarda una entrada y descarta las usadas hace más tiempo si el caché supera su tamaño máximo.
+
+        Args:
+            key (str): Clave de la entrada.
+            data (dict): Datos del Nonogram (grid, row_clues, col_clues) y de la conversión.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.get_path(key)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(dict(data, version=CACHE_VERSION), f)
+        os.replace(temp_path, path)
+        self.evict()
+
+    def evict(self):
+        """
+        Borra las entradas usadas hace más tiempo hasta que el caché no supere max_bytes.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.startswith(CUSTOM_LEVEL_PREFIX) and name.endswith(".json"):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.directory, name))
+            total -= size
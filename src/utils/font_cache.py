@@ -0,0 +1,133 @@
+import os
+import threading
+from collections import OrderedDict
+
+import pygame
+
+# Fuente principal de la interfaz
+NEWSWEEKLY_FONT = os.path.join("assets", "fonts", "newsweekly", "newsweekly-Regular.ttf")
+
+
+class FontCache:
+    """
+    Clase que guarda las fuentes cargadas y los textos ya renderizados.
+
+    Las fuentes se cargan una sola vez por (ruta, tamaño). Los textos renderizados se
+    guardan por (ruta, tamaño, texto, color, antialias) y se descartan los menos usados
+    cuando se supera max_texts. Las superficies devueltas son compartidas y no se deben modificar.
+    El caché se puede usar desde varios hilos (por ejemplo, el que prepara niveles en segundo plano).
+
+    Atributos:
+        fonts (dict): Fuentes cargadas, por (ruta, tamaño).
+        texts (OrderedDict): Textos renderizados, del menos al más usado recientemente.
+        max_texts (int): Cantidad máxima de textos renderizados guardados.
+        hits (int): Textos encontrados en el caché.
+        misses (int): Textos que hubo que renderizar.
+        lock (threading.RLock): Candado que protege las fuentes y los textos guardados.
+    """
+
+    def __init__(self, max_texts=512):
+        """
+        Inicializa una instancia de la clase FontCache.
+
+        Args:
+            max_texts (int, optional): Cantidad máxima de textos renderizados guardados. Por defecto es 512.
+        """
+        self.fonts = {}
+        self.texts = OrderedDict()
+        self.max_texts = max_texts
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.RLock()
+
+    def get_font(self, path, size):
+        """
+        Obtiene una fuente, cargándola desde el disco solo la primera vez.
+
+        Args:
+            path (str): Ruta al archivo de la fuente, o None para la fuente por defecto de pygame.
+            size (int): Tamaño de la fuente.
+
+        Returns:
+            pygame.font.Font: La fuente.
+        """
+        key = (path, size)
+        with self.lock:
+            font = self.fonts.get(key)
+            if font is None:
+                if not pygame.font.get_init():
+                    pygame.font.init()
+                font = pygame.font.Font(path, size)
+                self.fonts[key] = font
+            return font
+
+    def render(self, path, size, text, color, antialias=True):
+        """
+        Obtiene un texto renderizado, reutilizando la superficie si ya se renderizó antes.
+
+        Args:
+            path (str): Ruta al archivo de la fuente, o None para la fuente por defecto de pygame.
+            size (int): Tamaño de la fuente.
+            text (str): Texto a renderizar.
+            color (tuple): Color del texto.
+            antialias (bool, optional): Indica si se suavizan los bordes. Por defecto es True.
+
+        Returns:
+            pygame.Surface: Superficie con el texto.
+        """
+        key = (path, size, text, tuple(color), antialias)
+        with self.lock:
+            surface = self.texts.get(key)
+            if surface is not None:
+                self.texts.move_to_end(key)
+                self.hits += 1
+                return surface
+            self.misses += 1
+            surface = self.get_font(path, size).render(text, antialias, color)
+            self.texts[key] = surface
+            if len(self.texts) > self.max_texts:
+                self.texts.popitem(last=False)
+            return surface
+
+    def clear(self):
+        """
+        Descarta todas las fuentes y textos guardados.
+        """
+        with self.lock:
+            self.fonts.clear()
+            self.texts.clear()
+
+
+# Caché compartido por todas las pantallas
+font_cache = FontCache()
+
+
+def get_font(path, size):
+    """
+    Obtiene una fuente del caché compartido.
+
+    Args:
+        path (str): Ruta al archivo de la fuente, o None para la fuente por defecto de pygame.
+        size (int): Tamaño de la fuente.
+
+    Returns:
+        pygame.font.Font: La fuente.
+    """
+    return font_cache.get_font(path, size)
+
+
+def render_text(path, size, text, color, antialias=True):
+    """
+    Obtiene un texto renderizado del caché compartido.
+
+    Args:
+        path (str): Ruta al archivo de la fuente, o None para la fuente por defecto de pygame.
+        size (int): Tamaño de la fuente.
+        text (str): Texto a renderizar.
+        color (tuple): Color del texto.
+        antialias (bool, optional): Indica si se suavizan los bordes. Por defecto es True.
+
+    Returns:
+        pygame.Surface: Superficie con el texto; no se debe modificar.
+    """
+    return font_cache.render(path, size, text, color, antialias)
@@ -0,0 +1,240 @@
+import cProfile
+import os
+import time
+from collections import deque
+
+import pygame
+
+from src.utils.font_cache import font_cache, get_font
+
+# Teclas que muestran u ocultan la superposición y que empiezan o terminan una captura de cProfile
+OVERLAY_KEY = pygame.K_F3
+CAPTURE_KEY = pygame.K_F12
+# Fotogramas entre dos actualizaciones del texto de la superposición
+OVERLAY_REFRESH_FRAMES = 15
+OVERLAY_SIZE = (330, 250)
+
+
+class FrameProfiler:
+    """
+    Clase que mide cuánto tarda cada fase de los fotogramas y muestra el resultado sobre el juego.
+
+    El bucle principal llama a begin_frame al empezar un fotograma, a mark al terminar cada fase
+    (con el nombre de la pantalla, si la fase es de una pantalla) y a end_frame al terminar. Cada
+    llamada mide el tiempo desde la anterior. Mientras el perfilador está desactivado esas llamadas
+    solo verifican un atributo, así que se pueden dejar en el código de producción.
+
+    Además puede grabar un perfil de cProfile, con CAPTURE_KEY o durante toda la sesión, y
+    escribirlo en un archivo .pstats.
+
+    Atributos:
+        enabled (bool): Indica si se miden las fases.
+        always_enabled (bool): Indica si la medición se pidió al crear el perfilador; si no, solo se mide mientras se ve la superposición.
+        overlay_visible (bool): Indica si se dibuja la superposición.
+        frames (collections.deque): Últimos fotogramas medidos, como tuplas (tiempo total, tiempos por fase).
+        current (dict): Tiempos por fase del fotograma en curso, en segundos.
+        frame_start (float): Momento en que empezó el fotograma en curso.
+        last_mark (float): Momento de la última marca.
+        overlay (pygame.Surface): Superposición dibujada la última vez que se actualizó.
+        frames_since_refresh (int): Fotogramas desde la última actualización de la superposición.
+        profile (cProfile.Profile): Captura de cProfile en curso, o None.
+        dump_dir (str): Carpeta donde se escriben las capturas de CAPTURE_KEY.
+    """
+
+    def __init__(self, enabled=False, window=120, dump_dir="profiles"):
+        """
+        Inicializa una instancia de la clase FrameProfiler.
+
+        Args:
+            enabled (bool, optional): Indica si se miden las fases desde el inicio. Por defecto es False.
+            window (int, optional): Cantidad de fotogramas con los que se calculan los promedios. Por defecto es 120.
+            dump_dir (str, optional): Carpeta de las capturas de cProfile. Por defecto es "profiles".
+        """
+        self.enabled = enabled
+        self.always_enabled = enabled
+        self.overlay_visible = False
+        self.frames = deque(maxlen=window)
+        self.current = {}
+        self.frame_start = 0.0
+        self.last_mark = 0.0
+        self.overlay = None
+        self.frames_since_refresh = 0
+        self.profile = None
+        self.dump_dir = dump_dir
+
+    def begin_frame(self):
+        """
+        Marca el inicio de un fotograma.
+        """
+        if not self.enabled:
+            return
+        self.frame_start = self.last_mark = time.perf_counter()
+        self.current = {}
+
+    def mark(self, phase, screen=None):
+        """
+        Marca el final de una fase; su duración es el tiempo desde la marca anterior.
+
+        Args:
+            phase (str): Nombre de la fase.
+            screen (object, optional): Pantalla a la que pertenece la fase; su clase forma parte del nombre.
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        key = phase if screen is None else f"{type(screen).__name__}.{phase}"
+        self.current[key] = self.current.get(key, 0.0) + now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self):
+        """
+        Marca el final de un fotograma y lo guarda entre los últimos medidos.
+        """
+        if not self.enabled:
+            return
+        self.frames.append((time.perf_counter() - self.frame_start, self.current))
+        self.frames_since_refresh += 1
+
+    def get_stats(self):
+        """
+        Calcula los promedios de los últimos fotogramas medidos y el peor de ellos.
+
+        Returns:
+            dict: Diccionario con frames, average (tiempo medio por fotograma), phases (tiempo medio por fase,
+            de mayor a menor) y worst (tupla con el tiempo total y los tiempos por fase del peor fotograma), en segundos.
+        """
+        if not self.frames:
+            return {"frames": 0, "average": 0.0, "phases": [], "worst": (0.0, {})}
+        totals = {}
+        for _, phases in self.frames:
+            for phase, seconds in phases.items():
+                totals[phase] = totals.get(phase, 0.0) + seconds
+        count = len(self.frames)
+        phases = sorted(((phase, seconds / count) for phase, seconds in totals.items()), key=lambda item: -item[1])
+        return {
+            "frames": count,
+            "average": sum(total for total, _ in self.frames) / count,
+            "phases": phases,
+            "worst": max(self.frames, key=lambda frame: frame[0]),
+        }
+
+    def handle_event(self, event):
+        """
+        Atiende las teclas del perfilador.
+
+        Args:
+            event (pygame.event.Event): Evento a revisar.
+
+        Returns:
+            bool: True si el evento era una tecla del perfilador.
+        """
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == OVERLAY_KEY:
+            self.toggle_overlay()
+            return True
+        if event.key == CAPTURE_KEY:
+            if self.profile is None:
+                self.start_capture()
+            else:
+                self.stop_capture()
+            return True
+        return False
+
+    def toggle_overlay(self):
+        """
+        Muestra u oculta la superposición; mostrarla activa la medición de las fases y
+        ocultarla la deja como se pidió al crear el perfilador.
+        """
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            # La medición empieza a mitad del fotograma en curso
+            self.enabled = True
+            self.frames.clear()
+            self.frame_start = self.last_mark = time.perf_counter()
+            self.current = {}
+        else:
+            # Las capturas de cProfile no dependen de enabled, así que no hace falta seguir midiendo
+            self.enabled = self.always_enabled
+        self.overlay = None
+
+    def draw_overlay(self, screen):
+        """
+        Dibuja la superposición con los promedios y el peor fotograma.
+
+        El texto se vuelve a componer cada OVERLAY_REFRESH_FRAMES fotogramas; entre medio se copia la última versión.
+
+        Args:
+            screen (pygame.Surface): Superficie de la pantalla.
+
+        Returns:
+            pygame.Rect: Área dibujada, o None si la superposición está oculta.
+        """
+        if not self.overlay_visible:
+            return None
+        if self.overlay is None or self.frames_since_refresh >= OVERLAY_REFRESH_FRAMES:
+            self.overlay = self.build_overlay()
+            self.frames_since_refresh = 0
+        return screen.blit(self.overlay, (10, 10))
+
+    def build_overlay(self):
+        """
+        Compone la superposición a partir de get_stats.
+
+        Returns:
+            pygame.Surface: La superposición, de tamaño OVERLAY_SIZE.
+        """
+        stats = self.get_stats()
+        worst_total, worst_phases = stats["worst"]
+        worst_phase = max(worst_phases.items(), key=lambda item: item[1], default=("-", 0.0))
+        # Cada línea tiene un texto a la izquierda y un tiempo en milisegundos alineado a la derecha
+        lines = [(f"avg of {stats['frames']} frames", f"{stats['average'] * 1000:.2f} ms")]
+        lines += [(phase, f"{seconds * 1000:.2f}") for phase, seconds in stats["phases"][:9]]
+        lines.append(("worst frame", f"{worst_total * 1000:.2f} ms"))
+        lines.append((f"  {worst_phase[0]}", f"{worst_phase[1] * 1000:.2f}"))
+        if self.profile is not None:
+            lines.append(("cProfile: capturing (F12 to save)", ""))
+
+        surface = pygame.Surface(OVERLAY_SIZE)
+        surface.fill((20, 20, 20))
+        # Se renderiza con la fuente compartida bajo su candado, por el hilo que prepara niveles
+        with font_cache.lock:
+            font = get_font(None, 20)
+            for i, (label, value) in enumerate(lines):
+                y = 6 + i * 19
+                surface.blit(font.render(label, True, (230, 230, 230)), (8, y))
+                value_surface = font.render(value, True, (230, 230, 230))
+                surface.blit(value_surface, (OVERLAY_SIZE[0] - 8 - value_surface.get_width(), y))
+        return surface
+
+    def start_capture(self):
+        """
+        Empieza una captura de cProfile.
+        """
+        self.profile = cProfile.Profile()
+        self.profile.enable()
+        self.overlay = None
+
+    def stop_capture(self, path=None):
+        """
+        Termina la captura de cProfile en curso y la escribe en un archivo .pstats.
+
+        Args:
+            path (str, optional): Ruta del archivo. Por defecto es un archivo con la fecha y hora en dump_dir.
+
+        Returns:
+            str: Ruta del archivo escrito, o None si no había una captura en curso.
+        """
+        if self.profile is None:
+            return None
+        self.profile.disable()
+        if path is None:
+            path = os.path.join(self.dump_dir, time.strftime("frame_profile_%Y%m%d_%H%M%S.pstats"))
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.profile.dump_stats(path)
+        self.profile = None
+        self.overlay = None
+        print(f"Perfil de cProfile guardado en {path}")
+        return path
@@ -1,77 +1,265 @@
-import itertools
-from PIL import Image
+import time
+
 import numpy as np
-from pygame.examples.cursors import image
+from PIL import Image
+from src.utils.clues import grid_clues
+from src.logic.solver import NonogramSolver
+
+# Umbral de luminosidad por debajo del cual un píxel se considera oscuro
+BLACK_THRESHOLD = 50
+# Con draft, las imágenes se reducen hasta no menos de este múltiplo del tamaño final
+DRAFT_FACTOR = 16
+# Modos de imagen que Image.reduce acepta directamente
+REDUCE_MODES = ("L", "LA", "RGB", "RGBA", "RGBX", "CMYK", "I", "F", "PA")
+# Umbrales de luminosidad probados al buscar la mejor conversión, en orden de preferencia
+SEARCH_THRESHOLDS = (128, 96, 160, 64, 192)
+# Límite de nodos de búsqueda al verificar si un candidato tiene solución única
+SEARCH_MAX_NODES = 2000
+# Segundos disponibles para evaluar todos los candidatos de una imagen, compartidos entre ellos
+SEARCH_TIME_BUDGET = 0.8
+
+
+def open_image(image_path, size, draft=True):
+    """
+    Abre una imagen una sola vez.
+
+    Con draft, los JPEG se decodifican directamente a una escala reducida (1/2, 1/4 o 1/8) y
+    cualquier imagen que siga siendo grande se reduce con Image.reduce por un factor entero,
+    sin bajar de DRAFT_FACTOR veces el tamaño final. Así la conversión posterior (escala de
+    grises, RGB y LANCZOS) nunca trabaja sobre la resolución completa.
+
+    Args:
+        image_path (str): Ruta a la imagen.
+        size (int): Tamaño de la cuadrícula del Nonogram.
+        draft (bool, optional): Indica si se permite reducir la imagen. Por defecto es True.
+
+    Returns:
+        PIL.Image.Image: La imagen decodificada.
+    """
+    image = Image.open(image_path)
+    if draft and image.format == "JPEG":
+        # draft solo reduce en potencias de 2 y nunca por debajo del tamaño pedido
+        image.draft("RGB", (size * DRAFT_FACTOR, size * DRAFT_FACTOR))
+    image.load()
+    if draft:
+        factor = min(image.size) // (size * DRAFT_FACTOR)
+        if factor >= 2:
+            if image.mode not in REDUCE_MODES:
+                # reduce no admite paletas ni imágenes de 1 bit; la transparencia se conserva como alfa
+                image = image.convert('RGBA' if image.has_transparency_data else 'RGB')
+            image = image.reduce(factor)
+    return image
+
+
+def dark_ratio(image):
+    """
+    Calcula la fracción de píxeles oscuros de una imagen.
+
+    Args:
+        image (PIL.Image.Image): Imagen a analizar.
+
+    Returns:
+        float: Fracción de píxeles con luminosidad menor que BLACK_THRESHOLD.
+    """
+    gray = np.asarray(image.convert('L'))
+    return int(np.count_nonzero(gray < BLACK_THRESHOLD)) / float(gray.size)
+
 
-def image_to_nonogram(image_path, size = 20, num_colors=2):
+def image_to_nonogram(image_path, size = 20, num_colors=2, progress=None, draft=True):
     """
     Convierte una imagen en un Nonograma.
 
+    La imagen se decodifica una sola vez; la proporción de píxeles oscuros y las pistas se
+    calculan con operaciones vectorizadas de NumPy. Con draft=False el resultado es exactamente
+    el de procesar la imagen a resolución completa; con draft, las imágenes grandes se reducen
+    antes (ver open_image) y alguna celda en el límite del umbral puede cambiar.
+
     Args:
         image_path (str): Ruta a la imagen a convertir.
         size (int, optional): Tamaño de la cuadrícula del Nonogram. Por defecto es 20.
         num_colors (int, optional): Número de colores para la cuantización de la imagen. Por defecto es 2 (blanco y negro).
+        progress (callable, optional): Función que recibe la fracción completada (de 0 a 1) después de cada etapa.
+        draft (bool, optional): Indica si se permite reducir la imagen antes de convertirla. Por defecto es True.
 
     Returns:
         list: Una lista que contiene la cuadrícula del Nonogram, las pistas de las filas y las pistas de las columnas.
     """
-    image = Image.open(image_path)
-    img_alpha = False
-    if image.has_transparency_data:
-        img_alpha = True
-    image = Image.open(image_path).convert('L')
-    pixels = image.getdata()
-    black_thresh = 50
-    nblack = 0
-    for pixel in pixels:
-        if pixel < black_thresh:
-            nblack += 1
-    n = len(pixels)
-
-    image = Image.open(image_path).convert('RGB')
+    if progress is None:
+        progress = lambda fraction: None
+    image = open_image(image_path, size, draft)
+    img_alpha = image.has_transparency_data
+    progress(0.2)
+
+    ratio = dark_ratio(image)
+    progress(0.5)
+
+    image = image.convert('RGB')
     image = image.resize((size, size), Image.Resampling.LANCZOS)
+    progress(0.8)
 
-    image_quantized = image.convert('P', palette=Image.ADAPTIVE, colors=num_colors)
-    image_quantized = np.array(image_quantized)
+    image_quantized = quantize_adaptive(image, num_colors, ratio > 0.5 or img_alpha)
 
-    if (nblack / float(n)) > 0.5 or img_alpha:
+    row_clues, col_clues = grid_clues(image_quantized, empty=[0])
+    progress(1.0)
+
+    return [image_quantized.tolist(), row_clues, col_clues]
+
+
+def quantize_adaptive(image, num_colors, invert):
+    """
+    Cuantiza una imagen ya reducida con una paleta adaptativa.
+
+    Args:
+        image (PIL.Image.Image): Imagen RGB del tamaño de la cuadrícula.
+        num_colors (int): Número de colores de la paleta.
+        invert (bool): Indica si se invierten las celdas (imágenes oscuras o con transparencia).
+
+    Returns:
+        numpy.ndarray: Índices de la paleta de cada celda.
+    """
+    image_quantized = np.array(image.convert('P', palette=Image.ADAPTIVE, colors=num_colors))
+    if invert:
         image_quantized = np.logical_not(image_quantized).astype(int)
+    return image_quantized
 
 
-    row_clues = []
-    col_clues = []
+def conversion_candidates(image_path, sizes=(20,), thresholds=SEARCH_THRESHOLDS, num_colors=2, draft=True):
+    """
+    Genera las cuadrículas candidatas de una imagen para varios tamaños y métodos de cuantización.
 
-    for row in image_quantized:
-        clues = []
-        current_color = None
-        count = 0
-        for pixel in row:
-            if pixel != current_color:
-                if current_color==1:
-                    clues.append(count)
-                current_color = pixel
-                count = 1
-            else:
-                count += 1
-        if current_color==1:
-            clues.append(count)
-        row_clues.append(clues if clues else [0])
-
-    for col in image_quantized.T:
-        clues = []
-        current_color = None
-        count = 0
-        for pixel in col:
-            if pixel != current_color:
-                if current_color==1:
-                    clues.append(count)
-                current_color = pixel
-                count = 1
+    La imagen se decodifica y se reduce una sola vez, según el mayor tamaño. Por cada tamaño se
+    genera primero el candidato con paleta adaptativa y luego uno por cada umbral de luminosidad.
+    Con draft, la reducción depende del mayor tamaño pedido, así que el candidato con paleta
+    adaptativa puede diferir en alguna celda del de image_to_nonogram.
+
+    Args:
+        image_path (str): Ruta a la imagen.
+        sizes (tuple, optional): Tamaños de cuadrícula, en orden de preferencia. Por defecto es (20,).
+        thresholds (tuple, optional): Umbrales de luminosidad, en orden de preferencia. Por defecto es SEARCH_THRESHOLDS.
+        num_colors (int, optional): Número de colores de la paleta adaptativa. Por defecto es 2.
+        draft (bool, optional): Indica si se permite reducir la imagen antes de convertirla. Por defecto es True.
+
+    Returns:
+        list: Diccionarios con size, method, grid, row_clues y col_clues, en orden de preferencia.
+    """
+    image = open_image(image_path, max(sizes), draft)
+    alpha = image.has_transparency_data
+    invert = dark_ratio(image) > 0.5 or alpha
+    image = image.convert('RGB')
+
+    candidates = []
+    for size in sizes:
+        resized = image.resize((size, size), Image.Resampling.LANCZOS)
+        grids = [("adaptive", quantize_adaptive(resized, num_colors, invert))]
+        gray = np.asarray(resized.convert('L'))
+        for threshold in thresholds:
+            # Las celdas llenas son las oscuras, o las claras si la imagen se invierte
+            grids.append((f"threshold {threshold}", ((gray < threshold) != invert).astype(int)))
+        for method, grid in grids:
+            row_clues, col_clues = grid_clues(grid, empty=[0])
+            candidates.append({"size": size, "method": method, "grid": grid.tolist(),
+                               "row_clues": row_clues, "col_clues": col_clues})
+    return candidates
+
+
+def evaluate_candidate(candidate, deadline=None):
+    """
+    Evalúa si un candidato tiene solución única y si se resuelve solo con lógica de líneas.
+
+    La propagación de líneas siempre se completa, así que un candidato que se resuelve solo con
+    lógica se reconoce aunque ya no quede tiempo; la búsqueda se detiene en deadline.
+
+    Args:
+        candidate (dict): Candidato generado por conversion_candidates.
+        deadline (float, optional): Momento, según time.time(), en que se detiene la búsqueda. Por defecto no hay límite.
+
+    Returns:
+        dict: Diccionario con status, logic_solvable, density, rank y reason. El rango es 2 si la
+        solución es única y se deduce solo con lógica, 1 si es única pero requiere búsqueda y 0 si se rechaza.
+    """
+    grid = np.asarray(candidate["grid"]) == 1
+    density = float(grid.mean())
+    result = {"status": None, "logic_solvable": False, "density": round(density, 4), "rank": 0, "reason": None}
+    if not grid.any():
+        result["reason"] = "la cuadrícula está vacía"
+        return result
+    if grid.all():
+        result["reason"] = "la cuadrícula está llena"
+        return result
+
+    # time.time() es comparable entre procesos, así que todos los candidatos comparten el mismo límite
+    time_budget = None if deadline is None else max(0.0, deadline - time.time())
+    solver = NonogramSolver(candidate["row_clues"], candidate["col_clues"], max_solutions=2,
+                            max_nodes=SEARCH_MAX_NODES, time_budget=time_budget)
+    solver.solve()
+    result["status"] = solver.status
+    result["logic_solvable"] = solver.logic_solvable
+    if solver.status == "multiple":
+        result["reason"] = "tiene varias soluciones"
+    elif solver.status == "unknown":
+        result["reason"] = "se alcanzó el límite de búsqueda o de tiempo"
+    elif solver.status == "none":
+        result["reason"] = "las pistas no tienen solución"
+    else:
+        result["rank"] = 2 if solver.logic_solvable else 1
+    return result
+
+
+def choose_best_candidate(candidates, evaluations):
+    """
+    Elige el mejor candidato y explica por qué se descartaron los demás.
+
+    Gana el candidato de mayor rango; entre los de igual rango, el primero en orden de preferencia.
+    Si ninguno tiene solución única se elige el primero que no esté vacío ni lleno.
+
+    Args:
+        candidates (list): Candidatos generados por conversion_candidates.
+        evaluations (list): Resultado de evaluate_candidate para cada candidato.
+
+    Returns:
+        dict: Diccionario con best (candidato elegido, con su evaluación), accepted (si tiene solución
+        única) y rejected (lista de size, method y reason de los demás candidatos).
+    """
+    best_index = max(range(len(candidates)), key=lambda i: (evaluations[i]["rank"], evaluations[i]["status"] is not None, -i))
+    best_rank = evaluations[best_index]["rank"]
+    rejected = []
+    for i, (candidate, evaluation) in enumerate(zip(candidates, evaluations)):
+        if i == best_index:
+            continue
+        reason = evaluation["reason"]
+        if reason is None:
+            if evaluation["rank"] < best_rank:
+                reason = "requiere búsqueda: no se resuelve solo con lógica de líneas"
             else:
-                count += 1
-        if current_color==1:
-            clues.append(count)
-        col_clues.append(clues if clues else [0])
+                reason = "hay un candidato preferido con el mismo resultado"
+        rejected.append({"size": candidate["size"], "method": candidate["method"], "reason": reason})
+    best = dict(candidates[best_index], **evaluations[best_index])
+    return {"best": best, "accepted": best_rank > 0, "rejected": rejected}
 
-    return [image_quantized.tolist(), row_clues, col_clues]
 
+def find_best_nonogram(image_path, sizes=(20,), thresholds=SEARCH_THRESHOLDS, num_colors=2, draft=True, executor=None,
+                       time_budget=SEARCH_TIME_BUDGET):
+    """
+    Convierte una imagen probando varios tamaños y umbrales, y elige la versión con solución única
+    que mejor se resuelva con lógica de líneas.
+
+    Todos los candidatos comparten time_budget; como se evalúan en orden de preferencia, los
+    preferidos reciben primero el tiempo de búsqueda.
+
+    Args:
+        image_path (str): Ruta a la imagen.
+        sizes (tuple, optional): Tamaños de cuadrícula, en orden de preferencia. Por defecto es (20,).
+        thresholds (tuple, optional): Umbrales de luminosidad, en orden de preferencia. Por defecto es SEARCH_THRESHOLDS.
+        num_colors (int, optional): Número de colores de la paleta adaptativa. Por defecto es 2.
+        draft (bool, optional): Indica si se permite reducir la imagen antes de convertirla. Por defecto es True.
+        executor (concurrent.futures.Executor, optional): Pool donde evaluar los candidatos en paralelo. Por defecto se evalúan en este proceso.
+        time_budget (float, optional): Segundos para evaluar todos los candidatos, o None para no limitar. Por defecto es SEARCH_TIME_BUDGET.
+
+    Returns:
+        dict: El resultado de choose_best_candidate.
+    """
+    candidates = conversion_candidates(image_path, sizes, thresholds, num_colors, draft)
+    deadline = None if time_budget is None else time.time() + time_budget
+    evaluate = executor.map if executor is not None else map
+    evaluations = list(evaluate(evaluate_candidate, candidates, [deadline] * len(candidates)))
+    return choose_best_candidate(candidates, evaluations)
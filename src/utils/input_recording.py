@@ -0,0 +1,251 @@
+import struct
+import zlib
+
+import numpy as np
+import pygame
+
+from src.utils.save_format import pack_cells
+
+# Formato de las grabaciones de entrada:
+#   cabecera sin comprimir: magic (4 bytes), versión (uint16), ancho y alto de la ventana (uint16),
+#   pantalla inicial y nivel inicial (uint8 con el largo y el texto en UTF-8).
+#   cuerpo comprimido con zlib: un registro RECORD_FORMAT por evento, y al final un registro
+#   END_RECORD con la cantidad de fotogramas y la suma de verificación del tablero final.
+# Cada registro guarda el fotograma, los milisegundos desde el inicio, el tipo de evento,
+# cuatro enteros, una tecla o máscara de botones y un valor decimal; su significado depende del tipo.
+RECORD_MAGIC = b"AGIR"
+RECORD_VERSION = 1
+RECORD_FORMAT = "<IIHhhhhIf"
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+END_RECORD = 0xFFFF
+RECORDED_EVENTS = (
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION, pygame.MOUSEWHEEL,
+    pygame.KEYDOWN, pygame.KEYUP,
+    pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP, pygame.JOYAXISMOTION, pygame.JOYHATMOTION,
+)
+
+
+def encode_event(event):
+    """
+    Convierte un evento en los campos de un registro.
+
+    Args:
+        event (pygame.event.Event): Evento a grabar.
+
+    Returns:
+        tuple: Los campos (tipo, a, b, c, d, tecla, valor), o None si el evento no se graba.
+    """
+    kind = event.type
+    if kind == pygame.MOUSEMOTION:
+        buttons = sum(1 << i for i, pressed in enumerate(event.buttons) if pressed)
+        return kind, event.pos[0], event.pos[1], event.rel[0], event.rel[1], buttons, 0.0
+    if kind in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        return kind, event.pos[0], event.pos[1], event.button, 0, 0, 0.0
+    if kind == pygame.MOUSEWHEEL:
+        return kind, event.x, event.y, 0, 0, 0, 0.0
+    if kind in (pygame.KEYDOWN, pygame.KEYUP):
+        return kind, event.mod, event.scancode, 0, 0, event.key, 0.0
+    if kind in (pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP):
+        return kind, event.instance_id, 0, event.button, 0, 0, 0.0
+    if kind == pygame.JOYAXISMOTION:
+        return kind, event.instance_id, 0, event.axis, 0, 0, event.value
+    if kind == pygame.JOYHATMOTION:
+        return kind, event.instance_id, 0, event.hat, 0, 0, 0.0
+    return None
+
+
+def decode_event(kind, a, b, c, d, key, value):
+    """
+    Reconstruye un evento a partir de los campos de un registro.
+
+    Args:
+        kind (int): Tipo del evento.
+        a, b, c, d (int): Enteros del registro.
+        key (int): Tecla o máscara de botones.
+        value (float): Valor decimal del registro.
+
+    Returns:
+        pygame.event.Event: El evento reconstruido.
+    """
+    if kind == pygame.MOUSEMOTION:
+        buttons = tuple(bool(key & (1 << i)) for i in range(3))
+        return pygame.event.Event(kind, pos=(a, b), rel=(c, d), buttons=buttons)
+    if kind in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+        return pygame.event.Event(kind, pos=(a, b), button=c)
+    if kind == pygame.MOUSEWHEEL:
+        return pygame.event.Event(kind, x=a, y=b)
+    if kind in (pygame.KEYDOWN, pygame.KEYUP):
+        return pygame.event.Event(kind, key=key, mod=a, scancode=b, unicode="")
+    if kind in (pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP):
+        return pygame.event.Event(kind, instance_id=a, joy=a, button=c)
+    if kind == pygame.JOYAXISMOTION:
+        return pygame.event.Event(kind, instance_id=a, joy=a, axis=c, value=value)
+    return pygame.event.Event(kind, instance_id=a, joy=a, hat=c, value=(0, 0))
+
+
+def board_checksum(nonogram):
+    """
+    Calcula una suma de verificación del tablero del jugador.
+
+    Args:
+        nonogram (Nonogram): El Nonogram actual, o None.
+
+    Returns:
+        int: CRC-32 de las celdas empaquetadas, o 0 si no hay un Nonogram.
+    """
+    if nonogram is None:
+        return 0
+    return zlib.crc32(pack_cells(nonogram.get_player_grid()))
+
+
+def frame_time_summary(frame_times):
+    """
+    Resume una lista de tiempos de fotograma.
+
+    Args:
+        frame_times (list): Tiempos de cada fotograma en segundos.
+
+    Returns:
+        dict: Cantidad de fotogramas y tiempo medio, p50, p95, p99 y máximo en milisegundos.
+    """
+    if not frame_times:
+        return {"frames": 0, "mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    times = np.asarray(frame_times) * 1000
+    p50, p95, p99 = np.percentile(times, [50, 95, 99])
+    return {
+        "frames": len(times),
+        "mean_ms": round(float(times.mean()), 3),
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "max_ms": round(float(times.max()), 3),
+    }
+
+
+def pack_text(text):
+    """
+    Empaqueta un texto corto con su largo.
+
+    Args:
+        text (str): Texto de hasta 255 bytes en UTF-8, o None.
+
+    Returns:
+        bytes: El largo (uint8) seguido del texto.
+    """
+    encoded = (text or "").encode("utf-8")[:255]
+    return struct.pack("<B", len(encoded)) + encoded
+
+
+def unpack_text(data, position):
+    """
+    Desempaqueta un texto guardado con pack_text.
+
+    Args:
+        data (bytes): Datos de la grabación.
+        position (int): Posición donde empieza el texto.
+
+    Returns:
+        tuple: Una tupla (texto o None si estaba vacío, posición siguiente).
+    """
+    length = data[position]
+    text = data[position + 1:position + 1 + length].decode("utf-8")
+    return text or None, position + 1 + length
+
+
+class InputRecorder:
+    """
+    Clase que graba en un archivo los eventos de entrada de una sesión, fotograma por fotograma.
+
+    Los registros se comprimen a medida que se graban, así que una sesión larga no se guarda en memoria.
+
+    Atributos:
+        file (file): Archivo de la grabación.
+        compressor (zlib.Compress): Compresor del cuerpo de la grabación.
+        start_ticks (int): Milisegundos de pygame al empezar la grabación.
+        events (int): Cantidad de eventos grabados.
+    """
+
+    def __init__(self, path, screen_size, screen_name, level_key=None):
+        """
+        Inicializa una instancia de la clase InputRecorder y escribe la cabecera.
+
+        Args:
+            path (str): Ruta del archivo de la grabación.
+            screen_size (tuple): Ancho y alto de la ventana.
+            screen_name (str): Pantalla en la que empieza la sesión.
+            level_key (str, optional): Nivel con el que empieza la sesión. Por defecto es None.
+        """
+        self.file = open(path, "wb")
+        self.file.write(struct.pack("<4sHHH", RECORD_MAGIC, RECORD_VERSION, *screen_size))
+        self.file.write(pack_text(screen_name) + pack_text(level_key))
+        self.compressor = zlib.compressobj(9)
+        self.start_ticks = pygame.time.get_ticks()
+        self.events = 0
+
+    def record(self, frame, events):
+        """
+        Graba los eventos de entrada de un fotograma; los demás eventos se ignoran.
+
+        Args:
+            frame (int): Número del fotograma.
+            events (list): Eventos recibidos en el fotograma.
+        """
+        elapsed = pygame.time.get_ticks() - self.start_ticks
+        for event in events:
+            fields = encode_event(event)
+            if fields is not None:
+                self.file.write(self.compressor.compress(struct.pack(RECORD_FORMAT, frame, elapsed, *fields)))
+                self.events += 1
+
+    def close(self, frames, checksum):
+        """
+        Escribe el registro final y cierra el archivo.
+
+        Args:
+            frames (int): Cantidad de fotogramas de la sesión.
+            checksum (int): Suma de verificación del tablero final (board_checksum).
+        """
+        elapsed = pygame.time.get_ticks() - self.start_ticks
+        end = struct.pack(RECORD_FORMAT, frames, elapsed, END_RECORD, 0, 0, 0, 0, checksum, 0.0)
+        self.file.write(self.compressor.compress(end) + self.compressor.flush())
+        self.file.close()
+
+
+def load_recording(path):
+    """
+    Lee una grabación de entrada.
+
+    Args:
+        path (str): Ruta del archivo de la grabación.
+
+    Returns:
+        dict: Diccionario con screen_size, screen, level, frames (eventos por número de fotograma),
+        total_frames, milliseconds y checksum (suma de verificación del tablero final, o None si la grabación está incompleta).
+
+    Raises:
+        ValueError: Si el archivo no es una grabación compatible.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, width, height = struct.unpack_from("<4sHHH", data, 0)
+    if magic != RECORD_MAGIC or version != RECORD_VERSION:
+        raise ValueError("El archivo no es una grabación de entrada compatible")
+    screen, position = unpack_text(data, 10)
+    level, position = unpack_text(data, position)
+    # Una grabación interrumpida no tiene registro final, pero se reproduce hasta donde llegó
+    body = zlib.decompressobj().decompress(data[position:])
+
+    frames = {}
+    total_frames = 0
+    milliseconds = 0
+    checksum = None
+    for offset in range(0, len(body) - RECORD_SIZE + 1, RECORD_SIZE):
+        frame, milliseconds, kind, a, b, c, d, key, value = struct.unpack_from(RECORD_FORMAT, body, offset)
+        total_frames = max(total_frames, frame + 1)
+        if kind == END_RECORD:
+            total_frames = frame
+            checksum = key
+            break
+        frames.setdefault(frame, []).append(decode_event(kind, a, b, c, d, key, value))
+    return {"screen_size": (width, height), "screen": screen, "level": level, "frames": frames,
+            "total_frames": total_frames, "milliseconds": milliseconds, "checksum": checksum}
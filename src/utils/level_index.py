@@ -0,0 +1,127 @@
+import argparse
+import hashlib
+import json
+import os
+
+from src.utils.level_pack import load_json_levels
+
+# Umbrales del puntaje de dificultad: (puntaje máximo exclusivo, dificultad). Lo que los supera es "hard".
+DIFFICULTY_THRESHOLDS = ((300, "easy"), (1000, "medium"))
+
+
+def level_hash(level_data):
+    """
+    Calcula un hash del contenido de un nivel, independiente del formato del archivo.
+
+    Args:
+        level_data (dict): Diccionario con las claves grid, row_clues y col_clues.
+
+    Returns:
+        str: Hash SHA-1 en hexadecimal.
+    """
+    content = {key: level_data[key] for key in ("grid", "row_clues", "col_clues")}
+    encoded = json.dumps(content, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def difficulty_for_score(score):
+    """
+    Obtiene la dificultad que corresponde a un puntaje.
+
+    Args:
+        score (float): Puntaje de dificultad del nivel.
+
+    Returns:
+        str: Dificultad ("easy", "medium" o "hard").
+    """
+    for limit, difficulty in DIFFICULTY_THRESHOLDS:
+        if score < limit:
+            return difficulty
+    return "hard"
+
+
+def compute_level_metadata(level_data):
+    """
+    Calcula los metadatos de un nivel.
+
+    El puntaje de dificultad es la cantidad de celdas multiplicada por la cantidad promedio
+    de números por pista: los tableros grandes con pistas fragmentadas son los más difíciles.
+
+    Args:
+        level_data (dict): Diccionario con las claves grid, row_clues y col_clues.
+
+    Returns:
+        dict: Diccionario con rows, cols, density, row_clue_count, col_clue_count, score, difficulty y hash.
+    """
+    grid = level_data["grid"]
+    rows = len(grid)
+    cols = len(grid[0]) if rows else 0
+    cells = rows * cols
+    filled = sum(row.count(1) for row in grid)
+    row_clue_count = sum(len([number for number in clue if number]) for clue in level_data["row_clues"])
+    col_clue_count = sum(len([number for number in clue if number]) for clue in level_data["col_clues"])
+    score = cells * (row_clue_count + col_clue_count) / max(rows + cols, 1)
+    return {
+        "rows": rows,
+        "cols": cols,
+        "density": round(filled / cells, 4) if cells else 0.0,
+        "row_clue_count": row_clue_count,
+        "col_clue_count": col_clue_count,
+        "score": round(score, 2),
+        "difficulty": difficulty_for_score(score),
+        "hash": level_hash(level_data),
+    }
+
+
+def build_level_index(levels, output_path):
+    """
+    Escribe el índice de metadatos de los niveles.
+
+    Args:
+        levels (dict): Datos de cada nivel, por clave, en el orden en que deben aparecer.
+        output_path (str): Ruta del archivo a generar.
+
+    Returns:
+        dict: Metadatos de cada nivel, por clave.
+    """
+    index = {key: compute_level_metadata(level_data) for key, level_data in levels.items()}
+    temp_path = output_path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(index, f, indent=2)
+    os.replace(temp_path, output_path)
+    return index
+
+
+def load_level_index(path):
+    """
+    Lee el índice de metadatos de los niveles.
+
+    Args:
+        path (str): Ruta al índice.
+
+    Returns:
+        dict: Metadatos de cada nivel, por clave, en el orden del índice.
+    """
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def main():
+    """
+    Genera el índice de metadatos a partir de los niveles JSON de una carpeta.
+    """
+    parser = argparse.ArgumentParser(description="Genera el índice de metadatos de los niveles.")
+    parser.add_argument("--levels-dir", default=os.path.join("data", "levels"), help="Carpeta con los niveles JSON.")
+    parser.add_argument("--output", default=None, help="Archivo a generar. Por defecto es levels_index.json dentro de la carpeta de niveles.")
+    args = parser.parse_args()
+
+    output = args.output or os.path.join(args.levels_dir, "levels_index.json")
+    index = build_level_index(load_json_levels(args.levels_dir), output)
+    counts = {}
+    for metadata in index.values():
+        counts[metadata["difficulty"]] = counts.get(metadata["difficulty"], 0) + 1
+    print(f"Se indexaron {len(index)} niveles en {output}: {counts}")
+
+
+if __name__ == "__main__":
+    main()
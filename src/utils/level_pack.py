@@ -0,0 +1,274 @@
+import argparse
+import json
+import mmap
+import os
+import struct
+
+import numpy as np
+
+# Formato del paquete de niveles compilado:
+#   cabecera: magic (4 bytes), versión (uint16), reservado (uint16), cantidad de niveles (uint32), posición del índice (uint32)
+#   registros: filas y columnas en varint, solución con 1 bit por celda y luego cada pista de fila y columna
+#              como cantidad de números seguida de los números, todo en varint
+#   índice: por nivel, largo de la clave (uint8), clave en UTF-8, posición (uint32) y largo (uint32) del registro
+PACK_MAGIC = b"AGLP"
+PACK_VERSION = 1
+HEADER_FORMAT = "<4sHHII"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+INDEX_ENTRY_FORMAT = "<II"
+INDEX_ENTRY_SIZE = struct.calcsize(INDEX_ENTRY_FORMAT)
+
+
+def encode_varint(value, out):
+    """
+    Agrega un entero no negativo codificado como varint (LEB128) a un bytearray.
+
+    Args:
+        value (int): Valor a codificar.
+        out (bytearray): Destino.
+    """
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(buffer, position):
+    """
+    Lee un varint desde un buffer.
+
+    Args:
+        buffer (bytes | mmap.mmap): Datos a leer.
+        position (int): Posición donde empieza el varint.
+
+    Returns:
+        tuple: Una tupla (valor, posición siguiente).
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = buffer[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def encode_level(level_data):
+    """
+    Codifica los datos de un nivel en el formato binario del paquete.
+
+    Args:
+        level_data (dict): Diccionario con las claves grid, row_clues y col_clues.
+
+    Returns:
+        bytes: El registro del nivel.
+    """
+    grid = np.asarray(level_data["grid"], dtype=np.uint8)
+    rows, cols = grid.shape
+    out = bytearray()
+    encode_varint(rows, out)
+    encode_varint(cols, out)
+    out += np.packbits(grid.ravel() == 1).tobytes()
+    for clue in list(level_data["row_clues"]) + list(level_data["col_clues"]):
+        encode_varint(len(clue), out)
+        for number in clue:
+            encode_varint(number, out)
+    return bytes(out)
+
+
+def decode_level(buffer, position):
+    """
+    Decodifica un registro de nivel.
+
+    Args:
+        buffer (bytes | mmap.mmap): Datos del paquete.
+        position (int): Posición del registro.
+
+    Returns:
+        dict: Diccionario con las claves grid, row_clues y col_clues, igual que un archivo de nivel.
+    """
+    rows, position = decode_varint(buffer, position)
+    cols, position = decode_varint(buffer, position)
+    grid_bytes = (rows * cols + 7) // 8
+    bits = np.unpackbits(np.frombuffer(buffer[position:position + grid_bytes], dtype=np.uint8))
+    grid = bits[:rows * cols].reshape(rows, cols).tolist()
+    position += grid_bytes
+
+    clues = []
+    for _ in range(rows + cols):
+        count, position = decode_varint(buffer, position)
+        clue = []
+        for _ in range(count):
+            number, position = decode_varint(buffer, position)
+            clue.append(number)
+        clues.append(clue)
+    return {"grid": grid, "row_clues": clues[:rows], "col_clues": clues[rows:]}
+
+
+def build_level_pack(levels, output_path):
+    """
+    Escribe un paquete de niveles compilado.
+
+    Args:
+        levels (dict): Datos de cada nivel, por clave, en el orden en que deben aparecer.
+        output_path (str): Ruta del archivo a generar.
+
+    Returns:
+        int: Tamaño del archivo generado en bytes.
+    """
+    body = bytearray()
+    index = bytearray()
+    for key, level_data in levels.items():
+        record = encode_level(level_data)
+        encoded_key = key.encode("utf-8")
+        index.append(len(encoded_key))
+        index += encoded_key
+        index += struct.pack(INDEX_ENTRY_FORMAT, HEADER_SIZE + len(body), len(record))
+        body += record
+
+    header = struct.pack(HEADER_FORMAT, PACK_MAGIC, PACK_VERSION, 0, len(levels), HEADER_SIZE + len(body))
+    temp_path = output_path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(header)
+        f.write(body)
+        f.write(index)
+    os.replace(temp_path, output_path)
+    return len(header) + len(body) + len(index)
+
+
+def load_json_levels(levels_dir):
+    """
+    Lee los niveles fuente en JSON, en el orden de nonogram_levels.json.
+
+    Args:
+        levels_dir (str): Carpeta con nonogram_levels.json y los archivos levelN.json.
+
+    Returns:
+        dict: Datos de cada nivel, por clave.
+    """
+    with open(os.path.join(levels_dir, "nonogram_levels.json"), "r") as f:
+        keys = list(json.load(f).keys())
+    levels = {}
+    for key in keys:
+        with open(os.path.join(levels_dir, f"{key}.json"), "r") as f:
+            levels[key] = json.load(f)
+    return levels
+
+
+class LevelPack:
+    """
+    Clase que lee un paquete de niveles compilado mediante mmap.
+
+    Al abrirlo solo se leen la cabecera y el índice; cada nivel se decodifica cuando se pide,
+    sin leer el resto del archivo.
+
+    Atributos:
+        path (str): Ruta al paquete.
+        index (dict): Posición y largo de cada registro, por clave, en el orden del paquete.
+    """
+
+    def __init__(self, path):
+        """
+        Abre un paquete de niveles.
+
+        Args:
+            path (str): Ruta al paquete.
+
+        Raises:
+            ValueError: Si el archivo no es un paquete de niveles, su versión no es compatible o está truncado o dañado.
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap no acepta archivos vacíos
+            self._file.close()
+            raise ValueError(f"{path} no es un paquete de niveles compatible")
+
+        # Un paquete truncado o dañado se rechaza igual que uno incompatible
+        try:
+            magic, version, _, count, index_offset = struct.unpack_from(HEADER_FORMAT, self._buffer, 0)
+            if magic != PACK_MAGIC or version != PACK_VERSION:
+                raise ValueError(f"{path} no es un paquete de niveles compatible")
+            size = len(self._buffer)
+            # Cada entrada del índice ocupa al menos el largo de la clave y la posición y el largo del registro
+            if index_offset < HEADER_SIZE or index_offset + count * (1 + INDEX_ENTRY_SIZE) > size:
+                raise ValueError(f"{path} tiene un índice fuera del archivo")
+
+            self.index = {}
+            position = index_offset
+            for _ in range(count):
+                key_length = self._buffer[position]
+                position += 1
+                key = self._buffer[position:position + key_length].decode("utf-8")
+                position += key_length
+                offset, length = struct.unpack_from(INDEX_ENTRY_FORMAT, self._buffer, position)
+                if offset < HEADER_SIZE or offset + length > index_offset:
+                    raise ValueError(f"{path} tiene un registro fuera del archivo")
+                self.index[key] = (offset, length)
+                position += INDEX_ENTRY_SIZE
+        except (struct.error, IndexError, UnicodeDecodeError) as e:
+            self.close()
+            raise ValueError(f"{path} está dañado: {e}")
+        except ValueError:
+            self.close()
+            raise
+
+    def keys(self):
+        """
+        Obtiene las claves de los niveles en el orden del paquete.
+
+        Returns:
+            list: Claves de los niveles.
+        """
+        return list(self.index.keys())
+
+    def load(self, key):
+        """
+        Decodifica un nivel.
+
+        Args:
+            key (str): Clave del nivel.
+
+        Returns:
+            dict: Datos del nivel, o None si la clave no está en el paquete.
+        """
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        return decode_level(self._buffer, entry[0])
+
+    def close(self):
+        """
+        Cierra el paquete y libera el mapeo del archivo.
+        """
+        self._buffer.close()
+        self._file.close()
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+
+def main():
+    """
+    Compila los niveles JSON de una carpeta en un paquete de niveles.
+    """
+    parser = argparse.ArgumentParser(description="Compila los niveles JSON en un paquete binario.")
+    parser.add_argument("--levels-dir", default=os.path.join("data", "levels"), help="Carpeta con los niveles JSON.")
+    parser.add_argument("--output", default=None, help="Archivo a generar. Por defecto es levels.pack dentro de la carpeta de niveles.")
+    args = parser.parse_args()
+
+    output = args.output or os.path.join(args.levels_dir, "levels.pack")
+    levels = load_json_levels(args.levels_dir)
+    size = build_level_pack(levels, output)
+    print(f"Se compilaron {len(levels)} niveles en {output} ({size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import pygame
+
+from src.config import IDLE_RENDERING, IDLE_MAX_WAIT_MS, IDLE_POLL_MS
+
+
+class RenderScheduler:
+    """
+    Clase que decide cuánto puede esperar el bucle principal antes del próximo fotograma.
+
+    Cada pantalla indica con get_refresh_interval cada cuántos milisegundos necesita actualizarse
+    aunque no lleguen eventos (por ejemplo, el temporizador del juego), o None si solo cambia con
+    la entrada del jugador. Mientras no haya nada pendiente, el bucle duerme hasta que llega un
+    evento o vence ese intervalo, así que no actualiza ni dibuja nada cuando el juego está quieto.
+
+    La espera no usa pygame.event.wait(timeout): pygame la implementa revisando los eventos cada
+    milisegundo. En su lugar se duerme de a IDLE_POLL_MS, que no supera la duración de un fotograma,
+    así que un evento no tarda en atenderse más que con el bucle a FPS fijos.
+
+    Atributos:
+        enabled (bool): Indica si se espera a los eventos; con False cada fotograma lee los eventos sin esperar.
+        max_wait (int): Espera máxima sin eventos, en milisegundos.
+        poll_interval (int): Milisegundos entre dos revisiones de los eventos durante la espera.
+        idle_frames (int): Fotogramas que empezaron porque venció la espera, sin eventos.
+    """
+
+    def __init__(self, enabled=IDLE_RENDERING, max_wait=IDLE_MAX_WAIT_MS, poll_interval=IDLE_POLL_MS):
+        """
+        Inicializa una instancia de la clase RenderScheduler.
+
+        Args:
+            enabled (bool, optional): Indica si se espera a los eventos. Por defecto es config.IDLE_RENDERING.
+            max_wait (int, optional): Espera máxima sin eventos, en milisegundos. Por defecto es config.IDLE_MAX_WAIT_MS.
+            poll_interval (int, optional): Milisegundos entre revisiones de los eventos. Por defecto es config.IDLE_POLL_MS.
+        """
+        self.enabled = enabled
+        self.max_wait = max_wait
+        self.poll_interval = poll_interval
+        self.idle_frames = 0
+
+    def get_timeout(self, game, current_screen, last_screen):
+        """
+        Calcula cuánto se puede esperar a un evento antes del próximo fotograma.
+
+        No se espera si la pantalla cambió, si el juego pidió un dibujado completo o si la
+        superposición del perfilador está visible, porque muestra tiempos de cada fotograma.
+
+        Args:
+            game (Game): Instancia del juego.
+            current_screen: Pantalla que se va a dibujar.
+            last_screen: Pantalla dibujada en el fotograma anterior, o None.
+
+        Returns:
+            int: Milisegundos de espera; 0 para no esperar.
+        """
+        if (not self.enabled or current_screen is not last_screen or game.needs_full_redraw
+                or game.profiler.overlay_visible):
+            return 0
+        interval = current_screen.get_refresh_interval()
+        if interval is None:
+            return self.max_wait
+        return max(0, min(interval, self.max_wait))
+
+    def get_events(self, timeout):
+        """
+        Obtiene los eventos pendientes, esperando hasta timeout milisegundos a que llegue el primero.
+
+        Args:
+            timeout (int): Milisegundos de espera; con 0 no se espera.
+
+        Returns:
+            list: Eventos recibidos, o una lista vacía si venció la espera.
+        """
+        events = pygame.event.get()
+        if timeout <= 0 or events:
+            return events
+        deadline = pygame.time.get_ticks() + timeout
+        while True:
+            remaining = deadline - pygame.time.get_ticks()
+            if remaining <= 0:
+                self.idle_frames += 1
+                return []
+            pygame.time.wait(min(self.poll_interval, remaining))
+            events = pygame.event.get()
+            if events:
+                return events
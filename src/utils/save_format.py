@@ -0,0 +1,216 @@
+import os
+import struct
+import zlib
+
+import numpy as np
+
+from src.logic.UndoLog import CHANGE_DTYPE
+
+# Valor máximo de una celda: 0 vacía, 1 llena y 2 marcada con X
+MAX_CELL_VALUE = 2
+
+# Formato de las partidas guardadas:
+#   cabecera sin comprimir: magic (4 bytes), versión (uint16), filas (uint16), columnas (uint16)
+#   cuerpo comprimido con zlib: tiempo (float64), celdas con 2 bits cada una (4 por byte, fila por fila),
+#   historial: cantidad de trazos (uint32), trazos aplicados (uint32), cambios de cada trazo (uint32 por trazo)
+#   y los cambios de todos los trazos en el formato CHANGE_DTYPE de UndoLog.
+SAVE_MAGIC = b"AGSV"
+# La versión 2 guarda el historial agrupado en trazos
+SAVE_VERSION = 2
+HEADER_FORMAT = "<4sHHH"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+SAVE_EXTENSION = ".sav"
+
+
+def pack_cells(player_grid):
+    """
+    Empaqueta las celdas del jugador con 2 bits por celda.
+
+    Args:
+        player_grid (list): Cuadrícula del jugador con valores 0, 1 o 2.
+
+    Returns:
+        bytes: Las celdas empaquetadas, 4 por byte.
+    """
+    cells = np.asarray(player_grid, dtype=np.uint8).ravel()
+    padded = np.zeros(-(-cells.size // 4) * 4, dtype=np.uint8)
+    padded[:cells.size] = cells
+    quads = padded.reshape(-1, 4)
+    return (quads[:, 0] | (quads[:, 1] << 2) | (quads[:, 2] << 4) | (quads[:, 3] << 6)).tobytes()
+
+
+def unpack_cells(data, rows, cols):
+    """
+    Desempaqueta celdas guardadas con pack_cells.
+
+    Args:
+        data (bytes): Celdas empaquetadas.
+        rows (int): Cantidad de filas.
+        cols (int): Cantidad de columnas.
+
+    Returns:
+        list: La cuadrícula del jugador como lista de listas.
+    """
+    packed = np.frombuffer(data, dtype=np.uint8)
+    cells = np.stack([(packed >> shift) & 3 for shift in (0, 2, 4, 6)], axis=1).ravel()
+    return cells[:rows * cols].reshape(rows, cols).tolist()
+
+
+def pack_undo_state(state):
+    """
+    Empaqueta el historial obtenido con UndoLog.get_state.
+
+    Args:
+        state (dict): Diccionario con changes, stroke_lengths y cursor.
+
+    Returns:
+        bytes: El historial empaquetado.
+    """
+    lengths = np.asarray(state["stroke_lengths"], dtype="<u4")
+    changes = np.asarray(state["changes"], dtype=CHANGE_DTYPE)
+    return struct.pack("<II", len(lengths), state["cursor"]) + lengths.tobytes() + changes.tobytes()
+
+
+def unpack_undo_state(data, position):
+    """
+    Desempaqueta un historial guardado con pack_undo_state.
+
+    Args:
+        data (bytes): Cuerpo de la partida.
+        position (int): Posición donde empieza el historial.
+
+    Returns:
+        dict: Diccionario con changes, stroke_lengths y cursor, para UndoLog.set_state.
+    """
+    count, cursor = struct.unpack_from("<II", data, position)
+    position += 8
+    lengths = np.frombuffer(data, dtype="<u4", count=count, offset=position)
+    position += lengths.nbytes
+    changes = np.frombuffer(data, dtype=CHANGE_DTYPE, count=int(lengths.sum()), offset=position)
+    return {"changes": changes.copy(), "stroke_lengths": lengths.tolist(), "cursor": cursor}
+
+
+def encode_save(player_grid, timer, undo_state):
+    """
+    Codifica una partida en el formato binario.
+
+    Args:
+        player_grid (list): Cuadrícula del jugador.
+        timer (float): Tiempo del temporizador en segundos.
+        undo_state (dict): Historial obtenido con UndoLog.get_state.
+
+    Returns:
+        bytes: La partida codificada.
+    """
+    rows = len(player_grid)
+    cols = len(player_grid[0]) if rows else 0
+    body = struct.pack("<d", timer) + pack_cells(player_grid) + pack_undo_state(undo_state)
+    return struct.pack(HEADER_FORMAT, SAVE_MAGIC, SAVE_VERSION, rows, cols) + zlib.compress(body, 9)
+
+
+def decode_save(data):
+    """
+    Decodifica una partida guardada con encode_save.
+
+    Args:
+        data (bytes): La partida codificada.
+
+    Returns:
+        dict: Diccionario con player_grid, timer y undo_state.
+
+    Raises:
+        ValueError: Si los datos no son una partida, su versión no es compatible o su contenido es inconsistente.
+    """
+    if len(data) < HEADER_SIZE:
+        raise ValueError("La partida guardada está incompleta")
+    magic, version, rows, cols = struct.unpack_from(HEADER_FORMAT, data, 0)
+    if magic != SAVE_MAGIC or version != SAVE_VERSION:
+        raise ValueError("El archivo no es una partida guardada compatible")
+    try:
+        body = zlib.decompress(data[HEADER_SIZE:])
+    except zlib.error as e:
+        raise ValueError(f"La partida guardada está dañada: {str(e)}")
+
+    # Un cuerpo truncado hace fallar struct o NumPy; se informa igual que cualquier partida dañada
+    try:
+        timer, = struct.unpack_from("<d", body, 0)
+        position = 8
+        cells_size = -(-rows * cols // 4)
+        player_grid = unpack_cells(body[position:position + cells_size], rows, cols)
+        undo_state = unpack_undo_state(body, position + cells_size)
+    except (struct.error, ValueError) as e:
+        raise ValueError(f"La partida guardada está incompleta: {str(e)}")
+
+    # Un contenido inconsistente cargaría bien pero fallaría después, al deshacer o rehacer
+    if rows * cols and np.max(player_grid) > MAX_CELL_VALUE:
+        raise ValueError("La partida guardada tiene celdas con valores inválidos")
+    if undo_state["cursor"] > len(undo_state["stroke_lengths"]):
+        raise ValueError("La partida guardada tiene un historial inválido")
+    changes = undo_state["changes"]
+    if len(changes) and (changes["row"].max() >= rows or changes["col"].max() >= cols
+                         or max(changes["previous"].max(), changes["value"].max()) > MAX_CELL_VALUE):
+        raise ValueError("La partida guardada tiene cambios fuera del tablero")
+    return {"player_grid": player_grid, "timer": timer, "undo_state": undo_state}
+
+
+def get_save_path(save_dir, level_key, slot):
+    """
+    Obtiene la ruta del archivo de una ranura de guardado.
+
+    Args:
+        save_dir (str): Carpeta de las partidas guardadas.
+        level_key (str): Clave del nivel.
+        slot (str): Nombre de la ranura.
+
+    Returns:
+        str: Ruta del archivo.
+    """
+    return os.path.join(save_dir, level_key, f"{slot}{SAVE_EXTENSION}")
+
+
+def write_save(path, data):
+    """
+    Escribe una partida de forma atómica: primero en un archivo temporal y luego se renombra.
+
+    Args:
+        path (str): Ruta del archivo.
+        data (bytes): La partida codificada.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def read_save(path):
+    """
+    Lee y decodifica una partida.
+
+    Args:
+        path (str): Ruta del archivo.
+
+    Returns:
+        dict: Diccionario con player_grid, timer y undo_state.
+    """
+    with open(path, "rb") as f:
+        return decode_save(f.read())
+
+
+def list_slots(save_dir, level_key):
+    """
+    Obtiene los nombres de las ranuras guardadas de un nivel.
+
+    Args:
+        save_dir (str): Carpeta de las partidas guardadas.
+        level_key (str): Clave del nivel.
+
+    Returns:
+        list: Nombres de las ranuras, ordenados.
+    """
+    level_dir = os.path.join(save_dir, level_key)
+    if not os.path.isdir(level_dir):
+        return []
+    return sorted(name[:-len(SAVE_EXTENSION)] for name in os.listdir(level_dir) if name.endswith(SAVE_EXTENSION))